@@ -1,15 +1,24 @@
 """FastAPI routes for ARRS web interface."""
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, HttpUrl
-from typing import Optional
 import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, HttpUrl, ValidationError
+from typing import Any, Dict, List, Optional
 
+from arrs.models.analysis import AnalysisStatus
 from arrs.storage.database import Database
 from arrs.storage.json_store import JSONStore
 from arrs.storage.repository import Repository
+from arrs.core.exceptions import JobException
+from arrs.core.batches import BatchManager
+from arrs.core.events import TERMINAL_EVENTS, format_sse, get_event_bus
+from arrs.core.jobs import AnalysisJob, SQLiteJobQueue, build_job_queue
+from arrs.core.worker import make_job_runner
 from arrs.core.orchestrator import AnalysisOrchestrator
+from arrs.crawlers.browser_pool import browser_pool_health
 from arrs.reporting.report_generator import ReportGenerator
+from arrs.utils.metrics import get_metrics
 from config import settings
 
 router = APIRouter()
@@ -20,6 +29,12 @@ db = Database(db_path)
 json_store = JSONStore(settings.json_storage_path)
 repository = Repository(db, json_store)
 
+# Runs jobs in the API process unless settings.api_run_workers is off
+job_queue = build_job_queue(make_job_runner(repository), db)
+
+# Batches need jobs that outlive the request, i.e. the durable queue
+batch_manager = BatchManager(db, job_queue) if isinstance(job_queue, SQLiteJobQueue) else None
+
 
 class AnalyzeRequest(BaseModel):
     """Request model for analysis."""
@@ -27,6 +42,18 @@ class AnalyzeRequest(BaseModel):
     brand: Optional[str] = None
     category: Optional[str] = None
     use_case: Optional[str] = None
+    force_refresh: bool = False  # Bypass the crawl cache
+    fresh_simulation: bool = False  # Bypass the LLM response cache
+
+
+class BatchRequest(BaseModel):
+    """Request model for a batch of analyses."""
+    urls: List[str]
+    brand: Optional[str] = None
+    category: Optional[str] = None
+    use_case: Optional[str] = None
+    force_refresh: bool = False
+    fresh_simulation: bool = False
 
 
 class AnalyzeResponse(BaseModel):
@@ -36,51 +63,251 @@ class AnalyzeResponse(BaseModel):
     message: str
 
 
-@router.post("/analyze", response_model=AnalyzeResponse)
-async def analyze_url(request: AnalyzeRequest, background_tasks: BackgroundTasks):
+@router.post("/analyze", response_model=AnalyzeResponse, status_code=202)
+async def analyze_url(request: AnalyzeRequest):
     """
-    Analyze a URL and return analysis ID.
+    Queue a URL for analysis and return its analysis ID.
 
     The analysis runs in the background. Use /analysis/{id} to check status.
     """
-    orchestrator = AnalysisOrchestrator(repository)
-
     # Convert HttpUrl to string
     url_str = str(request.url)
 
+    analysis = await repository.create_analysis(url_str)
     try:
-        # Run analysis in background
-        analysis_id = await orchestrator.analyze_url(
-            url_str,
+        await job_queue.submit(AnalysisJob(
+            analysis_id=analysis.id,
+            url=url_str,
             brand=request.brand,
             product_category=request.category,
-            use_case=request.use_case
-        )
+            use_case=request.use_case,
+            force_refresh=request.force_refresh,
+            fresh_simulation=request.fresh_simulation
+        ))
+    except JobException as e:
+        await repository.update_analysis_status(analysis.id, AnalysisStatus.FAILED, error_message=str(e))
+        raise HTTPException(status_code=503, detail=str(e))
 
-        return AnalyzeResponse(
-            analysis_id=analysis_id,
-            status="completed",
-            message=f"Analysis completed successfully"
-        )
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return AnalyzeResponse(
+        analysis_id=analysis.id,
+        status=AnalysisStatus.PENDING.value,
+        message="Analysis queued"
+    )
 
 
 @router.get("/analysis/{analysis_id}")
 async def get_analysis(analysis_id: str):
-    """Get analysis results by ID."""
+    """Get analysis results, or progress while the analysis is queued or running."""
     try:
         orchestrator = AnalysisOrchestrator(repository)
         summary = await orchestrator.get_analysis_summary(analysis_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        if not summary:
-            raise HTTPException(status_code=404, detail="Analysis not found")
+    if not summary:
+        raise HTTPException(status_code=404, detail="Analysis not found")
 
-        return JSONResponse(content=summary)
+    progress = await job_queue.progress(analysis_id)
+    if progress is not None:
+        if progress["stage"] != "queued":
+            summary["status"] = AnalysisStatus.PROCESSING.value
+        summary["progress"] = progress
+
+    return JSONResponse(content=summary)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/analysis/{analysis_id}/events")
+async def stream_analysis_events(analysis_id: str, request: Request):
+    """
+    Stream progress of an analysis as Server-Sent Events.
+
+    Events (stage, crawled, parsed, engine_score, simulation, completed,
+    failed, ...) are pushed by the orchestrator as they happen. Analyses run
+    by worker processes other than this server publish nowhere this process
+    can see, so while no events arrive the stored job progress is checked
+    instead. The stream ends after the completed or failed event.
+    """
+    if await repository.get_analysis(analysis_id) is None:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+
+    last_event_id = request.headers.get("last-event-id", "")
+    last_event_id = int(last_event_id) if last_event_id.isdigit() else 0
+
+    async def events():
+        async with get_event_bus().subscribe(analysis_id, last_event_id) as queue:
+            # Nothing to replay: start from the stored state (it may be finished already)
+            stored = await _stored_event(analysis_id)
+            if queue.empty():
+                yield format_sse(stored)
+                if stored["type"] in TERMINAL_EVENTS:
+                    return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.events_poll_interval)
+                except asyncio.TimeoutError:
+                    previous, stored = stored, await _stored_event(analysis_id)
+                    if stored == previous:
+                        yield ": keepalive\n\n"
+                        continue
+                    event = stored
+
+                yield format_sse(event)
+                if event["type"] in TERMINAL_EVENTS:
+                    return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _stored_event(analysis_id: str) -> Dict[str, Any]:
+    """Event for the stored state of an analysis: its outcome, or job progress."""
+    analysis = await repository.get_analysis(analysis_id)
+    if analysis is not None and analysis.status in (AnalysisStatus.COMPLETED, AnalysisStatus.FAILED):
+        data = {"status": analysis.status.value}
+        if analysis.status == AnalysisStatus.COMPLETED:
+            data["composite_score"] = analysis.composite_score
+        else:
+            data["error"] = analysis.error_message
+        return {"type": analysis.status.value, "analysis_id": analysis_id, "data": data}
+
+    progress = await job_queue.progress(analysis_id) or {"stage": "queued", "percent": 0}
+    return {"type": "stage", "analysis_id": analysis_id, "data": progress}
+
+
+def get_batch_manager() -> BatchManager:
+    """Batch manager, or 501 when the job backend cannot run batches."""
+    if batch_manager is None:
+        raise HTTPException(status_code=501, detail="Batches require JOB_BACKEND=sqlite")
+    return batch_manager
+
+
+async def read_batch_request(request: Request) -> BatchRequest:
+    """
+    Parse a batch from the request body.
+
+    Accepts a JSON object ({"urls": [...], "brand": ...}), a JSON array of
+    URLs, or a text/CSV file with one URL per line; for arrays and files the
+    shared brand, category, use case, force_refresh and fresh_simulation
+    come from query parameters.
+    """
+    content_type = request.headers.get("content-type", "")
+    body = await request.body()
+    params = request.query_params
+
+    try:
+        if content_type.startswith("application/json"):
+            data = json.loads(body)
+            if isinstance(data, list):
+                data = {"urls": data}
+        else:
+            lines = body.decode("utf-8-sig").splitlines()
+            # First CSV column; a "url" header row is skipped
+            urls = [line.split(",")[0].strip().strip('"') for line in lines]
+            data = {"urls": [url for url in urls if url and url.lower() != "url"]}
+
+        for field in ("brand", "category", "use_case", "force_refresh", "fresh_simulation"):
+            if field in params and field not in data:
+                data[field] = params[field]
+        return BatchRequest(**data)
+    except (ValueError, TypeError, ValidationError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid batch: {e}")
+
+
+@router.post("/batch", status_code=202)
+async def create_batch(request: Request):
+    """
+    Queue an analysis for each URL of a batch.
+
+    Use /batch/{id} for progress and /batch/{id}/results to stream results.
+    """
+    manager = get_batch_manager()
+    batch_request = await read_batch_request(request)
+
+    try:
+        batch = await manager.create(
+            batch_request.urls,
+            brand=batch_request.brand,
+            product_category=batch_request.category,
+            use_case=batch_request.use_case,
+            force_refresh=batch_request.force_refresh,
+            fresh_simulation=batch_request.fresh_simulation
+        )
+    except JobException as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return JSONResponse(content=batch, status_code=202)
+
+
+@router.get("/batch/{batch_id}")
+async def get_batch(batch_id: str):
+    """Get batch status and job counts."""
+    batch = await get_batch_manager().get(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return JSONResponse(content=batch)
+
+
+@router.get("/batch/{batch_id}/results")
+async def stream_batch_results(
+    batch_id: str,
+    after: int = 0,
+    limit: Optional[int] = None,
+    follow: bool = True
+):
+    """
+    Stream finished analyses of a batch as NDJSON, one summary per line.
+
+    Lines arrive in completion order while the batch runs. Each carries a
+    cursor; pass the last one as ?after= to resume. With follow=false only
+    what has finished so far is returned.
+    """
+    manager = get_batch_manager()
+    if await manager.get(batch_id) is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    orchestrator = AnalysisOrchestrator(repository)
+
+    async def lines():
+        async for finished in manager.iter_finished(batch_id, after=after, limit=limit, follow=follow):
+            summary = await orchestrator.get_analysis_summary(finished["analysis_id"])
+            if summary is not None:
+                yield json.dumps({"cursor": finished["cursor"], **summary}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/batch/{batch_id}/pause")
+async def pause_batch(batch_id: str):
+    """Stop starting new analyses of a batch; running ones finish."""
+    return await _change_batch(batch_id, "pause")
+
+
+@router.post("/batch/{batch_id}/resume")
+async def resume_batch(batch_id: str):
+    """Continue a paused batch."""
+    return await _change_batch(batch_id, "resume")
+
+
+@router.post("/batch/{batch_id}/cancel")
+async def cancel_batch(batch_id: str):
+    """Cancel the analyses of a batch that have not started."""
+    return await _change_batch(batch_id, "cancel")
+
+
+async def _change_batch(batch_id: str, action: str):
+    """Apply a batch state change, mapping errors to HTTP status codes."""
+    manager = get_batch_manager()
+    if await manager.get(batch_id) is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    try:
+        batch = await getattr(manager, action)(batch_id)
+    except JobException as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return JSONResponse(content=batch)
 
 
 @router.get("/report/{analysis_id}")
@@ -101,9 +328,23 @@ async def get_report(analysis_id: str):
 
 @router.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint (also replaces disconnected pooled browsers)."""
+    try:
+        browser_pool = await browser_pool_health()
+    except Exception as e:
+        # Relaunching a browser failed; the API itself is still up
+        browser_pool = {"error": str(e)}
+
     return {
         "status": "healthy",
         "llm_provider": settings.llm_provider,
-        "engines": ["ADE", "ARCE", "TRE"]
+        "engines": ["ADE", "ARCE", "TRE"],
+        "jobs": await job_queue.stats(),
+        "browser_pool": browser_pool
     }
+
+
+@router.get("/metrics")
+async def metrics():
+    """Crawl metrics of this server process (hedged crawls, crawl latency percentiles)."""
+    return get_metrics().snapshot()
@@ -0,0 +1,291 @@
+"""Bulk analyses: many URLs fanned out through the durable job queue."""
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+from arrs.core.exceptions import JobException
+from arrs.core.jobs import (
+    AnalysisJob,
+    JOB_CANCELLED,
+    JOB_PAUSED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_STATUSES,
+    SQLiteJobQueue
+)
+from arrs.models.analysis import Analysis, AnalysisStatus
+from arrs.storage.database import Database
+from arrs.storage.unit_of_work import UPSERT_ANALYSIS_SQL, analysis_row
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+BATCH_RUNNING = "running"
+BATCH_PAUSED = "paused"
+BATCH_CANCELLED = "cancelled"
+BATCH_COMPLETED = "completed"  # derived: running with no unfinished jobs
+
+# Finished jobs fetched per results query
+RESULTS_PAGE_SIZE = 100
+
+INSERT_BATCH_SQL = """INSERT INTO batches
+   (id, status, total, brand, product_category, use_case, created_at, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+SET_BATCH_STATUS_SQL = "UPDATE batches SET status = ?, updated_at = ? WHERE id = ? AND status = ?"
+
+SET_JOBS_STATUS_SQL = "UPDATE jobs SET status = ?, updated_at = ? WHERE batch_id = ? AND status = ?"
+
+CANCEL_ANALYSES_SQL = """UPDATE analyses SET status = ?, error_message = ?
+   WHERE id IN (SELECT analysis_id FROM jobs WHERE batch_id = ? AND status IN (?, ?))"""
+
+CANCEL_JOBS_SQL = """UPDATE jobs SET status = ?, updated_at = ?
+   WHERE batch_id = ? AND status IN (?, ?)"""
+
+SELECT_FINISHED_SQL = """SELECT analysis_id, finished_seq FROM jobs
+   WHERE batch_id = ? AND finished_seq > ?
+   ORDER BY finished_seq
+   LIMIT ?"""
+
+
+def validate_batch_urls(urls: List[str]) -> List[str]:
+    """
+    Check and deduplicate the URLs of a batch, keeping their order.
+
+    Args:
+        urls: Submitted URLs
+
+    Returns:
+        Unique http(s) URLs
+
+    Raises:
+        JobException: If the batch is empty, too large or has invalid URLs
+    """
+    unique = list(dict.fromkeys(url.strip() for url in urls if url and url.strip()))
+    if not unique:
+        raise JobException("Batch contains no URLs")
+    if len(unique) > settings.batch_max_urls:
+        raise JobException(f"Batch has {len(unique)} URLs; the limit is {settings.batch_max_urls}")
+
+    invalid = [
+        url for url in unique
+        if urlparse(url).scheme not in ("http", "https") or not urlparse(url).netloc
+    ]
+    if invalid:
+        raise JobException(f"{len(invalid)} invalid URLs, e.g. {', '.join(invalid[:5])}")
+
+    return unique
+
+
+class BatchManager:
+    """Creates batches and controls and reports on their jobs."""
+
+    def __init__(self, database: Database, job_queue: SQLiteJobQueue):
+        """
+        Initialize batch manager.
+
+        Args:
+            database: Database holding the batches and jobs tables
+            job_queue: Durable queue the batch jobs are submitted to
+        """
+        self.db = database
+        self.job_queue = job_queue
+
+    async def create(
+        self,
+        urls: List[str],
+        brand: Optional[str] = None,
+        product_category: Optional[str] = None,
+        use_case: Optional[str] = None,
+        force_refresh: bool = False,
+        fresh_simulation: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Queue an analysis for every URL in one transaction.
+
+        Args:
+            urls: URLs to analyze
+            brand: Brand name shared by all analyses
+            product_category: Product category shared by all analyses
+            use_case: Use case shared by all analyses
+            force_refresh: Bypass the crawl cache
+            fresh_simulation: Bypass the LLM response cache
+
+        Returns:
+            Batch status
+
+        Raises:
+            JobException: If the URLs are invalid
+        """
+        urls = validate_batch_urls(urls)
+        batch_id = str(uuid.uuid4())
+        now = time.time()
+        created_at = datetime.now()
+
+        analyses = [
+            Analysis(id=str(uuid.uuid4()), url=url, created_at=created_at, status=AnalysisStatus.PENDING)
+            for url in urls
+        ]
+        jobs = [
+            AnalysisJob(
+                analysis_id=analysis.id,
+                url=analysis.url,
+                brand=brand,
+                product_category=product_category,
+                use_case=use_case,
+                force_refresh=force_refresh,
+                fresh_simulation=fresh_simulation
+            )
+            for analysis in analyses
+        ]
+
+        await self.job_queue.submit_many(jobs, batch_id, preceding=[
+            (INSERT_BATCH_SQL, [(
+                batch_id, BATCH_RUNNING, len(urls), brand, product_category, use_case, now, now
+            )]),
+            (UPSERT_ANALYSIS_SQL, [analysis_row(analysis) for analysis in analyses])
+        ])
+
+        logger.info("Created batch", extra={"batch_id": batch_id, "urls": len(urls)})
+        return await self.get(batch_id)
+
+    async def get(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a batch with job counts by status.
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            Batch status, or None if not found
+        """
+        batch = await self.db.fetch_one("SELECT * FROM batches WHERE id = ?", (batch_id,))
+        if batch is None:
+            return None
+
+        rows = await self.db.fetch_all(
+            "SELECT status, COUNT(*) AS jobs FROM jobs WHERE batch_id = ? GROUP BY status",
+            (batch_id,)
+        )
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row["status"]: row["jobs"] for row in rows})
+
+        status = batch["status"]
+        if status == BATCH_RUNNING and not (counts[JOB_QUEUED] + counts[JOB_RUNNING] + counts[JOB_PAUSED]):
+            status = BATCH_COMPLETED
+
+        return {
+            "batch_id": batch["id"],
+            "status": status,
+            "total": batch["total"],
+            "jobs": counts,
+            "brand": batch["brand"],
+            "category": batch["product_category"],
+            "use_case": batch["use_case"],
+            "created_at": datetime.fromtimestamp(batch["created_at"]).isoformat()
+        }
+
+    async def pause(self, batch_id: str) -> Dict[str, Any]:
+        """Stop starting jobs of a batch; running jobs finish."""
+        return await self._transition(batch_id, BATCH_RUNNING, BATCH_PAUSED, [
+            (SET_JOBS_STATUS_SQL, [(JOB_PAUSED, time.time(), batch_id, JOB_QUEUED)])
+        ])
+
+    async def resume(self, batch_id: str) -> Dict[str, Any]:
+        """Requeue the paused jobs of a batch."""
+        return await self._transition(batch_id, BATCH_PAUSED, BATCH_RUNNING, [
+            (SET_JOBS_STATUS_SQL, [(JOB_QUEUED, time.time(), batch_id, JOB_PAUSED)])
+        ])
+
+    async def cancel(self, batch_id: str) -> Dict[str, Any]:
+        """Drop the jobs of a batch that have not started; running jobs finish."""
+        batch = await self.get(batch_id)
+        if batch is None:
+            raise JobException(f"Batch not found: {batch_id}")
+
+        now = time.time()
+        return await self._transition(batch_id, batch["status"], BATCH_CANCELLED, [
+            # Analyses first: the subquery selects jobs by their current status
+            (CANCEL_ANALYSES_SQL, [(
+                AnalysisStatus.FAILED.value, "Batch cancelled", batch_id, JOB_QUEUED, JOB_PAUSED
+            )]),
+            (CANCEL_JOBS_SQL, [(JOB_CANCELLED, now, batch_id, JOB_QUEUED, JOB_PAUSED)])
+        ])
+
+    async def _transition(
+        self,
+        batch_id: str,
+        from_status: str,
+        to_status: str,
+        job_statements: List[tuple]
+    ) -> Dict[str, Any]:
+        """Change batch status and its jobs' statuses in one transaction."""
+        batch = await self.get(batch_id)
+        if batch is None:
+            raise JobException(f"Batch not found: {batch_id}")
+        if batch["status"] != from_status or from_status in (BATCH_CANCELLED, BATCH_COMPLETED):
+            raise JobException(f"Cannot change batch from {batch['status']} to {to_status}")
+
+        # COMPLETED is derived, so the stored status of a finished batch is RUNNING
+        await self.db.execute_batch([
+            (SET_BATCH_STATUS_SQL, [(to_status, time.time(), batch_id, from_status)])
+        ] + job_statements)
+
+        logger.info("Batch status changed", extra={"batch_id": batch_id, "status": to_status})
+        return await self.get(batch_id)
+
+    async def iter_finished(
+        self,
+        batch_id: str,
+        after: int = 0,
+        limit: Optional[int] = None,
+        follow: bool = True,
+        poll_interval: float = 1.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield finished jobs of a batch in completion order, a page at a time.
+
+        Pages are fetched by keyset (finished_seq > cursor), so memory stays
+        flat however large the batch, and a client can resume from the last
+        cursor it saw.
+
+        Args:
+            batch_id: Batch ID
+            after: Cursor to continue after (0 = from the start)
+            limit: Stop after this many results
+            follow: Keep waiting for jobs until the batch has none unfinished
+            poll_interval: Seconds between checks for newly finished jobs
+
+        Yields:
+            Dicts with analysis_id and cursor
+        """
+        sent = 0
+        while True:
+            # Checked before reading: everything finished by now is in the pages below
+            finished = not follow or not await self._has_unfinished(batch_id)
+
+            while True:
+                rows = await self.db.fetch_all(SELECT_FINISHED_SQL, (batch_id, after, RESULTS_PAGE_SIZE))
+                for row in rows:
+                    yield {"analysis_id": row["analysis_id"], "cursor": row["finished_seq"]}
+                    after = row["finished_seq"]
+                    sent += 1
+                    if limit and sent >= limit:
+                        return
+                if len(rows) < RESULTS_PAGE_SIZE:
+                    break
+
+            if finished:
+                return
+            await asyncio.sleep(poll_interval)
+
+    async def _has_unfinished(self, batch_id: str) -> bool:
+        """Whether any job of the batch is queued, running or paused."""
+        row = await self.db.fetch_one(
+            "SELECT 1 FROM jobs WHERE batch_id = ? AND status IN (?, ?, ?) LIMIT 1",
+            (batch_id, JOB_QUEUED, JOB_RUNNING, JOB_PAUSED)
+        )
+        return row is not None
@@ -0,0 +1,134 @@
+"""In-process pub/sub of analysis progress events (served to clients as SSE)."""
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from arrs.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Event types after which an analysis publishes nothing more
+TERMINAL_EVENTS = ("completed", "failed")
+
+
+class EventBus:
+    """
+    Fan-out of analysis events to subscribers in the same process.
+
+    Recent events of each analysis are kept so a client that subscribes
+    late, or reconnects with Last-Event-ID, gets what it missed.
+    """
+
+    def __init__(self, history_size: int = 100, max_tracked: int = 1000, retention_seconds: float = 60.0):
+        """
+        Initialize event bus.
+
+        Args:
+            history_size: Events kept per analysis for replay
+            max_tracked: Analyses with history kept (least recently active dropped first)
+            retention_seconds: How long history outlives a finished analysis
+        """
+        self.history_size = history_size
+        self.max_tracked = max_tracked
+        self.retention_seconds = retention_seconds
+        self._next_id = 1
+        self._history: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def publish(self, analysis_id: str, event_type: str, data: Optional[Dict[str, Any]] = None):
+        """
+        Publish an event to current subscribers without waiting.
+
+        Args:
+            analysis_id: Analysis ID
+            event_type: Event type (e.g. "crawled", "engine_score", "completed")
+            data: JSON-serializable event payload
+        """
+        event = {
+            "id": self._next_id,
+            "type": event_type,
+            "analysis_id": analysis_id,
+            "timestamp": time.time(),
+            "data": data or {}
+        }
+        self._next_id += 1
+
+        history = self._history.setdefault(analysis_id, [])
+        history.append(event)
+        del history[:-self.history_size]
+        self._history.move_to_end(analysis_id)
+        while len(self._history) > self.max_tracked:
+            self._history.popitem(last=False)
+
+        for queue in self._subscribers.get(analysis_id, ()):
+            queue.put_nowait(event)
+
+        if event_type in TERMINAL_EVENTS:
+            asyncio.get_running_loop().call_later(
+                self.retention_seconds, self._forget, analysis_id, event["id"]
+            )
+
+    def _forget(self, analysis_id: str, terminal_id: int):
+        """Drop history of a finished analysis unless it has run again since."""
+        history = self._history.get(analysis_id)
+        if history and history[-1]["id"] == terminal_id:
+            del self._history[analysis_id]
+
+    @asynccontextmanager
+    async def subscribe(self, analysis_id: str, last_event_id: int = 0) -> AsyncIterator[asyncio.Queue]:
+        """
+        Receive events of an analysis, starting with retained ones.
+
+        Args:
+            analysis_id: Analysis ID
+            last_event_id: Replay only events after this ID
+
+        Yields:
+            Queue receiving the events
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for event in self._history.get(analysis_id, ()):
+            if event["id"] > last_event_id:
+                queue.put_nowait(event)
+
+        subscribers = self._subscribers.setdefault(analysis_id, set())
+        subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers.discard(queue)
+            if not subscribers:
+                self._subscribers.pop(analysis_id, None)
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """
+    Encode an event in Server-Sent Events wire format.
+
+    Args:
+        event: Event as published on the bus
+
+    Returns:
+        SSE message (id, event and data fields)
+    """
+    payload = {"analysis_id": event["analysis_id"], **event["data"]}
+    lines = []
+    if event.get("id"):
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(payload)}")
+    return "\n".join(lines) + "\n\n"
+
+
+# Process-wide bus, created on first use
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
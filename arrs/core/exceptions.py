@@ -29,3 +29,8 @@ class SimulationException(ARRSException):
 class StorageException(ARRSException):
     """Storage-related exceptions."""
     pass
+
+
+class JobException(ARRSException):
+    """Background job exceptions."""
+    pass
@@ -0,0 +1,66 @@
+"""Process pool for CPU-bound pipeline stages (parsing and scoring)."""
+import asyncio
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+# Process-wide executor, created on first use
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_cpu_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the process pool for CPU-bound work.
+
+    Returns:
+        Process pool, or None when the pool is disabled (work runs inline)
+    """
+    global _executor
+    if not settings.enable_process_pool:
+        return None
+
+    if _executor is None:
+        workers = settings.cpu_workers or os.cpu_count() or 1
+        # spawn avoids forking a process that already runs event-loop and DB threads
+        _executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info("CPU process pool started", extra={"workers": workers})
+
+    return _executor
+
+
+async def run_cpu_bound(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a picklable function in the process pool without blocking the event loop.
+
+    Args:
+        func: Module-level function or bound method of a picklable object
+        *args: Positional arguments (must be picklable)
+        **kwargs: Keyword arguments (must be picklable)
+
+    Returns:
+        Function result
+    """
+    executor = get_cpu_executor()
+    if executor is None:
+        return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+def shutdown_cpu_executor():
+    """Shut down the process pool, if it was started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        logger.info("CPU process pool stopped")
@@ -0,0 +1,601 @@
+"""Background job queues for analyses: in-memory or durable (SQLite)."""
+import asyncio
+import dataclasses
+import json
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from arrs.core.exceptions import JobException
+from arrs.models.analysis import AnalysisStatus
+from arrs.storage.database import Database
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+# Reports a pipeline stage and its completion percentage
+ProgressCallback = Callable[[str, int], Awaitable[None]]
+
+JOB_BACKENDS = ("memory", "sqlite")
+
+# Job row statuses
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_PAUSED = "paused"  # batch paused; not claimable until resumed
+JOB_CANCELLED = "cancelled"
+
+JOB_STATUSES = (JOB_QUEUED, JOB_RUNNING, JOB_COMPLETED, JOB_FAILED, JOB_PAUSED, JOB_CANCELLED)
+
+
+def job_host(url: str) -> str:
+    """Host a job's URL points at, the key of the per-host concurrency limit."""
+    return urlparse(url).netloc.lower()
+
+
+@dataclass
+class AnalysisJob:
+    """An analysis waiting for a worker."""
+    analysis_id: str
+    url: str
+    brand: Optional[str] = None
+    product_category: Optional[str] = None
+    use_case: Optional[str] = None
+    force_refresh: bool = False
+    fresh_simulation: bool = False
+
+
+JobRunner = Callable[[AnalysisJob, ProgressCallback], Awaitable[Any]]
+
+
+class JobQueue:
+    """
+    Bounded in-memory queue drained by a fixed pool of async workers.
+
+    The worker count is the concurrency limit: at most that many analyses
+    run at once, however many requests are queued. Progress is tracked in
+    memory until a job finishes; the finished result lives in the database.
+    Queued and running jobs are lost when the process exits.
+    """
+
+    def __init__(self, runner: JobRunner, workers: int = 4, max_size: int = 1000):
+        """
+        Initialize job queue.
+
+        Args:
+            runner: Coroutine function executing one job
+            workers: Number of concurrent workers
+            max_size: Queued jobs before submit() rejects new ones (0 = unbounded)
+        """
+        self.runner = runner
+        self.workers = max(1, workers)
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._progress: Dict[str, Dict[str, Any]] = {}
+        self._accepting = False
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are started."""
+        return bool(self._tasks)
+
+    async def start(self):
+        """Start the worker pool."""
+        if self.running:
+            return
+        # Created here so the queue binds to the running event loop
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._accepting = True
+        self._tasks = [
+            asyncio.create_task(self._worker(number), name=f"analysis-worker-{number}")
+            for number in range(self.workers)
+        ]
+        logger.info("Job queue started", extra={"workers": self.workers})
+
+    async def stop(self):
+        """Stop workers; running and queued jobs are abandoned."""
+        self._accepting = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        abandoned = len(self._progress)
+        self._tasks = []
+        self._queue = None
+        self._progress.clear()
+        logger.info("Job queue stopped", extra={"abandoned_jobs": abandoned})
+
+    async def drain(self, timeout: float):
+        """
+        Stop taking jobs and wait for queued and running ones, then stop.
+
+        Args:
+            timeout: Seconds to wait before abandoning what is left
+        """
+        self._accepting = False
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        await self.stop()
+
+    async def submit(self, job: AnalysisJob):
+        """
+        Enqueue a job without waiting for it to run.
+
+        Args:
+            job: Job to run
+
+        Raises:
+            JobException: If the queue is not running or is full
+        """
+        if not self._accepting:
+            raise JobException("Job queue is not running")
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobException(f"Job queue is full ({self.max_size} jobs waiting)")
+
+        self._progress[job.analysis_id] = {"stage": "queued", "percent": 0}
+        logger.info("Job queued", extra={
+            "analysis_id": job.analysis_id,
+            "queue_depth": self._queue.qsize()
+        })
+
+    async def progress(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get progress of a queued or running job.
+
+        Args:
+            analysis_id: Analysis ID
+
+        Returns:
+            Stage and percentage, or None if the job is not in the queue
+        """
+        progress = self._progress.get(analysis_id)
+        return dict(progress) if progress is not None else None
+
+    async def stats(self) -> Dict[str, int]:
+        """Queue depth and active job counts."""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return {
+            "workers": self.workers,
+            "queued": queued,
+            "running": len(self._progress) - queued
+        }
+
+    async def _worker(self, number: int):
+        """Run jobs one at a time until cancelled."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: AnalysisJob):
+        """Run one job, recording progress; failures are logged, not raised."""
+        async def report(stage: str, percent: int):
+            self._progress[job.analysis_id] = {"stage": stage, "percent": percent}
+
+        await report("starting", 0)
+        try:
+            await self.runner(job, report)
+        except Exception as e:
+            # The runner records the failure on the analysis itself
+            logger.error("Job failed", extra={"analysis_id": job.analysis_id, "error": str(e)})
+        finally:
+            self._progress.pop(job.analysis_id, None)
+
+
+INSERT_JOB_SQL = """INSERT INTO jobs
+   (analysis_id, payload, status, progress, attempts, created_at, updated_at, batch_id, host)
+   VALUES (?, ?, ?, 0, 0, ?, ?, ?, ?)"""
+
+# A job is claimable when queued, or when its worker stopped renewing the lease,
+# and its host is below the per-host limit (first parameter; 0 = unlimited)
+CLAIMABLE_CONDITION = """(status = ? OR (status = ? AND lease_expires_at < ?))
+   AND (? <= 0 OR host IS NULL OR host NOT IN (
+       SELECT host FROM jobs
+       WHERE status = ? AND lease_expires_at >= ? AND host IS NOT NULL
+       GROUP BY host HAVING COUNT(*) >= ?
+   ))"""
+
+# Single analyses go ahead of queued batch jobs
+SELECT_CLAIMABLE_SQL = f"""SELECT analysis_id, payload, attempts FROM jobs
+   WHERE {CLAIMABLE_CONDITION}
+   ORDER BY batch_id IS NOT NULL, created_at
+   LIMIT 1"""
+
+CLAIM_JOB_SQL = f"""UPDATE jobs
+   SET status = ?, lease_owner = ?, lease_expires_at = ?, attempts = attempts + 1, updated_at = ?
+   WHERE analysis_id = ? AND {CLAIMABLE_CONDITION}"""
+
+RENEW_LEASE_SQL = """UPDATE jobs SET lease_expires_at = ?, updated_at = ?
+   WHERE analysis_id = ? AND lease_owner = ?"""
+
+UPDATE_PROGRESS_SQL = """UPDATE jobs SET stage = ?, progress = ?, updated_at = ?
+   WHERE analysis_id = ? AND lease_owner = ?"""
+
+# finished_seq follows commit order (writes are serialized), so a reader
+# paging by it never skips a job that finished later with an earlier clock
+FINISH_JOB_SQL = """UPDATE jobs
+   SET status = ?, error_message = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ?,
+       finished_seq = (SELECT COALESCE(MAX(finished_seq), 0) + 1 FROM jobs)
+   WHERE analysis_id = ? AND lease_owner = ?"""
+
+# Graceful shutdown: hand the job back without counting the attempt
+RELEASE_JOB_SQL = """UPDATE jobs
+   SET status = ?, lease_owner = NULL, lease_expires_at = NULL, attempts = attempts - 1, updated_at = ?
+   WHERE analysis_id = ? AND lease_owner = ?"""
+
+FAIL_ANALYSIS_SQL = "UPDATE analyses SET status = ?, error_message = ? WHERE id = ?"
+
+
+class SQLiteJobQueue:
+    """
+    Durable job queue stored in the jobs table.
+
+    A worker claims a job by taking a lease and renews it with heartbeats.
+    If the process dies, the lease expires and any worker (after a restart,
+    or in another process) claims the job again; the orchestrator then
+    resumes from the last checkpointed pipeline stage. A job whose lease
+    expired max_attempts times is failed instead of retried.
+    """
+
+    def __init__(
+        self,
+        runner: JobRunner,
+        database: Database,
+        workers: int = 4,
+        max_size: int = 1000,
+        lease_seconds: float = 60.0,
+        heartbeat_seconds: float = 15.0,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+        max_per_host: int = 0
+    ):
+        """
+        Initialize durable job queue.
+
+        Args:
+            runner: Coroutine function executing one job
+            database: Database holding the jobs table
+            workers: Number of concurrent workers in this process
+            max_size: Queued jobs before submit() rejects new ones (0 = unbounded)
+            lease_seconds: Time a claimed job stays reserved without a heartbeat
+            heartbeat_seconds: Interval between lease renewals
+            poll_interval: Seconds an idle worker waits before looking for jobs again
+            max_attempts: Claims per job before it is failed
+            max_per_host: Jobs running at once against one host (0 = unlimited)
+        """
+        self.runner = runner
+        self.db = database
+        self.workers = max(1, workers)
+        self.max_size = max_size
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.poll_interval = poll_interval
+        self.max_attempts = max(1, max_attempts)
+        self.max_per_host = max_per_host
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._accepting = False
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are started."""
+        return bool(self._tasks)
+
+    async def start(self):
+        """Start the worker pool."""
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._accepting = True
+        self._tasks = [
+            asyncio.create_task(self._worker(number), name=f"analysis-worker-{number}")
+            for number in range(self.workers)
+        ]
+        logger.info("Job queue started", extra={"workers": self.workers, "owner": self.owner})
+
+    async def stop(self):
+        """Stop workers; running jobs are released for another worker to resume."""
+        self._accepting = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Job queue stopped", extra={"owner": self.owner})
+
+    async def drain(self, timeout: float):
+        """
+        Stop claiming jobs and let running ones finish, then stop.
+
+        Jobs still running after the timeout are released and resumed from
+        their checkpoints by another worker.
+
+        Args:
+            timeout: Seconds running jobs get to finish
+        """
+        self._accepting = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=timeout)
+        await self.stop()
+
+    async def submit(self, job: AnalysisJob):
+        """
+        Persist a job for any worker to run.
+
+        Args:
+            job: Job to run
+
+        Raises:
+            JobException: If the queue is full
+        """
+        if self.max_size:
+            # Batch jobs don't count: they queue behind single analyses
+            row = await self.db.fetch_one(
+                "SELECT COUNT(*) AS queued FROM jobs WHERE batch_id IS NULL AND status = ?",
+                (JOB_QUEUED,)
+            )
+            if row["queued"] >= self.max_size:
+                raise JobException(f"Job queue is full ({self.max_size} jobs waiting)")
+
+        await self.db.execute(INSERT_JOB_SQL, self._job_row(job, time.time()))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+        logger.info("Job queued", extra={"analysis_id": job.analysis_id})
+
+    async def submit_many(
+        self,
+        jobs: List[AnalysisJob],
+        batch_id: str,
+        preceding: Optional[List[Tuple[str, list]]] = None
+    ):
+        """
+        Persist the jobs of a batch in one transaction.
+
+        Batches are not subject to max_size; they queue behind single
+        analyses instead.
+
+        Args:
+            jobs: Jobs to run
+            batch_id: Batch the jobs belong to
+            preceding: Statements committed in the same transaction, before the jobs
+        """
+        now = time.time()
+        await self.db.execute_batch(list(preceding or []) + [
+            (INSERT_JOB_SQL, [self._job_row(job, now, batch_id) for job in jobs])
+        ])
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+        logger.info("Batch jobs queued", extra={"batch_id": batch_id, "jobs": len(jobs)})
+
+    @staticmethod
+    def _job_row(job: AnalysisJob, now: float, batch_id: Optional[str] = None) -> tuple:
+        """Parameters for INSERT_JOB_SQL."""
+        return (
+            job.analysis_id,
+            json.dumps(dataclasses.asdict(job)),
+            JOB_QUEUED,
+            now,
+            now,
+            batch_id,
+            job_host(job.url)
+        )
+
+    def _claimable_params(self, now: float) -> tuple:
+        """Parameters for CLAIMABLE_CONDITION."""
+        return (
+            JOB_QUEUED, JOB_RUNNING, now,
+            self.max_per_host, JOB_RUNNING, now, self.max_per_host
+        )
+
+    async def progress(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get progress of a queued or running job.
+
+        Args:
+            analysis_id: Analysis ID
+
+        Returns:
+            Stage and percentage, or None if the job is not queued or running
+        """
+        row = await self.db.fetch_one(
+            "SELECT status, stage, progress, attempts FROM jobs WHERE analysis_id = ? AND status IN (?, ?)",
+            (analysis_id, JOB_QUEUED, JOB_RUNNING)
+        )
+        if row is None:
+            return None
+        if row["status"] == JOB_QUEUED:
+            return {"stage": "queued", "percent": 0}
+        return {"stage": row["stage"] or "starting", "percent": row["progress"], "attempt": row["attempts"]}
+
+    async def stats(self) -> Dict[str, int]:
+        """Job counts by status."""
+        rows = await self.db.fetch_all("SELECT status, COUNT(*) AS jobs FROM jobs GROUP BY status")
+        counts = {row["status"]: row["jobs"] for row in rows}
+        return {
+            "workers": self.workers,
+            **{status: counts.get(status, 0) for status in JOB_STATUSES}
+        }
+
+    async def _worker(self, number: int):
+        """Claim and run jobs until draining or cancelled."""
+        while self._accepting:
+            try:
+                claimed = await self._claim()
+            except Exception as e:
+                logger.error(f"Claiming a job failed: {e}")
+                claimed = None
+
+            if claimed is None:
+                await self._wait_for_work()
+                continue
+
+            job, attempt = claimed
+            try:
+                if attempt > self.max_attempts:
+                    await self._give_up(job, attempt)
+                else:
+                    await self._run_job(job)
+            except Exception as e:
+                # Keep the worker alive; the job's lease expires and it is claimed again
+                logger.error(f"Job bookkeeping failed: {e}", extra={"analysis_id": job.analysis_id})
+
+    async def _wait_for_work(self):
+        """Sleep until a job is submitted in this process or the poll interval passes."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _claim(self) -> Optional[tuple]:
+        """
+        Take the lease on the oldest claimable job.
+
+        Returns:
+            (job, attempt number), or None if no job is claimable
+        """
+        now = time.time()
+        row = await self.db.fetch_one(SELECT_CLAIMABLE_SQL, self._claimable_params(now))
+        if row is None:
+            return None
+
+        # The WHERE clause re-checks claimability (including the host limit)
+        # inside the write transaction, so only one worker wins
+        claimed = await self.db.execute(
+            CLAIM_JOB_SQL,
+            (JOB_RUNNING, self.owner, now + self.lease_seconds, now, row["analysis_id"])
+            + self._claimable_params(now)
+        )
+        if not claimed:
+            return None
+
+        job = AnalysisJob(**json.loads(row["payload"]))
+        return job, row["attempts"] + 1
+
+    async def _run_job(self, job: AnalysisJob):
+        """Run a claimed job while renewing its lease."""
+        async def report(stage: str, percent: int):
+            await self.db.execute(
+                UPDATE_PROGRESS_SQL,
+                (stage, percent, time.time(), job.analysis_id, self.owner)
+            )
+
+        run = asyncio.create_task(self.runner(job, report))
+        try:
+            while True:
+                done, _ = await asyncio.wait({run}, timeout=self.heartbeat_seconds)
+                if done:
+                    break
+                if not await self._renew_lease(job):
+                    logger.warning("Lost job lease, abandoning job", extra={"analysis_id": job.analysis_id})
+                    run.cancel()
+                    await asyncio.gather(run, return_exceptions=True)
+                    return
+        except asyncio.CancelledError:
+            # Shutting down: stop the job and let another worker resume it
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+            await asyncio.shield(self._release(job))
+            raise
+
+        try:
+            run.result()
+        except Exception as e:
+            # The runner records the failure on the analysis itself
+            logger.error("Job failed", extra={"analysis_id": job.analysis_id, "error": str(e)})
+            await self._finish(job, JOB_FAILED, str(e))
+            return
+
+        # Outside the try: a failed update must not turn a completed job into a failed one
+        await self._finish(job, JOB_COMPLETED)
+
+    async def _renew_lease(self, job: AnalysisJob) -> bool:
+        """Extend the lease; False if another worker has taken the job over."""
+        now = time.time()
+        try:
+            renewed = await self.db.execute(
+                RENEW_LEASE_SQL,
+                (now + self.lease_seconds, now, job.analysis_id, self.owner)
+            )
+        except Exception as e:
+            # Keep going: the lease is still valid until it expires
+            logger.warning(f"Lease renewal failed: {e}", extra={"analysis_id": job.analysis_id})
+            return True
+        return bool(renewed)
+
+    async def _finish(self, job: AnalysisJob, status: str, error_message: Optional[str] = None):
+        """Record the outcome of a job and drop its lease."""
+        await self.db.execute(
+            FINISH_JOB_SQL,
+            (status, error_message, time.time(), job.analysis_id, self.owner)
+        )
+
+    async def _release(self, job: AnalysisJob):
+        """Return a job to the queue after an interrupted run."""
+        try:
+            await self.db.execute(
+                RELEASE_JOB_SQL,
+                (JOB_QUEUED, time.time(), job.analysis_id, self.owner)
+            )
+            logger.info("Released job", extra={"analysis_id": job.analysis_id})
+        except Exception as e:
+            # The lease still expires, so the job is picked up later anyway
+            logger.warning(f"Releasing job failed: {e}", extra={"analysis_id": job.analysis_id})
+
+    async def _give_up(self, job: AnalysisJob, attempt: int):
+        """Fail a job that keeps losing its worker (e.g. it crashes the process)."""
+        error_message = f"Analysis abandoned after {attempt - 1} interrupted attempts"
+        await self.db.execute_batch([
+            (FAIL_ANALYSIS_SQL, [(AnalysisStatus.FAILED.value, error_message, job.analysis_id)]),
+            (FINISH_JOB_SQL, [(JOB_FAILED, error_message, time.time(), job.analysis_id, self.owner)])
+        ])
+        logger.error("Job abandoned", extra={"analysis_id": job.analysis_id, "attempts": attempt - 1})
+
+
+def build_job_queue(runner: JobRunner, database: Database, workers: Optional[int] = None):
+    """
+    Create the job queue selected by settings.job_backend.
+
+    Args:
+        runner: Coroutine function executing one job
+        database: Database for the durable backend
+        workers: Concurrent jobs (settings.job_workers if omitted)
+
+    Returns:
+        JobQueue or SQLiteJobQueue
+    """
+    if settings.job_backend not in JOB_BACKENDS:
+        raise JobException(f"Unknown job backend: {settings.job_backend}")
+
+    workers = workers or settings.job_workers
+    if settings.job_backend == "memory":
+        return JobQueue(runner, workers=workers, max_size=settings.job_queue_max_size)
+
+    return SQLiteJobQueue(
+        runner,
+        database,
+        workers=workers,
+        max_size=settings.job_queue_max_size,
+        lease_seconds=settings.job_lease_seconds,
+        heartbeat_seconds=settings.job_heartbeat_seconds,
+        poll_interval=settings.job_poll_interval,
+        max_attempts=settings.job_max_attempts,
+        max_per_host=settings.job_max_per_host
+    )
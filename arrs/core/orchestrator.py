@@ -1,24 +1,54 @@
 """Orchestrator for coordinating the ARRS analysis pipeline."""
-from typing import Dict, List, Any, Optional
+import asyncio
+import dataclasses
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Tuple
 from arrs.models.analysis import Analysis, AnalysisStatus
 from arrs.models.crawled_content import CrawledContent
+from arrs.models.score_result import EngineScore, Gap
+from arrs.models.simulation_result import SimulationResult
 from arrs.crawlers.beautifulsoup_crawler import BeautifulSoupCrawler
 from arrs.crawlers.playwright_crawler import PlaywrightCrawler
-from arrs.parsers.html_parser import HTMLParser
-from arrs.parsers.schema_parser import SchemaParser
+from arrs.crawlers.crawl_cache import build_crawl_cache
+from arrs.crawlers.domain_profiles import DomainProfile, DomainProfileStore
+from arrs.crawlers.http_client import get_http_client
+from arrs.crawlers.render_detector import detect_render_need, looks_like_app_url
+from arrs.crawlers.revalidation import build_validator_store
+from arrs.parsers.page_parser import parse_page
 from arrs.engines.ade.engine import ADEEngine
 from arrs.engines.arce.engine import ARCEEngine
 from arrs.engines.tre.engine import TREEngine
 from arrs.simulation.simulator import ClaudeSimulator
 from arrs.simulation.ollama_simulator import OllamaSimulator
 from arrs.simulation.openai_simulator import OpenAISimulator
+from arrs.simulation.response_cache import build_response_cache
+from arrs.storage.blob_store import content_hash
 from arrs.storage.repository import Repository
+from arrs.storage.unit_of_work import AnalysisUnitOfWork
+from arrs.core.events import get_event_bus
+from arrs.core.executor import run_cpu_bound
 from arrs.core.exceptions import CrawlerException, EngineException, SimulationException
 from arrs.utils.logger import setup_logger
+from arrs.utils.metrics import get_metrics
 from config import settings
 
 logger = setup_logger(__name__)
 
+# Static crawls timed before their latency percentile sets the hedge delay
+HEDGE_MIN_SAMPLES = 20
+
+# Completion percentage reported when each pipeline stage starts
+PIPELINE_STAGES = {
+    "crawling": 10,
+    "parsing": 30,
+    "scoring": 45,
+    "identifying_gaps": 70,
+    "simulating": 80,
+    "saving": 95
+}
+
 
 class AnalysisOrchestrator:
     """Orchestrates the complete ARRS analysis pipeline."""
@@ -31,12 +61,23 @@ class AnalysisOrchestrator:
             repository: Data repository
         """
         self.repository = repository
+        self.events = get_event_bus()
+        self.metrics = get_metrics()
 
-        # Initialize components
+        # Initialize components (all HTTP traffic shares one pooled client)
+        self.http_client = get_http_client()
         self.crawler = BeautifulSoupCrawler(
+            timeout=settings.crawler_timeout,
+            user_agent=settings.crawler_user_agent,
+            http_client=self.http_client,
+            validator_store=build_validator_store(repository.db, repository.blob_store)
+        )
+        self.playwright_crawler = PlaywrightCrawler(
             timeout=settings.crawler_timeout,
             user_agent=settings.crawler_user_agent
         )
+        self.crawl_cache = build_crawl_cache(repository.db, repository.blob_store)
+        self.domain_profiles = DomainProfileStore(repository.db)
 
         # Initialize engines
         self.engines = {
@@ -46,20 +87,29 @@ class AnalysisOrchestrator:
         }
 
         # Initialize LLM simulator based on configuration
+        response_cache = build_response_cache(repository.db)
         if settings.llm_provider == "openai" and settings.openai_api_key:
             self.simulator = OpenAISimulator(
                 api_key=settings.openai_api_key,
                 model=settings.openai_model,
-                repository=repository
+                repository=repository,
+                http_client=self.http_client,
+                response_cache=response_cache
             )
             logger.info(f"Using OpenAI ({settings.openai_model}) for AI simulation")
         elif settings.llm_provider == "claude" and settings.anthropic_api_key:
-            self.simulator = ClaudeSimulator(api_key=settings.anthropic_api_key)
+            self.simulator = ClaudeSimulator(
+                api_key=settings.anthropic_api_key,
+                http_client=self.http_client,
+                response_cache=response_cache
+            )
             logger.info("Using Claude API for AI simulation")
         elif settings.llm_provider == "ollama":
             self.simulator = OllamaSimulator(
                 base_url=settings.ollama_base_url,
-                model=settings.ollama_model
+                model=settings.ollama_model,
+                http_client=self.http_client,
+                response_cache=response_cache
             )
             logger.info(f"Using Ollama ({settings.ollama_model}) for AI simulation")
         else:
@@ -77,7 +127,12 @@ class AnalysisOrchestrator:
         url: str,
         brand: Optional[str] = None,
         product_category: Optional[str] = None,
-        use_case: Optional[str] = None
+        use_case: Optional[str] = None,
+        analysis_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[str, int], Awaitable[None]]] = None,
+        resume: bool = False,
+        force_refresh: bool = False,
+        fresh_simulation: bool = False
     ) -> str:
         """
         Run complete analysis pipeline on a URL.
@@ -87,6 +142,11 @@ class AnalysisOrchestrator:
             brand: Brand name (extracted if not provided)
             product_category: Product category for simulation
             use_case: Use case for simulation
+            analysis_id: ID of an already created (pending) analysis to complete
+            progress_callback: Awaited with (stage, percent) as stages start
+            resume: Checkpoint each stage and skip stages checkpointed by an earlier attempt
+            force_refresh: Fetch the page even if the crawl cache holds a fresh copy
+            fresh_simulation: Sample new simulation completions instead of reusing cached ones
 
         Returns:
             Analysis ID
@@ -96,89 +156,144 @@ class AnalysisOrchestrator:
         """
         logger.info("Starting analysis", extra={"url": url})
 
-        # 1. Create analysis record
-        analysis = await self.repository.create_analysis(url)
+        # 1. Start the analysis; all writes are buffered and committed once
+        unit_of_work = self.repository.begin_analysis(url, analysis_id=analysis_id)
+        analysis = unit_of_work.analysis
 
-        try:
-            # 2. Update status to processing
-            await self.repository.update_analysis_status(
+        # None disables checkpointing; otherwise stage outputs of earlier attempts
+        checkpoints = await self.repository.load_checkpoints(analysis.id) if resume else None
+        if checkpoints:
+            logger.info("Resuming analysis from checkpoints", extra={
+                "analysis_id": analysis.id,
+                "stages": sorted(checkpoints)
+            })
+
+        async def report(stage: str):
+            self._publish(analysis.id, "stage", stage=stage, percent=PIPELINE_STAGES[stage])
+            if progress_callback is not None:
+                await progress_callback(stage, PIPELINE_STAGES[stage])
+
+        self._publish(analysis.id, "started", url=url)
+
+        # The simulation only needs brand/category/use case, so it runs
+        # alongside crawl -> parse -> score instead of after it
+        simulation_task = None
+        if self.simulator and brand and product_category and use_case:
+            logger.info("Starting AI simulation", extra={"analysis_id": analysis.id})
+            simulation_task = asyncio.create_task(self._run_stage(
                 analysis.id,
-                AnalysisStatus.PROCESSING
-            )
+                "simulation",
+                checkpoints,
+                lambda: self._run_simulation(
+                    analysis.id, brand, product_category, use_case, fresh=fresh_simulation
+                ),
+                encode=lambda result: result.to_dict(),
+                decode=SimulationResult.from_dict
+            ))
 
-            # 3. Crawl URL
+        try:
+            # 2. Crawl URL
+            await report("crawling")
             logger.info("Crawling URL", extra={"analysis_id": analysis.id})
-            crawled_content = await self._crawl_url(url, analysis.id)
-            await self.repository.save_crawled_content(crawled_content)
 
-            # 4. Parse content
-            logger.info("Parsing content", extra={"analysis_id": analysis.id})
-            parsed_data = await self._parse_content(crawled_content)
+            async def crawl() -> CrawledContent:
+                content = await self._crawl_url(url, analysis.id, force_refresh=force_refresh)
+                if checkpoints is not None:
+                    # The checkpoint references the HTML by hash instead of embedding it
+                    content.content_hash = await self.repository.blob_store.put(content.html_content)
+                return content
 
-            # 5. Run scoring engines
-            logger.info("Running scoring engines", extra={"analysis_id": analysis.id})
-            engine_scores = await self._run_engines(crawled_content, parsed_data)
+            crawled_content = await self._run_stage(
+                analysis.id,
+                "crawl",
+                checkpoints,
+                crawl,
+                encode=lambda content: {**content.to_dict(), "html_content": ""},
+                decode=CrawledContent.from_dict
+            )
+            if not crawled_content.html_content:
+                crawled_content.html_content = await self.repository.load_crawled_html(crawled_content)
+            unit_of_work.add_crawled_content(crawled_content)
+            self._publish(
+                analysis.id,
+                "crawled",
+                crawl_method=crawled_content.crawl_method,
+                status_code=crawled_content.status_code
+            )
 
-            # Save scores
-            for score in engine_scores:
-                await self.repository.save_engine_score(score)
+            # 3. Parse, score and find gaps, unless this exact page content
+            # (e.g. a 304 on re-crawl) was analyzed before: then reuse those results
+            reuse = settings.enable_caching and settings.crawl_revalidate and not force_refresh
+            reused = await self._find_reusable_results(crawled_content) if reuse else None
+            if reused is not None:
+                source_id, engine_scores, all_gaps = reused
+                logger.info("Page unchanged, reusing engine results", extra={
+                    "analysis_id": analysis.id,
+                    "source_analysis_id": source_id
+                })
+                unit_of_work.merge_metadata({"reused_results_from": source_id})
+                self._publish(analysis.id, "reused", source_analysis_id=source_id)
+                for score in engine_scores:
+                    self._publish(analysis.id, "engine_score", engine=score.engine_name, score=score.score, weight=score.weight)
+            else:
+                engine_scores, all_gaps = await self._score_content(
+                    crawled_content, checkpoints, unit_of_work, report
+                )
+            unit_of_work.add_engine_scores(engine_scores)
 
-            # 6. Calculate composite score
+            # 4. Calculate composite score
             composite_score = self._calculate_composite_score(engine_scores)
-            await self.repository.update_composite_score(analysis.id, composite_score)
+            unit_of_work.set_composite_score(composite_score)
 
             logger.info("Composite score calculated", extra={
                 "analysis_id": analysis.id,
                 "composite_score": composite_score
             })
+            self._publish(analysis.id, "gaps_identified", gap_count=len(all_gaps))
 
-            # 7. Identify gaps from engines
-            all_gaps = []
-            for score in engine_scores:
-                engine_name = score.engine_name
-                engine = self.engines.get(engine_name)
-                if engine:
-                    gaps = await engine.identify_gaps(score, parsed_data)
-                    all_gaps.extend(gaps)
-
-            # 8. Run AI simulation (if simulator available and brand/category provided)
-            if self.simulator and brand and product_category and use_case:
-                logger.info("Running AI simulation", extra={"analysis_id": analysis.id})
+            # 5. Join the AI simulation branch (started at step 1)
+            if simulation_task is not None:
+                await report("simulating")
+                logger.info("Waiting for AI simulation", extra={"analysis_id": analysis.id})
                 try:
-                    simulation_result = await self._run_simulation(
+                    simulation_result = await simulation_task
+                    unit_of_work.add_simulation_result(simulation_result)
+                    self._publish(
                         analysis.id,
-                        brand,
-                        product_category,
-                        use_case
+                        "simulation",
+                        brand_cited=simulation_result.brand_cited,
+                        citation_count=simulation_result.citation_count
                     )
-                    await self.repository.save_simulation_result(simulation_result)
 
                     # Add simulation-based gaps
-                    simulation_gaps = self._extract_simulation_gaps(
-                        analysis.id,
-                        simulation_result,
-                        parsed_data
-                    )
+                    simulation_gaps = self._extract_simulation_gaps(analysis.id, simulation_result)
                     all_gaps.extend(simulation_gaps)
                 except Exception as e:
                     logger.warning(f"AI simulation failed: {e}. Continuing without simulation.")
+                    self._publish(analysis.id, "simulation", error=str(e))
             elif not self.simulator:
                 logger.info("AI simulation skipped - no LLM provider configured")
 
-            # 9. Save all gaps
-            await self.repository.save_gaps(all_gaps)
+            unit_of_work.add_gaps(all_gaps)
 
-            # 10. Mark analysis complete
-            await self.repository.update_analysis_status(
-                analysis.id,
-                AnalysisStatus.COMPLETED
-            )
+            # 6. Mark complete and commit everything in one transaction
+            # (the commit also drops this analysis' checkpoints)
+            await report("saving")
+            unit_of_work.set_status(AnalysisStatus.COMPLETED)
+            await unit_of_work.commit()
 
             logger.info("Analysis completed", extra={
                 "analysis_id": analysis.id,
                 "composite_score": composite_score,
                 "gap_count": len(all_gaps)
             })
+            self._publish(
+                analysis.id,
+                "completed",
+                status=AnalysisStatus.COMPLETED.value,
+                composite_score=composite_score,
+                gap_count=len(all_gaps)
+            )
 
             return analysis.id
 
@@ -188,78 +303,484 @@ class AnalysisOrchestrator:
                 "error": str(e)
             })
 
-            await self.repository.update_analysis_status(
-                analysis.id,
-                AnalysisStatus.FAILED,
-                error_message=str(e)
-            )
+            # Only the FAILED analysis row is written, never partial results
+            unit_of_work.fail(str(e))
+            await unit_of_work.commit()
+            self._publish(analysis.id, "failed", status=AnalysisStatus.FAILED.value, error=str(e))
 
             raise
 
-    async def _crawl_url(self, url: str, analysis_id: str) -> CrawledContent:
-        """Crawl URL with BeautifulSoup first, fallback to Playwright if needed."""
-        # Try BeautifulSoup first (faster)
+        finally:
+            if simulation_task is not None:
+                self._discard_task(simulation_task)
+
+    async def _score_content(
+        self,
+        crawled_content: CrawledContent,
+        checkpoints: Optional[Dict[str, Any]],
+        unit_of_work: AnalysisUnitOfWork,
+        report: Callable[[str], Awaitable[None]]
+    ) -> Tuple[List[EngineScore], List[Gap]]:
+        """
+        Parse the page, run the scoring engines and identify their gaps.
+
+        Args:
+            crawled_content: Crawled page
+            checkpoints: Checkpoints of earlier attempts (None disables checkpointing)
+            unit_of_work: Unit of work of the analysis (receives metadata)
+            report: Reports a pipeline stage as it starts
+
+        Returns:
+            Engine scores and engine gaps
+        """
+        analysis_id = crawled_content.analysis_id
+
+        await report("parsing")
+        logger.info("Parsing content", extra={"analysis_id": analysis_id})
+        parsed_data = await self._run_stage(
+            analysis_id,
+            "parse",
+            checkpoints,
+            lambda: self._parse_content(crawled_content)
+        )
+        unit_of_work.merge_metadata({"parse_backend": parsed_data["parse_backend"]})
+        self._publish(analysis_id, "parsed", parse_backend=parsed_data["parse_backend"])
+
+        await report("scoring")
+        logger.info("Running scoring engines", extra={"analysis_id": analysis_id})
+        engine_scores, engine_errors = await self._run_stage(
+            analysis_id,
+            "engines",
+            checkpoints,
+            lambda: self._run_engines(crawled_content, parsed_data),
+            encode=lambda result: {
+                "scores": [score.to_dict() for score in result[0]],
+                "errors": result[1]
+            },
+            decode=lambda data: (
+                [EngineScore.from_dict(score) for score in data["scores"]],
+                data["errors"]
+            )
+        )
+        if engine_errors:
+            # Partial result: composite is computed from the engines that finished
+            unit_of_work.merge_metadata({"engine_errors": engine_errors})
+
+        await report("identifying_gaps")
+        _, gap_inputs = self._scoring_inputs(crawled_content, parsed_data)
+        engine_gaps = await self._run_stage(
+            analysis_id,
+            "gaps",
+            checkpoints,
+            lambda: self._identify_engine_gaps(engine_scores, gap_inputs),
+            encode=lambda gaps: [gap.to_dict() for gap in gaps],
+            decode=lambda data: [Gap.from_dict(gap) for gap in data]
+        )
+        return engine_scores, engine_gaps
+
+    async def _find_reusable_results(
+        self,
+        content: CrawledContent
+    ) -> Optional[Tuple[str, List[EngineScore], List[Gap]]]:
+        """
+        Engine results of an earlier analysis of byte-identical page content.
+
+        Only complete results are reused: every current engine scored, with
+        its current version, within crawl_reuse_max_age_hours. Copies keep
+        the original calculation time, so copies of copies age out too.
+        Copied rows record the analysis that computed them; weights are current.
+
+        Args:
+            content: Crawled page
+
+        Returns:
+            Source analysis ID, engine scores and engine gaps (copied for this
+            analysis), or None if the content has no reusable results
+        """
+        digest = content.content_hash or content_hash(content.html_content)
+        source_id = await self.repository.find_analysis_by_content(content.url, digest)
+        if source_id is None:
+            return None
+
+        scores = await self.repository.get_engine_scores(source_id)
+        if {score.engine_name for score in scores} != set(self.engines):
+            return None
+
+        oldest = datetime.now() - timedelta(hours=settings.crawl_reuse_max_age_hours)
+        for score in scores:
+            if score.scoring_version != self.engines[score.engine_name].version or score.calculated_at < oldest:
+                return None
+
+        gaps = await self.repository.get_gaps(source_id)
+        return source_id, [
+            dataclasses.replace(
+                score,
+                id=str(uuid.uuid4()),
+                analysis_id=content.analysis_id,
+                weight=self.engines[score.engine_name].weight,
+                reused_from=score.reused_from or source_id
+            )
+            for score in scores
+        ], [
+            dataclasses.replace(
+                gap,
+                id=str(uuid.uuid4()),
+                analysis_id=content.analysis_id,
+                reused_from=gap.reused_from or source_id
+            )
+            for gap in gaps
+            if gap.engine_source in self.engines
+        ]
+
+    async def _run_stage(
+        self,
+        analysis_id: str,
+        stage: str,
+        checkpoints: Optional[Dict[str, Any]],
+        produce: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda value: value
+    ) -> Any:
+        """
+        Run a pipeline stage, or restore its output from a checkpoint.
+
+        Args:
+            analysis_id: Analysis ID
+            stage: Checkpoint name of the stage
+            checkpoints: Checkpoints of earlier attempts (None disables checkpointing)
+            produce: Runs the stage
+            encode: Converts the stage output to JSON-serializable data
+            decode: Rebuilds the stage output from checkpoint data
+
+        Returns:
+            Stage output
+        """
+        if checkpoints is not None and stage in checkpoints:
+            logger.info("Stage restored from checkpoint", extra={
+                "analysis_id": analysis_id,
+                "stage": stage
+            })
+            self._publish(analysis_id, "restored", stage=stage)
+            return decode(checkpoints[stage])
+
+        result = await produce()
+        if checkpoints is not None:
+            await self.repository.save_checkpoint(analysis_id, stage, encode(result))
+        return result
+
+    def _publish(self, analysis_id: str, event_type: str, **data):
+        """Publish a progress event of an analysis to in-process subscribers."""
+        self.events.publish(analysis_id, event_type, data)
+
+    @staticmethod
+    def _discard_task(task: asyncio.Task):
+        """Cancel a branch that is no longer needed and consume its outcome."""
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            # Retrieve the exception so it is not reported as never retrieved
+            task.exception()
+
+    async def _crawl_url(self, url: str, analysis_id: str, force_refresh: bool = False) -> CrawledContent:
+        """Crawl URL through the crawl cache (when enabled)."""
+        if self.crawl_cache is None:
+            return await self._fetch_url(url, analysis_id, force_refresh)
+
+        if not force_refresh:
+            try:
+                cached = await self.crawl_cache.get(url, analysis_id)
+            except Exception as e:
+                logger.warning(f"Crawl cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                return cached
+
+        content = await self._fetch_url(url, analysis_id, force_refresh)
+        try:
+            await self.crawl_cache.set(url, content)
+        except Exception as e:
+            logger.warning(f"Crawl cache write failed: {e}")
+        return content
+
+    async def _fetch_url(self, url: str, analysis_id: str, force_refresh: bool = False) -> CrawledContent:
+        """
+        Crawl URL with BeautifulSoup first; Playwright if that fails or the page needs rendering.
+
+        Domains that keep blocking the static crawler go straight to
+        Playwright, with the static crawler re-probed every
+        crawl_reprobe_hours. With crawl_hedging on, a slow static crawl of an
+        unknown or flaky domain is raced against Playwright.
+        """
+        try:
+            profile = await self.domain_profiles.get(url)
+        except Exception as e:
+            logger.warning(f"Domain profile lookup failed: {e}")
+            profile = DomainProfile(domain="")
+
+        browser_first = (
+            settings.enable_playwright
+            and settings.crawl_strategy_memory
+            and profile.skips_static(settings.crawl_reprobe_hours * 3600)
+        )
+        if browser_first:
+            logger.info("Domain blocks static crawls, using Playwright directly", extra={"url": url})
+            try:
+                return await self._crawl_with("playwright", url, analysis_id)
+            except Exception as e:
+                logger.warning(f"Playwright failed: {e}. Trying BeautifulSoup...")
+
+        # Try BeautifulSoup first (faster); a stored page is revalidated unless refreshing
         try:
             logger.info("Trying BeautifulSoup crawler")
-            return await self.crawler.crawl(url, analysis_id)
+            static_crawl = self._crawl_with("beautifulsoup", url, analysis_id, revalidate=not force_refresh)
+            hedge = (
+                settings.crawl_hedging
+                and settings.enable_playwright
+                and not browser_first
+                and profile.static_uncertain
+            )
+            content = await (self._hedged_crawl(url, analysis_id, static_crawl) if hedge else static_crawl)
+            if content.crawl_method == "playwright":
+                return content
+        except CrawlerException:
+            # A hedged crawl already tried Playwright too
+            raise
         except Exception as e:
+            if browser_first:
+                raise CrawlerException(f"Failed to crawl {url}: {e}")
             logger.warning(f"BeautifulSoup failed: {e}. Trying Playwright fallback...")
 
-            # Fallback to Playwright for protected sites
+            # Fallback to Playwright (warm browser pool) for protected sites
             try:
-                playwright_crawler = PlaywrightCrawler(
-                    timeout=settings.crawler_timeout,
-                    user_agent=settings.crawler_user_agent
-                )
                 logger.info("Using Playwright crawler for anti-bot protection")
-                return await playwright_crawler.crawl(url, analysis_id)
+                return await self._crawl_with("playwright", url, analysis_id)
             except Exception as playwright_error:
                 logger.error(f"Both crawlers failed. Playwright error: {playwright_error}")
                 raise CrawlerException(f"Failed to crawl {url}: {playwright_error}")
 
+        return await self._render_if_needed(url, analysis_id, content, profile)
+
+    async def _hedged_crawl(
+        self,
+        url: str,
+        analysis_id: str,
+        static_crawl: Awaitable[CrawledContent]
+    ) -> CrawledContent:
+        """
+        Run the static crawl; if it is slow, race a Playwright crawl against it.
+
+        The hedge starts once the static crawl outlasts the
+        crawl_hedge_percentile of recent static crawl latencies. The first
+        crawl to return a page wins and the other is cancelled.
+
+        Returns:
+            Content of the winning crawl
+
+        Raises:
+            Exception: The static crawl's error, if it fails before the hedge starts
+            CrawlerException: If both crawls fail
+        """
+        static_task = asyncio.create_task(static_crawl)
+        tasks = [static_task]
+        try:
+            delay = self.metrics.percentile(
+                "crawl_latency_beautifulsoup",
+                settings.crawl_hedge_percentile,
+                min_samples=HEDGE_MIN_SAMPLES
+            )
+            delay = settings.crawl_hedge_delay if delay is None else delay
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return static_task.result()
+
+            logger.info("Static crawl slow, hedging with Playwright", extra={"url": url, "delay": delay})
+            self.metrics.increment("crawl_hedges_fired")
+            browser_task = asyncio.create_task(self._crawl_with("playwright", url, analysis_id))
+            tasks.append(browser_task)
+
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is browser_task:
+                            self.metrics.increment("crawl_hedges_won")
+                        return task.result()
+                    error = task.exception()
+            raise CrawlerException(f"Failed to crawl {url}: {error}")
+        finally:
+            for task in tasks:
+                self._discard_task(task)
+
+    async def _crawl_with(self, crawl_method: str, url: str, analysis_id: str, **kwargs) -> CrawledContent:
+        """Crawl with one crawler, recording outcome and latency in the domain profile and metrics."""
+        crawler = self.crawler if crawl_method == "beautifulsoup" else self.playwright_crawler
+        started = time.monotonic()
+        try:
+            content = await crawler.crawl(url, analysis_id, **kwargs)
+        except Exception:
+            await self._record_crawl(url, crawl_method, False)
+            raise
+        elapsed = time.monotonic() - started
+        self.metrics.observe(f"crawl_latency_{crawl_method}", elapsed)
+        await self._record_crawl(url, crawl_method, True, elapsed * 1000)
+        return content
+
+    async def _record_crawl(self, url: str, crawl_method: str, succeeded: bool, latency_ms: Optional[float] = None):
+        """Update the domain profile, never failing the crawl."""
+        try:
+            await self.domain_profiles.record_crawl(url, crawl_method, succeeded, latency_ms)
+        except Exception as e:
+            logger.warning(f"Domain profile update failed: {e}")
+
+    async def _render_if_needed(
+        self,
+        url: str,
+        analysis_id: str,
+        content: CrawledContent,
+        profile: DomainProfile
+    ) -> CrawledContent:
+        """
+        Re-crawl with Playwright when static HTML is an unrendered JS app shell.
+
+        Every decision is counted in the domain's profile; domains whose
+        pages usually need rendering (or URLs that look like apps) get sparse
+        pages rendered even without bundle signatures.
+        """
+        if not (settings.crawl_render_detection and settings.enable_playwright):
+            return content
+
+        render_prior = looks_like_app_url(url) or profile.usually_needs_render
+        decision = detect_render_need(content.html_content, render_prior=render_prior)
+        try:
+            await self.domain_profiles.record_render_decision(url, decision)
+        except Exception as e:
+            logger.warning(f"Domain profile update failed: {e}")
+
+        if not decision.needs_render:
+            return content
+
+        logger.info("Page needs JavaScript rendering", extra={
+            "url": url,
+            "reason": decision.reason,
+            "text_length": decision.text_length,
+            "signals": decision.signals
+        })
+        try:
+            return await self._crawl_with("playwright", url, analysis_id)
+        except Exception as e:
+            logger.warning(f"Playwright render failed: {e}. Using static HTML.")
+            return content
+
     async def _parse_content(self, content: CrawledContent) -> Dict[str, Any]:
-        """Parse HTML and extract structured data."""
-        # Parse HTML
-        html_parser = HTMLParser(content.html_content, content.url)
-        html_data = html_parser.parse()
-        html_data["heading_validation"] = html_parser.validate_heading_hierarchy()
-
-        # Parse schema
-        schema_parser = SchemaParser(content.html_content, content.url)
-        schema_data = {
-            "all_schemas": schema_parser.extract_all_schemas(),
-            "product": schema_parser.find_product_schema(),
-            "organization": schema_parser.find_organization_schema(),
-            "product_validation": schema_parser.validate_product_schema(),
-            "offers": schema_parser.extract_offers(),
-            "reviews": schema_parser.extract_reviews(),
-            "brand": schema_parser.extract_brand_info()
-        }
+        """Parse HTML and extract structured data in the CPU process pool."""
+        return await run_cpu_bound(parse_page, content.html_content, content.url)
 
-        return {
-            "html": html_data,
-            "schema": schema_data
+    def _scoring_inputs(
+        self,
+        content: CrawledContent,
+        parsed_data: Dict[str, Any]
+    ) -> Tuple[CrawledContent, Dict[str, Any]]:
+        """
+        Build compact engine inputs for shipping to worker processes.
+
+        Engines never read the raw HTML or the full extruct dump, so both are
+        dropped rather than pickled once per engine.
+        """
+        slim_content = dataclasses.replace(content, html_content="")
+        slim_parsed = dict(parsed_data)
+        slim_parsed["schema"] = {
+            key: value
+            for key, value in parsed_data.get("schema", {}).items()
+            if key != "all_schemas"
         }
+        return slim_content, slim_parsed
 
     async def _run_engines(
         self,
         content: CrawledContent,
         parsed_data: Dict[str, Any]
-    ) -> List:
-        """Run all scoring engines."""
-        scores = []
+    ) -> Tuple[List, Dict[str, str]]:
+        """
+        Run all scoring engines concurrently.
+
+        Each engine has its own timeout; a failed or timed-out engine is left
+        out of the results without affecting the others. An event is published
+        as each engine finishes.
+
+        Returns:
+            Engine scores, and error descriptions keyed by engine name
+        """
+        content, parsed_data = self._scoring_inputs(content, parsed_data)
 
-        for engine_name, engine in self.engines.items():
+        async def run_engine(name: str) -> EngineScore:
             try:
-                logger.info(f"Running {engine_name} engine")
-                score = await engine.analyze(content, parsed_data)
-                scores.append(score)
+                score = await self._with_engine_timeout(self.engines[name].analyze(content, parsed_data))
             except Exception as e:
-                logger.error(f"{engine_name} engine failed: {e}")
-                # Continue with other engines
-                # Could optionally create a zero-score result here
+                self._publish(content.analysis_id, "engine_error", engine=name, error=self._describe_engine_error(e))
+                raise
+            self._publish(content.analysis_id, "engine_score", engine=name, score=score.score, weight=score.weight)
+            return score
+
+        names = list(self.engines.keys())
+        results = await asyncio.gather(
+            *(run_engine(name) for name in names),
+            return_exceptions=True
+        )
+
+        scores = []
+        errors = {}
+        for engine_name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                errors[engine_name] = self._describe_engine_error(result)
+                logger.error(f"{engine_name} engine failed: {errors[engine_name]}")
+            else:
+                scores.append(result)
 
-        return scores
+        return scores, errors
+
+    async def _identify_engine_gaps(
+        self,
+        engine_scores: List,
+        parsed_data: Dict[str, Any]
+    ) -> List:
+        """Identify gaps for every scored engine concurrently."""
+        scored = [
+            (score, self.engines[score.engine_name])
+            for score in engine_scores
+            if score.engine_name in self.engines
+        ]
+        results = await asyncio.gather(
+            *(
+                self._with_engine_timeout(engine.identify_gaps(score, parsed_data))
+                for score, engine in scored
+            ),
+            return_exceptions=True
+        )
+
+        all_gaps = []
+        for (score, _), result in zip(scored, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"{score.engine_name} gap identification failed: "
+                    f"{self._describe_engine_error(result)}"
+                )
+            else:
+                all_gaps.extend(result)
+
+        return all_gaps
+
+    async def _with_engine_timeout(self, coroutine):
+        """Await an engine stage, bounded by the per-engine timeout."""
+        return await asyncio.wait_for(coroutine, timeout=settings.engine_timeout)
+
+    @staticmethod
+    def _describe_engine_error(error: BaseException) -> str:
+        """Short description of an engine failure for logs and metadata."""
+        if isinstance(error, asyncio.TimeoutError):
+            return f"timed out after {settings.engine_timeout}s"
+        return str(error) or error.__class__.__name__
 
     def _calculate_composite_score(self, engine_scores: List) -> float:
         """Calculate weighted composite score."""
@@ -280,15 +801,17 @@ class AnalysisOrchestrator:
         analysis_id: str,
         brand: str,
         product_category: str,
-        use_case: str
+        use_case: str,
+        fresh: bool = False
     ):
-        """Run AI simulation."""
+        """Run AI simulation (fresh skips the LLM response cache lookup)."""
         try:
             return await self.simulator.simulate_recommendation(
                 analysis_id,
                 brand,
                 product_category,
-                use_case
+                use_case,
+                fresh=fresh
             )
         except Exception as e:
             logger.error(f"Simulation failed: {e}")
@@ -297,8 +820,7 @@ class AnalysisOrchestrator:
     def _extract_simulation_gaps(
         self,
         analysis_id: str,
-        simulation_result,
-        parsed_data: Dict[str, Any]
+        simulation_result
     ) -> List:
         """Extract gaps from simulation results."""
         gaps = []
@@ -357,6 +879,7 @@ class AnalysisOrchestrator:
             "analysis_id": analysis.id,
             "url": analysis.url,
             "status": analysis.status.value,
+            "error_message": analysis.error_message,
             "composite_score": analysis.composite_score,
             "created_at": analysis.created_at.isoformat(),
             "engine_scores": {
@@ -0,0 +1,198 @@
+"""Standalone analysis worker processes pulling from the durable job queue."""
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+from typing import Dict, Optional
+from arrs.core.exceptions import JobException
+from arrs.core.jobs import AnalysisJob, JobRunner, ProgressCallback, build_job_queue
+from arrs.models.analysis import AnalysisStatus
+from arrs.storage.database import Database
+from arrs.storage.json_store import JSONStore
+from arrs.storage.repository import Repository
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+# Seconds between checks of the child processes
+SUPERVISOR_POLL_SECONDS = 1.0
+
+
+def make_job_runner(repository: Repository) -> JobRunner:
+    """
+    Build the job runner executing queued analyses against a repository.
+
+    Args:
+        repository: Repository the analyses are written to
+
+    Returns:
+        Coroutine function running one job
+    """
+    # Imported here: the orchestrator pulls in crawlers, engines and LLM clients
+    from arrs.core.orchestrator import AnalysisOrchestrator
+
+    orchestrator: Optional[AnalysisOrchestrator] = None
+
+    async def run_analysis_job(job: AnalysisJob, progress: ProgressCallback):
+        """Run a queued analysis to completion."""
+        nonlocal orchestrator
+        analysis = await repository.get_analysis(job.analysis_id)
+        if analysis is None or analysis.status in (AnalysisStatus.COMPLETED, AnalysisStatus.FAILED):
+            # Finished (or deleted) before an interrupted worker could record it
+            return
+
+        # Shared by all jobs; created on first job so startup stays cheap
+        if orchestrator is None:
+            orchestrator = AnalysisOrchestrator(repository)
+
+        await orchestrator.analyze_url(
+            job.url,
+            brand=job.brand,
+            product_category=job.product_category,
+            use_case=job.use_case,
+            analysis_id=job.analysis_id,
+            progress_callback=progress,
+            # Durable jobs checkpoint each stage so a retry resumes instead of restarting
+            resume=settings.job_backend == "sqlite",
+            force_refresh=job.force_refresh,
+            fresh_simulation=job.fresh_simulation
+        )
+
+    return run_analysis_job
+
+
+async def serve_jobs(concurrency: int, drain_timeout: float):
+    """
+    Run jobs in this process until SIGTERM or SIGINT, then drain.
+
+    Args:
+        concurrency: Jobs run at once by this process
+        drain_timeout: Seconds running jobs get to finish before they are released
+    """
+    # Imported here to keep the supervisor process light
+    from arrs.core.executor import shutdown_cpu_executor
+    from arrs.crawlers.browser_pool import close_browser_pool
+    from arrs.crawlers.http_client import close_http_client
+
+    db = Database(settings.database_url.replace("sqlite:///", ""))
+    await db.initialize()
+    repository = Repository(db, JSONStore(settings.json_storage_path))
+    queue = build_job_queue(make_job_runner(repository), db, workers=concurrency)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await queue.start()
+        await stop.wait()
+
+        logger.info("Draining worker", extra={"pid": os.getpid(), "timeout": drain_timeout})
+        await queue.drain(drain_timeout)
+    finally:
+        await close_http_client()
+        await close_browser_pool()
+        shutdown_cpu_executor()
+        await db.close()
+
+
+def run_worker_process(concurrency: int, drain_timeout: float, process_pool: bool):
+    """
+    Entry point of one worker process.
+
+    Args:
+        concurrency: Jobs run at once by this process
+        drain_timeout: Seconds running jobs get to finish on shutdown
+        process_pool: Offload parsing and scoring to a CPU process pool
+    """
+    settings.enable_process_pool = process_pool
+    asyncio.run(serve_jobs(concurrency, drain_timeout))
+
+
+def run_workers(
+    processes: int,
+    concurrency: int,
+    drain_timeout: float,
+    process_pool: Optional[bool] = None
+):
+    """
+    Run worker processes and keep them alive until SIGTERM or SIGINT.
+
+    Children that exit unexpectedly (e.g. killed for memory) are restarted;
+    their jobs are resumed from checkpoints once the leases expire. On
+    shutdown each child drains, then any straggler is killed.
+
+    Args:
+        processes: Number of worker processes
+        concurrency: Jobs run at once by each process
+        drain_timeout: Seconds running jobs get to finish on shutdown
+        process_pool: Per-process CPU pool (default: only with a single process,
+            since several processes already spread CPU work across cores)
+
+    Raises:
+        JobException: If the job backend cannot be shared between processes
+    """
+    if settings.job_backend != "sqlite":
+        raise JobException("Worker processes require JOB_BACKEND=sqlite")
+
+    processes = max(1, processes)
+    if process_pool is None:
+        process_pool = settings.enable_process_pool and processes == 1
+
+    # spawn: children start clean instead of inheriting the supervisor's state
+    context = multiprocessing.get_context("spawn")
+    children: Dict[int, multiprocessing.Process] = {}
+    shutting_down = False
+
+    def start_child(slot: int):
+        child = context.Process(
+            target=run_worker_process,
+            args=(concurrency, drain_timeout, process_pool),
+            name=f"arrs-worker-{slot}"
+        )
+        child.start()
+        children[slot] = child
+        logger.info("Worker process started", extra={"slot": slot, "pid": child.pid})
+
+    def request_shutdown(signum, frame):
+        nonlocal shutting_down
+        shutting_down = True
+
+    previous_handlers = {
+        sig: signal.signal(sig, request_shutdown) for sig in (signal.SIGTERM, signal.SIGINT)
+    }
+
+    try:
+        for slot in range(processes):
+            start_child(slot)
+
+        while not shutting_down:
+            time.sleep(SUPERVISOR_POLL_SECONDS)
+            for slot, child in list(children.items()):
+                if not shutting_down and not child.is_alive():
+                    logger.warning("Worker process exited, restarting", extra={
+                        "slot": slot,
+                        "exit_code": child.exitcode
+                    })
+                    start_child(slot)
+    finally:
+        for child in children.values():
+            if child.is_alive():
+                os.kill(child.pid, signal.SIGTERM)
+
+        # Leave room for the drain plus closing resources
+        deadline = time.monotonic() + drain_timeout + 10
+        for child in children.values():
+            child.join(max(0.0, deadline - time.monotonic()))
+            if child.is_alive():
+                logger.warning("Worker process did not drain in time, killing", extra={"pid": child.pid})
+                child.kill()
+                child.join()
+
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+
+        logger.info("All worker processes stopped")
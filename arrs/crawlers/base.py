@@ -1,5 +1,6 @@
 """Base crawler interface."""
 from abc import ABC, abstractmethod
+from arrs.crawlers.render_detector import looks_like_app_url
 from arrs.models.crawled_content import CrawledContent
 
 
@@ -44,9 +45,4 @@ class BaseCrawler(ABC):
         Returns:
             True if Playwright should be used
         """
-        # Heuristic: Use Playwright for known SPA frameworks
-        spa_indicators = [
-            'app.', 'www.app.', 'my.', 'account.',
-            'react', 'vue', 'angular'
-        ]
-        return any(indicator in url.lower() for indicator in spa_indicators)
+        return looks_like_app_url(url)
@@ -2,8 +2,10 @@
 import uuid
 import httpx
 from datetime import datetime
-from bs4 import BeautifulSoup
+from typing import Optional
 from arrs.crawlers.base import BaseCrawler
+from arrs.crawlers.http_client import SharedHTTPClient, get_http_client
+from arrs.crawlers.revalidation import ValidatorStore
 from arrs.models.crawled_content import CrawledContent
 from arrs.utils.logger import setup_logger
 
@@ -13,13 +15,37 @@ logger = setup_logger(__name__)
 class BeautifulSoupCrawler(BaseCrawler):
     """Crawler using BeautifulSoup for static content."""
 
-    async def crawl(self, url: str, analysis_id: str) -> CrawledContent:
+    def __init__(
+        self,
+        timeout: int = 30,
+        user_agent: str = "ARRS-Bot/1.0",
+        http_client: Optional[SharedHTTPClient] = None,
+        validator_store: Optional[ValidatorStore] = None
+    ):
+        """
+        Initialize crawler.
+
+        Args:
+            timeout: Request timeout in seconds
+            user_agent: User agent string
+            http_client: Pooled HTTP client (defaults to the process-wide client)
+            validator_store: Validators of earlier crawls (None disables conditional requests)
+        """
+        super().__init__(timeout=timeout, user_agent=user_agent)
+        self.http_client = http_client or get_http_client()
+        self.validator_store = validator_store
+
+    async def crawl(self, url: str, analysis_id: str, revalidate: bool = True) -> CrawledContent:
         """
         Crawl URL using BeautifulSoup.
 
+        If an earlier crawl stored validators, the request is conditional and
+        a 304 Not Modified reuses the stored body (content_hash is set).
+
         Args:
             url: URL to crawl
             analysis_id: Analysis ID
+            revalidate: Send a conditional request when validators are stored
 
         Returns:
             Crawled content
@@ -46,29 +72,62 @@ class BeautifulSoupCrawler(BaseCrawler):
             "Upgrade-Insecure-Requests": "1"
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+        validators = None
+        if self.validator_store is not None and revalidate:
             try:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
+                validators = await self.validator_store.get(url)
+            except Exception as e:
+                logger.warning(f"Validator lookup failed: {e}")
+        if validators is not None:
+            headers.update(validators.request_headers())
 
-                content = CrawledContent(
+        try:
+            response = await self.http_client.get(url, headers=headers, timeout=self.timeout)
+
+            if response.status_code == 304 and validators is not None:
+                html_content = await self.validator_store.load_html(validators)
+                if html_content is None:
+                    # Stored body is gone; fetch it again unconditionally
+                    return await self.crawl(url, analysis_id, revalidate=False)
+
+                logger.info("Page not modified, reusing stored content", extra={"url": url})
+                return CrawledContent(
                     id=str(uuid.uuid4()),
                     analysis_id=analysis_id,
-                    url=str(response.url),  # Final URL after redirects
-                    html_content=response.text,
+                    url=validators.final_url,
+                    html_content=html_content,
                     crawled_at=datetime.now(),
                     crawl_method="beautifulsoup",
-                    status_code=response.status_code
+                    status_code=validators.status_code,
+                    content_hash=validators.content_hash
                 )
 
-                logger.info("Crawl successful", extra={
-                    "url": url,
-                    "status_code": response.status_code,
-                    "content_length": len(response.text)
-                })
+            response.raise_for_status()
+
+            content = CrawledContent(
+                id=str(uuid.uuid4()),
+                analysis_id=analysis_id,
+                url=str(response.url),  # Final URL after redirects
+                html_content=response.text,
+                crawled_at=datetime.now(),
+                crawl_method="beautifulsoup",
+                status_code=response.status_code
+            )
+
+            if self.validator_store is not None:
+                try:
+                    content.content_hash = await self.validator_store.save(url, response, content.html_content)
+                except Exception as e:
+                    logger.warning(f"Validator save failed: {e}")
+
+            logger.info("Crawl successful", extra={
+                "url": url,
+                "status_code": response.status_code,
+                "content_length": len(response.text)
+            })
 
-                return content
+            return content
 
-            except httpx.HTTPError as e:
-                logger.error("Crawl failed", extra={"url": url, "error": str(e)})
-                raise
+        except httpx.HTTPError as e:
+            logger.error("Crawl failed", extra={"url": url, "error": str(e)})
+            raise
@@ -0,0 +1,241 @@
+"""Persistent pool of warm Playwright browsers with context recycling."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+from playwright.async_api import async_playwright, Browser, Playwright
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+BROWSER_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled'
+]
+
+
+class _PooledBrowser:
+    """Book-keeping for one browser process in the pool."""
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.active_contexts = 0
+        self.pages_served = 0
+        self.retiring = False
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the browser process is still connected."""
+        return self.browser.is_connected()
+
+
+class BrowserPool:
+    """Pool of long-lived Chromium browsers that hands out isolated contexts."""
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_contexts: int = 4,
+        max_pages_per_browser: int = 50,
+        headless: bool = True
+    ):
+        """
+        Initialize browser pool.
+
+        Args:
+            size: Number of browser processes kept warm
+            max_contexts: Maximum concurrent browser contexts across the pool
+            max_pages_per_browser: Pages served before a browser is recycled
+            headless: Run browsers in headless mode
+        """
+        self.size = max(1, size)
+        self.max_contexts = max(1, max_contexts)
+        self.max_pages_per_browser = max_pages_per_browser
+        self.headless = headless
+
+        self._playwright: Optional[Playwright] = None
+        self._browsers: List[_PooledBrowser] = []
+        self._context_slots = asyncio.Semaphore(self.max_contexts)
+        self._lock = asyncio.Lock()
+        self._next_index = 0
+        self._recycled = 0
+
+    async def start(self):
+        """Start Playwright and launch the warm browsers."""
+        async with self._lock:
+            await self._start_locked()
+
+    async def _start_locked(self):
+        """Start Playwright and fill the pool (caller holds the lock)."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        while len(self._browsers) < self.size:
+            self._browsers.append(_PooledBrowser(await self._launch()))
+
+        logger.info("Browser pool started", extra={
+            "size": self.size,
+            "max_contexts": self.max_contexts
+        })
+
+    async def _launch(self) -> Browser:
+        """Launch a single browser process."""
+        return await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=BROWSER_LAUNCH_ARGS
+        )
+
+    async def _acquire_browser(self) -> _PooledBrowser:
+        """Pick a healthy browser round-robin, recycling exhausted ones."""
+        async with self._lock:
+            if self._playwright is None or not self._browsers:
+                await self._start_locked()
+
+            index = self._next_index % len(self._browsers)
+            self._next_index += 1
+            pooled = self._browsers[index]
+
+            if not pooled.healthy or pooled.pages_served >= self.max_pages_per_browser:
+                reason = "unhealthy" if not pooled.healthy else "page_limit"
+                pooled.retiring = True
+                replacement = _PooledBrowser(await self._launch())
+                self._browsers[index] = replacement
+                self._recycled += 1
+
+                logger.info("Recycling browser", extra={
+                    "reason": reason,
+                    "pages_served": pooled.pages_served
+                })
+
+                if pooled.active_contexts == 0:
+                    await self._close_browser(pooled)
+
+                pooled = replacement
+
+            pooled.active_contexts += 1
+            return pooled
+
+    async def _release_browser(self, pooled: _PooledBrowser):
+        """Return a browser after its context was closed."""
+        async with self._lock:
+            pooled.active_contexts -= 1
+            pooled.pages_served += 1
+
+            if pooled.retiring and pooled.active_contexts == 0:
+                await self._close_browser(pooled)
+
+    async def _close_browser(self, pooled: _PooledBrowser):
+        """Close a browser process, ignoring already-dead browsers."""
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser: {e}")
+
+    @asynccontextmanager
+    async def context(self, **context_options: Any):
+        """
+        Borrow an isolated browser context for one crawl.
+
+        Args:
+            **context_options: Passed to Browser.new_context
+
+        Yields:
+            Browser context, closed when the block exits
+        """
+        async with self._context_slots:
+            pooled = await self._acquire_browser()
+            try:
+                browser_context = await pooled.browser.new_context(**context_options)
+                try:
+                    yield browser_context
+                finally:
+                    try:
+                        await browser_context.close()
+                    except Exception as e:
+                        logger.warning(f"Failed to close browser context: {e}")
+            finally:
+                await self._release_browser(pooled)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Replace disconnected browsers and report pool state.
+
+        Returns:
+            Pool health summary
+        """
+        replaced = 0
+        async with self._lock:
+            for index, pooled in enumerate(self._browsers):
+                if not pooled.healthy:
+                    pooled.retiring = True
+                    self._browsers[index] = _PooledBrowser(await self._launch())
+                    self._recycled += 1
+                    replaced += 1
+
+                    if pooled.active_contexts == 0:
+                        await self._close_browser(pooled)
+
+        return {
+            "started": self._playwright is not None,
+            "browsers": len(self._browsers),
+            "active_contexts": sum(b.active_contexts for b in self._browsers),
+            "pages_served": sum(b.pages_served for b in self._browsers),
+            "recycled": self._recycled,
+            "replaced": replaced
+        }
+
+    async def close(self):
+        """Close all browsers and stop Playwright."""
+        async with self._lock:
+            for pooled in self._browsers:
+                await self._close_browser(pooled)
+            self._browsers = []
+
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+                logger.info("Browser pool closed")
+
+
+# Process-wide pool used by the Playwright fallback crawler
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Get the process-wide browser pool (browsers launch on first use).
+
+    Returns:
+        Shared browser pool
+    """
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(
+            size=settings.playwright_pool_size,
+            max_contexts=settings.playwright_max_contexts,
+            max_pages_per_browser=settings.playwright_pages_per_browser,
+            headless=settings.playwright_headless
+        )
+    return _browser_pool
+
+
+async def browser_pool_health() -> Optional[Dict[str, Any]]:
+    """
+    Check the process-wide browser pool without creating it.
+
+    Returns:
+        Pool health summary, or None if no Playwright crawl has run yet
+    """
+    if _browser_pool is None:
+        return None
+    return await _browser_pool.health_check()
+
+
+async def close_browser_pool():
+    """Close the process-wide browser pool, if it was created."""
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
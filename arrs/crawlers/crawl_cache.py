@@ -0,0 +1,241 @@
+"""Cache of recently crawled pages: in-memory LRU in front of a SQLite/blob store tier."""
+import copy
+import dataclasses
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from arrs.models.crawled_content import CrawledContent
+from arrs.storage.blob_store import BlobStore
+from arrs.storage.database import Database
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+# Crawl methods in the order the orchestrator tries them
+CRAWL_METHODS = ("beautifulsoup", "playwright")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for cache lookups.
+
+    Lowercases scheme and host, drops default ports and fragments, and
+    sorts query parameters, so trivially different spellings share an entry.
+
+    Args:
+        url: URL as submitted
+
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    netloc = host if parts.port in (None, _DEFAULT_PORTS.get(scheme)) else f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def make_crawl_key(url: str, crawl_method: str) -> str:
+    """
+    Build the cache key for a crawl.
+
+    Args:
+        url: Requested URL
+        crawl_method: Crawler that fetched the page
+
+    Returns:
+        Hex digest identifying the crawl
+    """
+    return hashlib.sha256(f"{crawl_method} {normalize_url(url)}".encode("utf-8")).hexdigest()
+
+
+class CrawlCache:
+    """Crawl cache with TTL expiry and LRU size bounds on both tiers."""
+
+    # Shared across instances because an orchestrator (and its cache) may be
+    # built per request; entries are (stored_at, content without analysis IDs)
+    _memory: "OrderedDict[str, Tuple[float, CrawledContent]]" = OrderedDict()
+
+    def __init__(
+        self,
+        database: Database,
+        blob_store: BlobStore,
+        ttl_seconds: float = 3600,
+        memory_entries: int = 128,
+        max_entries: int = 10000
+    ):
+        """
+        Initialize crawl cache.
+
+        Args:
+            database: Database holding the crawl_cache table
+            blob_store: Blob store holding the cached HTML
+            ttl_seconds: Age after which a cached crawl is ignored
+            memory_entries: Pages kept in the in-memory tier
+            max_entries: Entries kept on disk before least recently used ones are evicted
+        """
+        self.db = database
+        self.blob_store = blob_store
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+
+    async def get(
+        self,
+        url: str,
+        analysis_id: str,
+        methods: Sequence[str] = CRAWL_METHODS
+    ) -> Optional[CrawledContent]:
+        """
+        Look up a fresh crawl of a URL by any of the given methods.
+
+        Args:
+            url: Requested URL
+            analysis_id: Analysis the returned content is attributed to
+            methods: Crawl methods to accept, in order of preference
+
+        Returns:
+            Copy of the cached content, or None on a miss
+        """
+        now = time.time()
+        for method in methods:
+            key = make_crawl_key(url, method)
+            cached = self._memory_get(key, now)
+            if cached is None:
+                cached = await self._disk_get(key, now)
+            if cached is not None:
+                logger.info("Crawl cache hit", extra={"url": url, "crawl_method": method})
+                # Deep copy: callers may fill in the parsed fields
+                return dataclasses.replace(copy.deepcopy(cached), id=str(uuid.uuid4()), analysis_id=analysis_id)
+        return None
+
+    async def set(self, url: str, content: CrawledContent):
+        """
+        Store a crawl and evict expired and least recently used entries.
+
+        Args:
+            url: Requested URL (content.url is the final URL after redirects)
+            content: Crawled content with HTML
+        """
+        now = time.time()
+        key = make_crawl_key(url, content.crawl_method)
+        content_hash = await self.blob_store.put(content.html_content)
+
+        await self.db.execute(
+            """INSERT OR REPLACE INTO crawl_cache
+               (key, url, crawl_method, final_url, status_code, content_hash,
+                crawled_at, created_at, last_accessed_at, hit_count)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)""",
+            (
+                key, normalize_url(url), content.crawl_method, content.url, content.status_code,
+                content_hash, content.crawled_at.isoformat(), now, now
+            )
+        )
+        self._memory_put(key, now, dataclasses.replace(
+            copy.deepcopy(content), id="", analysis_id="", content_hash=content_hash
+        ))
+        await self._evict(now)
+
+    def _memory_get(self, key: str, now: float) -> Optional[CrawledContent]:
+        """In-memory lookup; expired entries are dropped."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        stored_at, content = entry
+        if stored_at < now - self.ttl_seconds:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return content
+
+    def _memory_put(self, key: str, stored_at: float, content: CrawledContent):
+        """Add to the in-memory tier, evicting least recently used pages."""
+        self._memory[key] = (stored_at, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _disk_get(self, key: str, now: float) -> Optional[CrawledContent]:
+        """Disk lookup; a hit is promoted to the in-memory tier."""
+        row = await self.db.fetch_one(
+            "SELECT * FROM crawl_cache WHERE key = ? AND created_at >= ?",
+            (key, now - self.ttl_seconds)
+        )
+        if not row:
+            return None
+
+        html_content = await self.blob_store.get_text(row["content_hash"])
+        if html_content is None:
+            logger.warning("Cached crawl blob missing", extra={"content_hash": row["content_hash"]})
+            await self.db.execute("DELETE FROM crawl_cache WHERE key = ?", (key,))
+            return None
+
+        await self.db.execute(
+            "UPDATE crawl_cache SET last_accessed_at = ?, hit_count = hit_count + 1 WHERE key = ?",
+            (now, key)
+        )
+        content = CrawledContent(
+            id="",
+            analysis_id="",
+            url=row["final_url"],
+            html_content=html_content,
+            crawled_at=datetime.fromisoformat(row["crawled_at"]),
+            crawl_method=row["crawl_method"],
+            status_code=row["status_code"],
+            content_hash=row["content_hash"]
+        )
+        self._memory_put(key, row["created_at"], content)
+        return content
+
+    async def _evict(self, now: float):
+        """Drop expired entries and trim the table to max_entries (blobs are shared and kept)."""
+        await self.db.execute(
+            "DELETE FROM crawl_cache WHERE created_at < ?",
+            (now - self.ttl_seconds,)
+        )
+        await self.db.execute(
+            """DELETE FROM crawl_cache WHERE key IN (
+                   SELECT key FROM crawl_cache
+                   ORDER BY last_accessed_at DESC
+                   LIMIT -1 OFFSET ?
+               )""",
+            (self.max_entries,)
+        )
+
+    async def clear(self):
+        """Remove every cached crawl."""
+        self._memory.clear()
+        await self.db.execute("DELETE FROM crawl_cache")
+
+
+def build_crawl_cache(database: Database, blob_store: BlobStore) -> Optional[CrawlCache]:
+    """
+    Create the crawl cache configured in settings.
+
+    Args:
+        database: Database holding the crawl_cache table
+        blob_store: Blob store holding the cached HTML
+
+    Returns:
+        Crawl cache, or None when caching is disabled
+    """
+    if not settings.enable_caching:
+        return None
+
+    return CrawlCache(
+        database,
+        blob_store,
+        ttl_seconds=settings.crawl_cache_ttl_minutes * 60,
+        memory_entries=settings.crawl_cache_memory_entries,
+        max_entries=settings.crawl_cache_max_entries
+    )
@@ -0,0 +1,207 @@
+"""Per-domain crawl history, persisted so later crawls of a domain can use it."""
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+from arrs.crawlers.render_detector import DOMAIN_RENDER_RATE, MIN_DOMAIN_CHECKS, RenderDecision
+from arrs.storage.database import Database
+from arrs.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Crawl methods and the column prefix of their stats
+CRAWL_METHOD_COLUMNS = {"beautifulsoup": "static", "playwright": "browser"}
+
+# Weight of the newest fetch in the block rate and latency moving averages
+MOVING_AVERAGE_WEIGHT = 0.3
+
+# Static block rate (over at least MIN_STATIC_ATTEMPTS fetches) from which a
+# Playwright-preferring domain skips the static crawler
+BLOCK_RATE_THRESHOLD = 0.5
+MIN_STATIC_ATTEMPTS = 2
+
+# Static block rate from which a domain counts as flaky
+FLAKY_BLOCK_RATE = 0.1
+
+RECORD_CRAWL_SQL = """INSERT INTO domain_profiles
+   (domain, preferred_method, {prefix}_attempts, {prefix}_block_rate, {prefix}_latency_ms, {probed_column}updated_at)
+   VALUES (?, ?, 1, ?, ?, {probed_value}?)
+   ON CONFLICT(domain) DO UPDATE SET
+       preferred_method = COALESCE(excluded.preferred_method, preferred_method),
+       {prefix}_attempts = {prefix}_attempts + 1,
+       {prefix}_block_rate = {prefix}_block_rate * (1 - {weight}) + excluded.{prefix}_block_rate * {weight},
+       {prefix}_latency_ms = COALESCE(
+           {prefix}_latency_ms * (1 - {weight}) + excluded.{prefix}_latency_ms * {weight},
+           excluded.{prefix}_latency_ms,
+           {prefix}_latency_ms
+       ),
+       {probed_update}updated_at = excluded.updated_at"""
+
+# Per crawl method; only static fetches count as probes
+RECORD_CRAWL_SQLS = {
+    method: RECORD_CRAWL_SQL.format(
+        prefix=prefix,
+        weight=MOVING_AVERAGE_WEIGHT,
+        probed_column="last_probed_at, " if prefix == "static" else "",
+        probed_value="?, " if prefix == "static" else "",
+        probed_update="last_probed_at = excluded.last_probed_at,\n       " if prefix == "static" else ""
+    )
+    for method, prefix in CRAWL_METHOD_COLUMNS.items()
+}
+
+RECORD_RENDER_DECISION_SQL = """INSERT INTO domain_profiles
+   (domain, render_checks, render_needed, last_render_reason, updated_at)
+   VALUES (?, 1, ?, ?, ?)
+   ON CONFLICT(domain) DO UPDATE SET
+       render_checks = render_checks + 1,
+       render_needed = render_needed + excluded.render_needed,
+       last_render_reason = excluded.last_render_reason,
+       updated_at = excluded.updated_at"""
+
+
+def domain_of(url: str) -> str:
+    """
+    Domain a URL's profile is kept under.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        Lowercased host name (without port)
+    """
+    return (urlsplit(url).hostname or "").lower()
+
+
+@dataclass
+class DomainProfile:
+    """What earlier crawls learned about a domain."""
+    domain: str
+    render_checks: int = 0
+    render_needed: int = 0
+    last_render_reason: Optional[str] = None
+    updated_at: Optional[float] = None
+    preferred_method: Optional[str] = None
+    static_attempts: int = 0
+    static_block_rate: float = 0.0
+    static_latency_ms: Optional[float] = None
+    browser_attempts: int = 0
+    browser_block_rate: float = 0.0
+    browser_latency_ms: Optional[float] = None
+    last_probed_at: Optional[float] = None
+
+    @property
+    def render_rate(self) -> float:
+        """Share of checked pages that needed a browser render."""
+        return self.render_needed / self.render_checks if self.render_checks else 0.0
+
+    @property
+    def usually_needs_render(self) -> bool:
+        """Enough pages were checked and most of them needed a render."""
+        return self.render_checks >= MIN_DOMAIN_CHECKS and self.render_rate >= DOMAIN_RENDER_RATE
+
+    @property
+    def static_uncertain(self) -> bool:
+        """Too few static fetches to know the domain, or recent ones failed."""
+        return self.static_attempts < MIN_STATIC_ATTEMPTS or self.static_block_rate >= FLAKY_BLOCK_RATE
+
+    def skips_static(self, reprobe_seconds: float) -> bool:
+        """
+        Whether to crawl with Playwright without trying the static crawler first.
+
+        True when the domain mostly blocks static fetches and Playwright
+        worked last time, until the static crawler is due for a re-probe.
+
+        Args:
+            reprobe_seconds: How long after the last static attempt to try it again
+
+        Returns:
+            True to go straight to Playwright
+        """
+        return (
+            self.preferred_method == "playwright"
+            and self.static_attempts >= MIN_STATIC_ATTEMPTS
+            and self.static_block_rate >= BLOCK_RATE_THRESHOLD
+            and self.last_probed_at is not None
+            and time.time() - self.last_probed_at < reprobe_seconds
+        )
+
+
+class DomainProfileStore:
+    """Reads and updates the domain_profiles table."""
+
+    def __init__(self, database: Database):
+        """
+        Initialize domain profile store.
+
+        Args:
+            database: Database holding the domain_profiles table
+        """
+        self.db = database
+
+    async def get(self, url: str) -> DomainProfile:
+        """
+        Get the profile of a URL's domain.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Stored profile, or an empty one for an unseen domain
+        """
+        domain = domain_of(url)
+        row = await self.db.fetch_one("SELECT * FROM domain_profiles WHERE domain = ?", (domain,))
+        if not row:
+            return DomainProfile(domain=domain)
+
+        return DomainProfile(
+            domain=row["domain"],
+            render_checks=row["render_checks"],
+            render_needed=row["render_needed"],
+            last_render_reason=row["last_render_reason"],
+            updated_at=row["updated_at"],
+            preferred_method=row["preferred_method"],
+            static_attempts=row["static_attempts"],
+            static_block_rate=row["static_block_rate"],
+            static_latency_ms=row["static_latency_ms"],
+            browser_attempts=row["browser_attempts"],
+            browser_block_rate=row["browser_block_rate"],
+            browser_latency_ms=row["browser_latency_ms"],
+            last_probed_at=row["last_probed_at"]
+        )
+
+    async def record_crawl(self, url: str, crawl_method: str, succeeded: bool, latency_ms: Optional[float] = None):
+        """
+        Update a domain's stats for one fetch attempt.
+
+        Args:
+            url: Page URL
+            crawl_method: "beautifulsoup" or "playwright"
+            succeeded: Whether the fetch returned a page
+            latency_ms: Fetch duration (successful fetches only)
+        """
+        now = time.time()
+        params = [
+            domain_of(url),
+            crawl_method if succeeded else None,
+            0.0 if succeeded else 1.0,
+            latency_ms if succeeded else None
+        ]
+        if CRAWL_METHOD_COLUMNS[crawl_method] == "static":
+            params.append(now)
+        params.append(now)
+        await self.db.execute(RECORD_CRAWL_SQLS[crawl_method], tuple(params))
+
+    async def record_render_decision(self, url: str, decision: RenderDecision):
+        """
+        Count a render decision for a URL's domain.
+
+        Args:
+            url: Page URL
+            decision: Render detector outcome for the page
+        """
+        await self.db.execute(RECORD_RENDER_DECISION_SQL, (
+            domain_of(url),
+            int(decision.needs_render),
+            decision.reason,
+            time.time()
+        ))
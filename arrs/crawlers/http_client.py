@@ -0,0 +1,156 @@
+"""Shared, pooled HTTP client for crawlers and auxiliary fetches."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import httpx
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+
+class SharedHTTPClient:
+    """Long-lived httpx client with keep-alive, HTTP/2 and per-host limits."""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        max_connections_per_host: int = 6,
+        http2: bool = True
+    ):
+        """
+        Initialize shared client.
+
+        Args:
+            timeout: Default request timeout in seconds
+            max_connections: Maximum open connections across all hosts
+            max_keepalive_connections: Maximum idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            max_connections_per_host: Maximum concurrent requests per host
+            http2: Negotiate HTTP/2 where the server supports it
+        """
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Dict[str, int] = {}  # requests holding or awaiting each slot
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Underlying httpx client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                follow_redirects=True
+            )
+            logger.info("HTTP client created", extra={
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "max_connections_per_host": self.max_connections_per_host
+            })
+        return self._client
+
+    @asynccontextmanager
+    async def host_slot(self, url: str):
+        """
+        Hold one of the per-host request slots for the duration of the block.
+
+        A host's semaphore is dropped once no request holds or awaits it, so
+        crawling many hosts does not accumulate one per host.
+
+        Args:
+            url: Request URL (only the host is used)
+        """
+        host = urlsplit(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_slots[host] = slot
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+
+        try:
+            async with slot:
+                yield
+        finally:
+            # close() may have dropped the slot while this request held it
+            if self._host_slots.get(host) is slot:
+                self._host_users[host] -= 1
+                if not self._host_users[host]:
+                    del self._host_slots[host]
+                    del self._host_users[host]
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the pooled client.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to httpx
+
+        Returns:
+            HTTP response
+        """
+        async with self.host_slot(url):
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self):
+        """Close all pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("HTTP client closed")
+        self._client = None
+        self._host_slots.clear()
+        self._host_users.clear()
+
+
+# Process-wide client shared by the orchestrator, crawlers and simulators
+_shared_client: Optional[SharedHTTPClient] = None
+
+
+def get_http_client() -> SharedHTTPClient:
+    """
+    Get the process-wide shared HTTP client.
+
+    Returns:
+        Shared HTTP client
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = SharedHTTPClient(
+            timeout=settings.crawler_timeout,
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            max_connections_per_host=settings.http_max_connections_per_host,
+            http2=settings.http_enable_http2
+        )
+    return _shared_client
+
+
+async def close_http_client():
+    """Close the process-wide shared HTTP client, if it was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
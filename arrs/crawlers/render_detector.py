@@ -0,0 +1,128 @@
+"""Cheap post-fetch check for pages that only show content after JavaScript runs."""
+import re
+from dataclasses import dataclass, field
+from typing import List
+from urllib.parse import urlsplit
+
+# Visible body text (characters) below which a page counts as empty / sparse
+EMPTY_TEXT_CHARS = 50
+SPARSE_TEXT_CHARS = 500
+
+# Visible text per byte of HTML below which markup dwarfs content
+MIN_TEXT_RATIO = 0.02
+
+# Share of a domain's checked pages needing a render above which sparse
+# pages of that domain are rendered too (once enough pages were checked)
+DOMAIN_RENDER_RATE = 0.8
+MIN_DOMAIN_CHECKS = 3
+
+_INVISIBLE_RE = re.compile(
+    r"<(script|style|noscript|template|svg)\b[^>]*>.*?</\1\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BODY_RE = re.compile(r"<body\b[^>]*>(.*)", re.IGNORECASE | re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# First hostname labels of app subdomains (app.example.com, www.my.example.com)
+_APP_SUBDOMAINS = frozenset({"app", "my", "account"})
+
+# (signal name, pattern) for client-side app shells and bundles
+_BUNDLE_SIGNATURES = [
+    ("empty_mount_point", re.compile(
+        r"<div[^>]+id=[\"'](?:root|app|__next|__nuxt|___gatsby|svelte)[\"'][^>]*>\s*</div>",
+        re.IGNORECASE
+    )),
+    ("angular_root", re.compile(r"<app-root[^>]*>\s*</app-root>|\bng-version=", re.IGNORECASE)),
+    ("react", re.compile(r"data-reactroot|__NEXT_DATA__|/_next/static/", re.IGNORECASE)),
+    ("vue", re.compile(r"window\.__NUXT__|data-v-app|/_nuxt/", re.IGNORECASE)),
+    ("hashed_bundle", re.compile(
+        r"<script[^>]+src=[\"'][^\"']*(?:main|app|bundle|chunk|runtime|vendors?)[.-][0-9a-f]{6,}[^\"']*\.js",
+        re.IGNORECASE
+    )),
+    ("noscript_warning", re.compile(
+        r"<noscript[^>]*>[^<]*(?:enable|requires?)\s+javascript",
+        re.IGNORECASE
+    )),
+]
+
+
+@dataclass
+class RenderDecision:
+    """Whether a fetched page needs a browser render, and why."""
+    needs_render: bool
+    reason: str
+    text_length: int
+    text_ratio: float
+    signals: List[str] = field(default_factory=list)
+
+
+def visible_text_length(html: str) -> int:
+    """
+    Length of the text a reader would see in the body, ignoring markup.
+
+    Args:
+        html: Raw HTML
+
+    Returns:
+        Number of visible characters (whitespace collapsed)
+    """
+    body = _BODY_RE.search(html)
+    text = _INVISIBLE_RE.sub(" ", body.group(1) if body else html)
+    text = _TAG_RE.sub(" ", text)
+    return len(_WHITESPACE_RE.sub(" ", text).strip())
+
+
+def looks_like_app_url(url: str) -> bool:
+    """
+    Whether a URL looks like a client-side app, before fetching it.
+
+    Only the subdomain is considered; sites whose pages need a render
+    without saying so in the hostname are caught by the per-domain render
+    rate instead.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        True for app subdomains
+    """
+    # urlsplit only finds the host after "//"
+    host = urlsplit(url if "//" in url else f"//{url}").hostname or ""
+    labels = host.split(".")
+    if labels[0] == "www":
+        labels = labels[1:]
+    # A bare registered domain (app.com) is not a subdomain
+    return len(labels) > 2 and labels[0] in _APP_SUBDOMAINS
+
+
+def detect_render_need(html: str, render_prior: bool = False) -> RenderDecision:
+    """
+    Decide whether statically fetched HTML needs a JavaScript render.
+
+    Uses only regexes over the raw HTML, so it is cheap enough to run on
+    every fetch. A page needs a render when it has no body text, or when it
+    looks like an app shell (bundle signatures) with little text.
+
+    Args:
+        html: Raw HTML from the static crawler
+        render_prior: The URL or its domain is known to need rendering, so
+            sparse pages are rendered even without bundle signatures
+
+    Returns:
+        Render decision
+    """
+    text_length = visible_text_length(html)
+    text_ratio = text_length / len(html) if html else 0.0
+    signals = [name for name, pattern in _BUNDLE_SIGNATURES if pattern.search(html)]
+
+    def decide(needs_render: bool, reason: str) -> RenderDecision:
+        return RenderDecision(needs_render, reason, text_length, round(text_ratio, 4), signals)
+
+    if text_length < EMPTY_TEXT_CHARS:
+        return decide(True, "no_body_text")
+    if signals and (text_length < SPARSE_TEXT_CHARS or text_ratio < MIN_TEXT_RATIO):
+        return decide(True, "app_shell")
+    if render_prior and text_length < SPARSE_TEXT_CHARS:
+        return decide(True, "sparse_text_on_rendered_domain")
+    return decide(False, "static_content")
@@ -0,0 +1,134 @@
+"""HTTP validators (ETag / Last-Modified) of earlier crawls, for conditional re-crawls."""
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+import httpx
+from arrs.crawlers.crawl_cache import normalize_url
+from arrs.storage.blob_store import BlobStore
+from arrs.storage.database import Database
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+UPSERT_VALIDATORS_SQL = """INSERT OR REPLACE INTO page_validators
+   (url, final_url, etag, last_modified, content_hash, status_code, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
+@dataclass
+class PageValidators:
+    """Validators of the last full response for a URL, and where its body is stored."""
+    url: str
+    final_url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    status_code: int
+
+    def request_headers(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating the stored body."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    """Keeps validators per normalized URL; bodies live in the blob store."""
+
+    def __init__(self, database: Database, blob_store: BlobStore):
+        """
+        Initialize validator store.
+
+        Args:
+            database: Database holding the page_validators table
+            blob_store: Blob store holding the response bodies
+        """
+        self.db = database
+        self.blob_store = blob_store
+
+    async def get(self, url: str) -> Optional[PageValidators]:
+        """
+        Get the validators stored for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Validators, or None if the URL was never fetched with any
+        """
+        row = await self.db.fetch_one(
+            "SELECT * FROM page_validators WHERE url = ?",
+            (normalize_url(url),)
+        )
+        if not row:
+            return None
+
+        return PageValidators(
+            url=row["url"],
+            final_url=row["final_url"],
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            content_hash=row["content_hash"],
+            status_code=row["status_code"]
+        )
+
+    async def save(self, url: str, response: httpx.Response, html_content: str) -> Optional[str]:
+        """
+        Store the body and validators of a full response.
+
+        A response without validators drops any stored for the URL, since
+        the server no longer offers them.
+
+        Args:
+            url: Requested URL
+            response: Successful response
+            html_content: Response body
+
+        Returns:
+            Content hash of the stored body, or None if there was nothing to store
+        """
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            await self.forget(url)
+            return None
+
+        content_hash = await self.blob_store.put(html_content)
+        await self.db.execute(UPSERT_VALIDATORS_SQL, (
+            normalize_url(url),
+            str(response.url),
+            etag,
+            last_modified,
+            content_hash,
+            response.status_code,
+            time.time()
+        ))
+        return content_hash
+
+    async def load_html(self, validators: PageValidators) -> Optional[str]:
+        """Load the stored body of a revalidated page (None if the blob is gone)."""
+        return await self.blob_store.get_text(validators.content_hash)
+
+    async def forget(self, url: str):
+        """Drop the validators of a URL."""
+        await self.db.execute("DELETE FROM page_validators WHERE url = ?", (normalize_url(url),))
+
+
+def build_validator_store(database: Database, blob_store: BlobStore) -> Optional[ValidatorStore]:
+    """
+    Create the validator store configured in settings.
+
+    Args:
+        database: Database holding the page_validators table
+        blob_store: Blob store holding the response bodies
+
+    Returns:
+        Validator store, or None when revalidation is disabled
+    """
+    if not (settings.enable_caching and settings.crawl_revalidate):
+        return None
+    return ValidatorStore(database, blob_store)
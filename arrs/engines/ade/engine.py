@@ -15,7 +15,7 @@ logger = setup_logger(__name__)
 class ADEEngine(BaseEngine):
     """Attribute Density Engine."""
 
-    async def analyze(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
+    def evaluate(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
         """
         Analyze attribute density.
 
@@ -134,7 +134,7 @@ class ADEEngine(BaseEngine):
         # Max score at 5 or more spec mentions
         return min(10.0, spec_mentions * 2.0)
 
-    async def identify_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
+    def find_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
         """Identify attribute density gaps."""
         gaps = []
         analysis_id = score.analysis_id
@@ -16,7 +16,7 @@ logger = setup_logger(__name__)
 class ARCEEngine(BaseEngine):
     """AI Readability & Composability Engine."""
 
-    async def analyze(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
+    def evaluate(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
         """
         Analyze AI readability and composability.
 
@@ -153,7 +153,7 @@ class ARCEEngine(BaseEngine):
 
         return score
 
-    async def identify_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
+    def find_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
         """Identify readability and composability gaps."""
         gaps = []
         analysis_id = score.analysis_id
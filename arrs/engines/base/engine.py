@@ -5,6 +5,7 @@ import uuid
 from datetime import datetime
 from arrs.models.score_result import EngineScore, Gap
 from arrs.models.crawled_content import CrawledContent
+from arrs.core.executor import run_cpu_bound
 from arrs.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -13,6 +14,10 @@ logger = setup_logger(__name__)
 class BaseEngine(ABC):
     """Abstract base class for all scoring engines."""
 
+    # Bump when scoring or gap logic changes: stored results of other
+    # versions are recomputed instead of reused for unchanged pages
+    version = 1
+
     def __init__(self, weight: float):
         """
         Initialize engine.
@@ -25,9 +30,9 @@ class BaseEngine(ABC):
         logger.info(f"Initialized {self.name} engine", extra={"weight": weight})
 
     @abstractmethod
-    async def analyze(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
+    def evaluate(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
         """
-        Analyze content and generate score.
+        Score content synchronously (CPU-bound, may run in a worker process).
 
         Args:
             content: Crawled content
@@ -42,9 +47,9 @@ class BaseEngine(ABC):
         pass
 
     @abstractmethod
-    async def identify_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
+    def find_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
         """
-        Identify gaps and generate recommendations.
+        Identify gaps synchronously (CPU-bound, may run in a worker process).
 
         Args:
             score: Engine score
@@ -55,6 +60,35 @@ class BaseEngine(ABC):
         """
         pass
 
+    async def analyze(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
+        """
+        Analyze content and generate score in the CPU process pool.
+
+        Args:
+            content: Crawled content (HTML is not needed and should be stripped)
+            parsed_data: Parsed HTML and schema data
+
+        Returns:
+            Engine score result
+
+        Raises:
+            Exception: If analysis fails
+        """
+        return await run_cpu_bound(self.evaluate, content, parsed_data)
+
+    async def identify_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
+        """
+        Identify gaps and generate recommendations in the CPU process pool.
+
+        Args:
+            score: Engine score
+            parsed_data: Parsed data
+
+        Returns:
+            List of identified gaps
+        """
+        return await run_cpu_bound(self.find_gaps, score, parsed_data)
+
     def normalize_score(self, raw_score: float, max_score: float) -> float:
         """
         Normalize score to 0-100 range.
@@ -91,7 +125,8 @@ class BaseEngine(ABC):
             score=score,
             weight=self.weight,
             details=details,
-            calculated_at=datetime.now()
+            calculated_at=datetime.now(),
+            scoring_version=self.version
         )
 
     def create_gap(
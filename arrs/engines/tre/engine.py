@@ -15,7 +15,7 @@ logger = setup_logger(__name__)
 class TREEngine(BaseEngine):
     """Transaction Readiness Engine."""
 
-    async def analyze(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
+    def evaluate(self, content: CrawledContent, parsed_data: Dict[str, Any]) -> EngineScore:
         """
         Analyze transaction readiness.
 
@@ -179,7 +179,7 @@ class TREEngine(BaseEngine):
 
         return score
 
-    async def identify_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
+    def find_gaps(self, score: EngineScore, parsed_data: Dict[str, Any]) -> List[Gap]:
         """Identify transaction readiness gaps."""
         gaps = []
         analysis_id = score.analysis_id
@@ -14,6 +14,7 @@ class CrawledContent:
     crawled_at: datetime
     crawl_method: str  # 'beautifulsoup' or 'playwright'
     status_code: int
+    content_hash: Optional[str] = None  # Blob store key of the raw HTML
 
     # Parsed content (populated by parsers)
     text_content: Optional[str] = None
@@ -33,6 +34,7 @@ class CrawledContent:
             "crawled_at": self.crawled_at.isoformat(),
             "crawl_method": self.crawl_method,
             "status_code": self.status_code,
+            "content_hash": self.content_hash,
             "text_content": self.text_content,
             "schema_data": self.schema_data,
             "metadata": self.metadata,
@@ -52,6 +54,7 @@ class CrawledContent:
             crawled_at=datetime.fromisoformat(data["crawled_at"]),
             crawl_method=data["crawl_method"],
             status_code=data["status_code"],
+            content_hash=data.get("content_hash"),
             text_content=data.get("text_content"),
             schema_data=data.get("schema_data", {}),
             metadata=data.get("metadata", {}),
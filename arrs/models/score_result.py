@@ -14,6 +14,8 @@ class EngineScore:
     weight: float
     details: Dict[str, Any] = field(default_factory=dict)
     calculated_at: datetime = field(default_factory=datetime.now)
+    scoring_version: Optional[int] = None  # Version of the engine that computed the score
+    reused_from: Optional[str] = None  # Analysis that computed a copied score
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -24,7 +26,9 @@ class EngineScore:
             "score": self.score,
             "weight": self.weight,
             "details": self.details,
-            "calculated_at": self.calculated_at.isoformat()
+            "calculated_at": self.calculated_at.isoformat(),
+            "scoring_version": self.scoring_version,
+            "reused_from": self.reused_from
         }
 
     @classmethod
@@ -37,7 +41,9 @@ class EngineScore:
             score=data["score"],
             weight=data["weight"],
             details=data.get("details", {}),
-            calculated_at=datetime.fromisoformat(data["calculated_at"])
+            calculated_at=datetime.fromisoformat(data["calculated_at"]),
+            scoring_version=data.get("scoring_version"),
+            reused_from=data.get("reused_from")
         )
 
 
@@ -51,6 +57,7 @@ class Gap:
     description: str
     recommendation: str
     engine_source: str
+    reused_from: Optional[str] = None  # Analysis that found a copied gap
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -61,7 +68,8 @@ class Gap:
             "severity": self.severity,
             "description": self.description,
             "recommendation": self.recommendation,
-            "engine_source": self.engine_source
+            "engine_source": self.engine_source,
+            "reused_from": self.reused_from
         }
 
     @classmethod
@@ -74,5 +82,6 @@ class Gap:
             severity=data["severity"],
             description=data["description"],
             recommendation=data["recommendation"],
-            engine_source=data["engine_source"]
+            engine_source=data["engine_source"],
+            reused_from=data.get("reused_from")
         )
@@ -0,0 +1,49 @@
+"""Shared parsed document for the HTML and schema parsers."""
+import lxml.html
+from lxml.html import HtmlElement
+from extruct.xmldom import XmlDomHTMLParser
+from arrs.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Parse backends reported in analysis metadata
+BACKEND_LXML = "lxml"
+BACKEND_EMPTY = "empty"
+
+_EMPTY_DOCUMENT = b"<html><head></head><body></body></html>"
+
+
+def _parse_html(html: bytes) -> HtmlElement:
+    """Parse with extruct's DOM parser; huge_tree lifts libxml2's 256-level depth cap."""
+    parser = XmlDomHTMLParser(encoding="UTF-8", huge_tree=True)
+    return lxml.html.fromstring(html, parser=parser)
+
+
+class ParsedDocument:
+    """HTML parsed once into an lxml tree that every parser reads from."""
+
+    def __init__(self, html: str, base_url: str):
+        """
+        Parse HTML.
+
+        The tree is built with extruct's DOM-compatible lxml parser so the
+        same tree can be handed to extruct (including its RDFa extractor).
+
+        Args:
+            html: Raw HTML content
+            base_url: Base URL for resolving relative links
+        """
+        self.html = html
+        self.base_url = base_url
+
+        try:
+            tree = _parse_html(html.encode("utf-8"))
+            self.backend = BACKEND_LXML
+        except Exception as e:
+            # lxml refuses empty documents; fall back to an empty tree
+            logger.warning(f"HTML parsing failed, using empty document: {e}")
+            tree = _parse_html(_EMPTY_DOCUMENT)
+            self.backend = BACKEND_EMPTY
+
+        # Fragments parse to their first element; always keep the <html> root
+        self.tree: HtmlElement = tree.getroottree().getroot()
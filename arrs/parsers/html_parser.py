@@ -1,26 +1,194 @@
 """HTML parsing utilities."""
-from typing import Dict, List, Any
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin
+from lxml.html import HtmlElement
+from arrs.parsers.document import ParsedDocument
 from arrs.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Elements whose strings are not document text (matches BeautifulSoup's get_text)
+NON_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# Elements additionally excluded from the page text content
+HIDDEN_TEXT_TAGS = frozenset(['noscript'])
+
+HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+SEMANTIC_TAGS = [
+    'article', 'section', 'nav', 'aside', 'header', 'footer',
+    'main', 'figure', 'figcaption', 'mark', 'time'
+]
+
+
+class _PageVisitor:
+    """Collects every field HTMLParser reports in one walk over the tree."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+        self.title: Optional[str] = None
+        self.meta_description: Optional[str] = None
+        self.headings: Dict[int, List[Dict[str, str]]] = {level: [] for level in range(1, 7)}
+        self.images: List[Dict[str, str]] = []
+        self.links: List[str] = []
+        self.text_parts: List[str] = []
+        self.has_json_ld = False
+        self.has_microdata = False
+        self.has_open_graph = False
+        self.semantic_counts: Dict[str, int] = {tag: 0 for tag in SEMANTIC_TAGS}
+        self.og_tags: List[tuple] = []
+        self.twitter_tags: List[tuple] = []
+        self.canonical_url: Optional[str] = None
+
+        # Walk state
+        self._non_text_depth = 0
+        self._hidden_depth = 0
+        self._collectors: List[List[str]] = []
+        self._title_parts: Optional[List[str]] = None
+
+    def visit(self, root: HtmlElement):
+        """
+        Walk the tree once without mutating it.
+
+        Text and tails are emitted in document order so the collected text
+        matches what a recursive get_text() would produce.
+        """
+        stack = [(root, False, None)]
+
+        while stack:
+            element, exiting, collector = stack.pop()
+
+            if exiting:
+                tag = element.tag
+                if collector is not None:
+                    self._collectors.pop()
+                if tag in NON_TEXT_TAGS:
+                    self._non_text_depth -= 1
+                if tag in HIDDEN_TEXT_TAGS:
+                    self._hidden_depth -= 1
+                if element is not root and element.tail:
+                    self._emit(element.tail)
+                continue
+
+            # Comments and processing instructions only contribute their tail
+            if not isinstance(element.tag, str):
+                if element.tail:
+                    self._emit(element.tail)
+                continue
+
+            collector = self._enter(element)
+            if element.text:
+                self._emit(element.text)
+
+            stack.append((element, True, collector))
+            for child in reversed(element):
+                stack.append((child, False, None))
+
+        if self._title_parts is not None:
+            self.title = ''.join(self._title_parts)
+
+    def _emit(self, text: str):
+        """Route a text node to the page text and any open heading/title."""
+        if self._non_text_depth:
+            return
+
+        if self._collectors:
+            stripped = text.strip()
+            if stripped:
+                for parts in self._collectors:
+                    parts.append(stripped)
+
+        if not self._hidden_depth:
+            self.text_parts.append(text)
+
+    def _enter(self, element: HtmlElement) -> Optional[List[str]]:
+        """Record an element; returns a text collector if one was opened."""
+        tag = element.tag
+        collector = None
+
+        if tag in NON_TEXT_TAGS:
+            self._non_text_depth += 1
+        if tag in HIDDEN_TEXT_TAGS:
+            self._hidden_depth += 1
+
+        if element.get('itemscope') is not None:
+            self.has_microdata = True
+
+        if tag in HEADING_TAGS:
+            collector = []
+            self.headings[int(tag[1])].append({"level": tag, "parts": collector})
+
+        elif tag == 'title':
+            if self._title_parts is None:
+                collector = self._title_parts = []
+
+        elif tag == 'meta':
+            name = element.get('name', '')
+            prop = element.get('property', '')
+            if name == 'description' and self.meta_description is None:
+                self.meta_description = element.get('content', '')
+            if prop.startswith('og:'):
+                self.has_open_graph = True
+                self.og_tags.append((prop.replace('og:', ''), element.get('content', '')))
+            if name.startswith('twitter:'):
+                self.twitter_tags.append((name.replace('twitter:', ''), element.get('content', '')))
+
+        elif tag == 'img':
+            self.images.append({
+                "src": urljoin(self.base_url, element.get('src', '')),
+                "alt": element.get('alt', ''),
+                "title": element.get('title', ''),
+                "width": element.get('width', ''),
+                "height": element.get('height', '')
+            })
+
+        elif tag == 'a':
+            href = element.get('href')
+            if href is not None:
+                self.links.append(urljoin(self.base_url, href))
+
+        elif tag == 'link':
+            if self.canonical_url is None and 'canonical' in element.get('rel', '').split():
+                self.canonical_url = element.get('href', '')
+
+        elif tag == 'script':
+            if element.get('type') == 'application/ld+json':
+                self.has_json_ld = True
+
+        elif tag in self.semantic_counts:
+            self.semantic_counts[tag] += 1
+
+        if collector is not None:
+            self._collectors.append(collector)
+        return collector
+
 
 class HTMLParser:
     """Parse HTML structure and extract metadata."""
 
-    def __init__(self, html: str, base_url: str):
+    def __init__(self, html: str, base_url: str, document: Optional[ParsedDocument] = None):
         """
         Initialize parser.
 
         Args:
             html: Raw HTML content
             base_url: Base URL for resolving relative links
+            document: Already parsed document to share (parsed here if omitted)
         """
         self.html = html
         self.base_url = base_url
-        self.soup = BeautifulSoup(html, 'lxml')
+        self.document = document or ParsedDocument(html, base_url)
+        self.tree = self.document.tree
+        self._visitor: Optional[_PageVisitor] = None
+
+    @property
+    def _page(self) -> _PageVisitor:
+        """Single-pass collection of all page fields, computed on first use."""
+        if self._visitor is None:
+            self._visitor = _PageVisitor(self.base_url)
+            self._visitor.visit(self.tree)
+        return self._visitor
 
     def parse(self) -> Dict[str, Any]:
         """
@@ -44,27 +212,25 @@ class HTMLParser:
 
     def extract_title(self) -> str:
         """Extract page title."""
-        title_tag = self.soup.find('title')
-        return title_tag.get_text(strip=True) if title_tag else ""
+        return self._page.title or ""
 
     def extract_meta_description(self) -> str:
         """Extract meta description."""
-        meta = self.soup.find('meta', attrs={'name': 'description'})
-        return meta.get('content', '') if meta else ""
+        return self._page.meta_description or ""
 
     def extract_headings(self) -> List[Dict[str, str]]:
         """
         Extract all headings (h1-h6).
 
         Returns:
-            List of heading dictionaries
+            List of heading dictionaries, grouped by level
         """
         headings = []
         for level in range(1, 7):
-            for heading in self.soup.find_all(f'h{level}'):
+            for heading in self._page.headings[level]:
                 headings.append({
-                    "level": f"h{level}",
-                    "text": heading.get_text(strip=True)
+                    "level": heading["level"],
+                    "text": ''.join(heading["parts"])
                 })
         return headings
 
@@ -75,16 +241,7 @@ class HTMLParser:
         Returns:
             List of image dictionaries
         """
-        images = []
-        for img in self.soup.find_all('img'):
-            images.append({
-                "src": urljoin(self.base_url, img.get('src', '')),
-                "alt": img.get('alt', ''),
-                "title": img.get('title', ''),
-                "width": img.get('width', ''),
-                "height": img.get('height', '')
-            })
-        return images
+        return [dict(image) for image in self._page.images]
 
     def extract_links(self) -> List[str]:
         """
@@ -93,49 +250,26 @@ class HTMLParser:
         Returns:
             List of URLs
         """
-        links = []
-        for link in self.soup.find_all('a', href=True):
-            url = urljoin(self.base_url, link['href'])
-            links.append(url)
-        return links
+        return list(self._page.links)
 
     def extract_text(self) -> str:
         """
-        Extract clean text content.
+        Extract clean text content (scripts, styles and noscript excluded).
 
         Returns:
             Clean text
         """
-        # Remove scripts and styles
-        for element in self.soup(['script', 'style', 'noscript']):
-            element.decompose()
-
-        text = self.soup.get_text(separator=' ', strip=True)
+        text = ' '.join(self._page.text_parts)
         return ' '.join(text.split())  # Normalize whitespace
 
     def count_words(self) -> int:
         """Count words in text content."""
-        text = self.extract_text()
-        return len(text.split())
+        return sum(len(part.split()) for part in self._page.text_parts)
 
     def has_structured_data(self) -> bool:
-        """Check if page has structured data."""
-        # Check for JSON-LD
-        json_ld = self.soup.find('script', type='application/ld+json')
-        if json_ld:
-            return True
-
-        # Check for microdata
-        microdata = self.soup.find(attrs={'itemscope': True})
-        if microdata:
-            return True
-
-        # Check for Open Graph
-        og = self.soup.find('meta', property=lambda x: x and x.startswith('og:'))
-        if og:
-            return True
-
-        return False
+        """Check if page has structured data (JSON-LD, microdata or Open Graph)."""
+        page = self._page
+        return page.has_json_ld or page.has_microdata or page.has_open_graph
 
     def count_semantic_elements(self) -> Dict[str, int]:
         """
@@ -144,16 +278,7 @@ class HTMLParser:
         Returns:
             Dictionary of element counts
         """
-        semantic_tags = [
-            'article', 'section', 'nav', 'aside', 'header', 'footer',
-            'main', 'figure', 'figcaption', 'mark', 'time'
-        ]
-
-        counts = {}
-        for tag in semantic_tags:
-            counts[tag] = len(self.soup.find_all(tag))
-
-        return counts
+        return dict(self._page.semantic_counts)
 
     def extract_metadata(self) -> Dict[str, str]:
         """
@@ -165,19 +290,16 @@ class HTMLParser:
         metadata = {}
 
         # Open Graph
-        for og_tag in self.soup.find_all('meta', property=lambda x: x and x.startswith('og:')):
-            key = og_tag.get('property', '').replace('og:', '')
-            metadata[f"og_{key}"] = og_tag.get('content', '')
+        for key, content in self._page.og_tags:
+            metadata[f"og_{key}"] = content
 
         # Twitter Cards
-        for twitter_tag in self.soup.find_all('meta', attrs={'name': lambda x: x and x.startswith('twitter:')}):
-            key = twitter_tag.get('name', '').replace('twitter:', '')
-            metadata[f"twitter_{key}"] = twitter_tag.get('content', '')
+        for key, content in self._page.twitter_tags:
+            metadata[f"twitter_{key}"] = content
 
         # Canonical URL
-        canonical = self.soup.find('link', rel='canonical')
-        if canonical:
-            metadata['canonical_url'] = canonical.get('href', '')
+        if self._page.canonical_url is not None:
+            metadata['canonical_url'] = self._page.canonical_url
 
         return metadata
 
@@ -0,0 +1,45 @@
+"""Full-page parsing stage, runnable in a worker process."""
+from typing import Any, Dict
+from arrs.parsers.document import ParsedDocument
+from arrs.parsers.html_parser import HTMLParser
+from arrs.parsers.schema_parser import SchemaParser
+
+
+def parse_page(html: str, url: str) -> Dict[str, Any]:
+    """
+    Parse a crawled page into the structure consumed by the scoring engines.
+
+    Takes and returns plain picklable values so it can run in the CPU pool.
+
+    Args:
+        html: Raw HTML content
+        url: Page URL (base for relative links)
+
+    Returns:
+        Parsed HTML and schema data
+    """
+    # Parse the page once and share the tree between parsers
+    document = ParsedDocument(html, url)
+
+    # Parse HTML
+    html_parser = HTMLParser(html, url, document=document)
+    html_data = html_parser.parse()
+    html_data["heading_validation"] = html_parser.validate_heading_hierarchy()
+
+    # Parse schema
+    schema_parser = SchemaParser(html, url, document=document)
+    schema_data = {
+        "all_schemas": schema_parser.extract_all_schemas(),
+        "product": schema_parser.find_product_schema(),
+        "organization": schema_parser.find_organization_schema(),
+        "product_validation": schema_parser.validate_product_schema(),
+        "offers": schema_parser.extract_offers(),
+        "reviews": schema_parser.extract_reviews(),
+        "brand": schema_parser.extract_brand_info()
+    }
+
+    return {
+        "html": html_data,
+        "schema": schema_data,
+        "parse_backend": document.backend
+    }
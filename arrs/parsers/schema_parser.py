@@ -1,39 +1,52 @@
 """Schema.org and structured data extraction."""
 import json
 from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
 import extruct
+from arrs.parsers.document import ParsedDocument
 from arrs.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+MICRODATA_SCHEMA_PREFIX = 'http://schema.org/'
+
 
 class SchemaParser:
     """Extract structured data from HTML."""
 
-    def __init__(self, html: str, base_url: str):
+    def __init__(self, html: str, base_url: str, document: Optional[ParsedDocument] = None):
         """
         Initialize parser.
 
         Args:
             html: Raw HTML content
             base_url: Base URL
+            document: Already parsed document to share (parsed here if omitted)
         """
         self.html = html
         self.base_url = base_url
-        self.soup = BeautifulSoup(html, 'lxml')
+        self.document = document or ParsedDocument(html, base_url)
+
+        # Extraction runs once per document; finders read from the type index
+        self._schemas: Optional[Dict[str, Any]] = None
+        self._type_index: Optional[Dict[str, List[Dict[str, Any]]]] = None
 
     def extract_all_schemas(self) -> Dict[str, Any]:
         """
-        Extract all structured data formats.
+        Extract all structured data formats (memoized per document).
 
         Returns:
             Dictionary of extracted data
         """
+        if self._schemas is None:
+            self._schemas = self._extract()
+        return self._schemas
+
+    def _extract(self) -> Dict[str, Any]:
+        """Run extruct over the shared tree."""
         try:
-            # Use extruct to extract all formats
+            # Use extruct to extract all formats from the shared tree
             data = extruct.extract(
-                self.html,
+                self.document.tree,
                 base_url=self.base_url,
                 syntaxes=['json-ld', 'microdata', 'opengraph', 'rdfa']
             )
@@ -53,26 +66,59 @@ class SchemaParser:
                 "rdfa": []
             }
 
-    def find_product_schema(self) -> Optional[Dict[str, Any]]:
+    def find_schemas(self, schema_type: str) -> List[Dict[str, Any]]:
         """
-        Find Product schema specifically.
+        Find all top-level schemas of a type (JSON-LD first, then microdata).
+
+        Offers nested under a Product are indexed as 'Offer'.
+
+        Args:
+            schema_type: Short schema.org type (e.g. 'Product', 'Offer')
 
         Returns:
-            Product schema data or None
+            Matching schema nodes in document order
         """
+        if self._type_index is None:
+            self._type_index = self._build_type_index()
+        return self._type_index.get(schema_type, [])
+
+    def _build_type_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Index extracted JSON-LD and microdata nodes by @type."""
         schemas = self.extract_all_schemas()
+        index: Dict[str, List[Dict[str, Any]]] = {}
+
+        def add(schema_type: Any, node: Dict[str, Any]):
+            types = schema_type if isinstance(schema_type, list) else [schema_type]
+            for t in types:
+                if isinstance(t, str) and t:
+                    index.setdefault(t, []).append(node)
 
-        # Check JSON-LD
         for item in schemas.get('json_ld', []):
-            if self._is_product_schema(item):
-                return item
+            if isinstance(item, dict):
+                add(item.get('@type', ''), item)
 
-        # Check microdata
         for item in schemas.get('microdata', []):
-            if item.get('type') == 'http://schema.org/Product':
-                return item
+            item_type = item.get('type')
+            if isinstance(item_type, str) and item_type.startswith(MICRODATA_SCHEMA_PREFIX):
+                add(item_type[len(MICRODATA_SCHEMA_PREFIX):], item)
 
-        return None
+        for product in index.get('Product', []):
+            offers = product.get('offers', [])
+            for offer in offers if isinstance(offers, list) else [offers]:
+                if isinstance(offer, dict):
+                    index.setdefault('Offer', []).append(offer)
+
+        return index
+
+    def find_product_schema(self) -> Optional[Dict[str, Any]]:
+        """
+        Find Product schema specifically.
+
+        Returns:
+            Product schema data or None
+        """
+        products = self.find_schemas('Product')
+        return products[0] if products else None
 
     def find_organization_schema(self) -> Optional[Dict[str, Any]]:
         """
@@ -81,33 +127,8 @@ class SchemaParser:
         Returns:
             Organization schema data or None
         """
-        schemas = self.extract_all_schemas()
-
-        # Check JSON-LD
-        for item in schemas.get('json_ld', []):
-            if self._is_organization_schema(item):
-                return item
-
-        # Check microdata
-        for item in schemas.get('microdata', []):
-            if item.get('type') == 'http://schema.org/Organization':
-                return item
-
-        return None
-
-    def _is_product_schema(self, schema: Dict[str, Any]) -> bool:
-        """Check if schema is a Product type."""
-        schema_type = schema.get('@type', '')
-        if isinstance(schema_type, list):
-            return 'Product' in schema_type
-        return schema_type == 'Product'
-
-    def _is_organization_schema(self, schema: Dict[str, Any]) -> bool:
-        """Check if schema is an Organization type."""
-        schema_type = schema.get('@type', '')
-        if isinstance(schema_type, list):
-            return 'Organization' in schema_type
-        return schema_type == 'Organization'
+        organizations = self.find_schemas('Organization')
+        return organizations[0] if organizations else None
 
     def validate_product_schema(self, product_schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -13,7 +13,10 @@ from arrs.simulation.prompt_templates import (
     get_attribute_extraction_prompt
 )
 from arrs.simulation.citation_analyzer import CitationAnalyzer
+from arrs.simulation.response_cache import LLMResponseCache
+from arrs.crawlers.http_client import SharedHTTPClient, get_http_client
 from arrs.utils.logger import setup_logger
+from config import settings
 
 logger = setup_logger(__name__)
 
@@ -21,16 +24,26 @@ logger = setup_logger(__name__)
 class OllamaSimulator:
     """Local LLM simulator using Ollama."""
 
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama2"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "llama2",
+        http_client: Optional[SharedHTTPClient] = None,
+        response_cache: Optional[LLMResponseCache] = None
+    ):
         """
         Initialize Ollama simulator.
 
         Args:
             base_url: Ollama API base URL (default: localhost)
             model: Model name (llama2, mistral, phi, etc.)
+            http_client: Pooled HTTP client (defaults to the process-wide client)
+            response_cache: Completion cache (responses are not cached if omitted)
         """
         self.base_url = base_url
         self.model = model
+        self.http_client = http_client or get_http_client()
+        self.response_cache = response_cache
         self.citation_analyzer = CitationAnalyzer()
         logger.info(f"Initialized Ollama simulator with model: {model}")
 
@@ -39,7 +52,8 @@ class OllamaSimulator:
         analysis_id: str,
         brand: str,
         product_category: str,
-        use_case: str
+        use_case: str,
+        fresh: bool = False
     ) -> SimulationResult:
         """
         Simulate AI recommendation using local LLM.
@@ -49,6 +63,7 @@ class OllamaSimulator:
             brand: Brand name to check for
             product_category: Product category
             use_case: Use case scenario
+            fresh: Sample new completions instead of reusing cached ones
 
         Returns:
             Simulation result
@@ -65,7 +80,7 @@ class OllamaSimulator:
 
         # Query Ollama
         try:
-            response = await self._query_ollama(prompt)
+            response = await self._query_ollama(prompt, fresh=fresh)
         except Exception as e:
             logger.error(f"Ollama query failed: {e}")
             # Return empty result if Ollama is not available
@@ -75,7 +90,9 @@ class OllamaSimulator:
         citation_analysis = self.citation_analyzer.analyze_citation(response, brand)
 
         # Identify missing signals
-        missing_signals = await self._identify_missing_signals(brand, product_category, response)
+        missing_signals = await self._identify_missing_signals(
+            brand, product_category, response, fresh=fresh
+        )
 
         result = SimulationResult(
             id=str(uuid.uuid4()),
@@ -104,12 +121,13 @@ class OllamaSimulator:
 
         return result
 
-    async def _query_ollama(self, prompt: str) -> str:
+    async def _query_ollama(self, prompt: str, fresh: bool = False) -> str:
         """
-        Query Ollama API.
+        Query Ollama API, reusing a cached completion when available.
 
         Args:
             prompt: Prompt text
+            fresh: Bypass the response cache lookup
 
         Returns:
             LLM response
@@ -117,6 +135,20 @@ class OllamaSimulator:
         Raises:
             Exception: If Ollama is not available or query fails
         """
+        if self.response_cache is None:
+            return await self._generate(prompt)
+
+        return await self.response_cache.get_or_create(
+            "ollama",
+            self.model,
+            prompt,
+            {},
+            lambda: self._generate(prompt),
+            fresh=fresh
+        )
+
+    async def _generate(self, prompt: str) -> str:
+        """Send a single non-streaming generate request to Ollama."""
         url = f"{self.base_url}/api/generate"
 
         payload = {
@@ -125,26 +157,26 @@ class OllamaSimulator:
             "stream": False
         }
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
+        try:
+            response = await self.http_client.post(url, json=payload, timeout=settings.llm_timeout)
+            response.raise_for_status()
 
-                data = response.json()
-                return data.get("response", "")
+            data = response.json()
+            return data.get("response", "")
 
-            except httpx.ConnectError:
-                raise Exception(
-                    "Cannot connect to Ollama. Is it running? Install from https://ollama.ai and run 'ollama serve'"
-                )
-            except Exception as e:
-                raise Exception(f"Ollama query failed: {e}")
+        except httpx.ConnectError:
+            raise Exception(
+                "Cannot connect to Ollama. Is it running? Install from https://ollama.ai and run 'ollama serve'"
+            )
+        except Exception as e:
+            raise Exception(f"Ollama query failed: {e}")
 
     async def _identify_missing_signals(
         self,
         brand: str,
         product_category: str,
-        recommendation_response: str
+        recommendation_response: str,
+        fresh: bool = False
     ) -> list:
         """
         Identify what attributes the LLM wanted but might be missing.
@@ -153,6 +185,7 @@ class OllamaSimulator:
             brand: Brand name
             product_category: Product category
             recommendation_response: LLM's recommendation response
+            fresh: Bypass the response cache lookup
 
         Returns:
             List of missing signals/attributes
@@ -161,7 +194,7 @@ class OllamaSimulator:
         prompt = get_attribute_extraction_prompt(brand, product_category)
 
         try:
-            response = await self._query_ollama(prompt)
+            response = await self._query_ollama(prompt, fresh=fresh)
             missing_signals = self.citation_analyzer.extract_important_attributes(response)
             return missing_signals
 
@@ -203,9 +236,8 @@ class OllamaSimulator:
         """
         url = f"{self.base_url}/api/tags"
 
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            try:
-                response = await client.get(url)
-                return response.status_code == 200
-            except Exception:
-                return False
+        try:
+            response = await self.http_client.get(url, timeout=5.0)
+            return response.status_code == 200
+        except Exception:
+            return False
@@ -5,10 +5,17 @@ from openai import AsyncOpenAI
 
 from arrs.simulation.citation_analyzer import CitationAnalyzer
 from arrs.simulation.prompt_templates import get_recommendation_prompt
+from arrs.simulation.response_cache import LLMResponseCache
 from arrs.storage.repository import Repository
+from arrs.crawlers.http_client import SharedHTTPClient, get_http_client
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "You are a helpful shopping assistant that recommends products based on user needs. Provide specific brand and product recommendations with detailed reasoning."
+TEMPERATURE = 0.7
+MAX_TOKENS = 1000
+
 
 class OpenAISimulator:
     """Simulates AI recommendations using OpenAI's GPT models."""
@@ -17,7 +24,9 @@ class OpenAISimulator:
         self,
         api_key: str,
         model: str = "gpt-4",
-        repository: Optional[Repository] = None
+        repository: Optional[Repository] = None,
+        http_client: Optional[SharedHTTPClient] = None,
+        response_cache: Optional[LLMResponseCache] = None
     ):
         """
         Initialize OpenAI simulator.
@@ -26,10 +35,19 @@ class OpenAISimulator:
             api_key: OpenAI API key
             model: Model to use (gpt-4, gpt-3.5-turbo, etc.)
             repository: Repository for data persistence
+            http_client: Shared HTTP client (process-wide client if omitted)
+            response_cache: Completion cache (responses are not cached if omitted)
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.http_client = http_client or get_http_client()
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=settings.llm_timeout,
+            max_retries=settings.llm_max_retries,
+            http_client=self.http_client.client
+        )
         self.model = model
         self.repository = repository
+        self.response_cache = response_cache
         self.citation_analyzer = CitationAnalyzer()
         logger.info(f"OpenAI simulator initialized with model: {model}")
 
@@ -39,7 +57,8 @@ class OpenAISimulator:
         brand: Optional[str] = None,
         product_category: Optional[str] = None,
         use_case: Optional[str] = None,
-        parsed_content: Optional[Dict[str, Any]] = None
+        parsed_content: Optional[Dict[str, Any]] = None,
+        fresh: bool = False
     ) -> Dict[str, Any]:
         """
         Simulate AI recommendation using OpenAI's API.
@@ -50,6 +69,7 @@ class OpenAISimulator:
             product_category: Product category
             use_case: Use case description
             parsed_content: Parsed content from the website
+            fresh: Sample a new completion instead of reusing a cached one
 
         Returns:
             Dict with simulation results
@@ -74,24 +94,7 @@ class OpenAISimulator:
             logger.info(f"Querying OpenAI {self.model} for recommendations...")
 
             # Call OpenAI API
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful shopping assistant that recommends products based on user needs. Provide specific brand and product recommendations with detailed reasoning."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
-
-            # Extract response text
-            response_text = response.choices[0].message.content
+            response_text = await self._query_openai(prompt, fresh=fresh)
 
             logger.info(f"OpenAI response received ({len(response_text)} chars)")
 
@@ -140,6 +143,49 @@ class OpenAISimulator:
                 "error": str(e)
             }
 
+    async def _query_openai(self, prompt: str, fresh: bool = False) -> str:
+        """
+        Query OpenAI, reusing a cached completion when available.
+
+        Args:
+            prompt: Prompt text
+            fresh: Bypass the response cache lookup
+
+        Returns:
+            Response text
+        """
+        if self.response_cache is None:
+            return await self._create_completion(prompt)
+
+        return await self.response_cache.get_or_create(
+            "openai",
+            self.model,
+            prompt,
+            {"system": SYSTEM_PROMPT, "temperature": TEMPERATURE, "max_tokens": MAX_TOKENS},
+            lambda: self._create_completion(prompt),
+            fresh=fresh
+        )
+
+    async def _create_completion(self, prompt: str) -> str:
+        """Send a single chat completion request."""
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=TEMPERATURE,
+            max_tokens=MAX_TOKENS
+        )
+
+        return response.choices[0].message.content
+
     def _identify_missing_signals(
         self,
         response: str,
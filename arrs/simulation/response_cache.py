@@ -0,0 +1,218 @@
+"""Persistent LLM response cache shared by all simulators."""
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from arrs.storage.database import Database
+from arrs.utils.logger import setup_logger
+from config import settings
+
+logger = setup_logger(__name__)
+
+
+def make_cache_key(provider: str, model: str, prompt: str, params: Dict[str, Any]) -> str:
+    """
+    Build the cache key for a completion request.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+        prompt: Full prompt text (system prompts belong in params)
+        params: Sampling parameters that change the output
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            "params": params
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed completion cache with TTL expiry and LRU size bounds."""
+
+    # Identical requests in flight share one upstream call. Shared across
+    # instances because an orchestrator (and its cache) is built per request.
+    _inflight: Dict[str, asyncio.Future] = {}
+
+    def __init__(
+        self,
+        database: Database,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 10000
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            database: Database holding the llm_cache table
+            ttl_seconds: Age after which a cached response is ignored
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self.db = database
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response and mark it as recently used.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        now = time.time()
+        row = await self.db.fetch_one(
+            "SELECT response FROM llm_cache WHERE key = ? AND created_at >= ?",
+            (key, now - self.ttl_seconds)
+        )
+        if not row:
+            return None
+
+        await self.db.execute(
+            "UPDATE llm_cache SET last_accessed_at = ?, hit_count = hit_count + 1 WHERE key = ?",
+            (now, key)
+        )
+        return row["response"]
+
+    async def set(self, key: str, provider: str, model: str, response: str):
+        """
+        Store a response and evict expired and least recently used entries.
+
+        Args:
+            key: Cache key from make_cache_key
+            provider: LLM provider name
+            model: Model name
+            response: Completion text
+        """
+        now = time.time()
+        await self.db.execute(
+            """INSERT OR REPLACE INTO llm_cache
+               (key, provider, model, response, created_at, last_accessed_at, hit_count)
+               VALUES (?, ?, ?, ?, ?, ?, 0)""",
+            (key, provider, model, response, now, now)
+        )
+        await self._evict(now)
+
+    async def _evict(self, now: float):
+        """Drop expired entries and trim the table to max_entries."""
+        await self.db.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?",
+            (now - self.ttl_seconds,)
+        )
+        await self.db.execute(
+            """DELETE FROM llm_cache WHERE key IN (
+                   SELECT key FROM llm_cache
+                   ORDER BY last_accessed_at DESC
+                   LIMIT -1 OFFSET ?
+               )""",
+            (self.max_entries,)
+        )
+
+    async def get_or_create(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        params: Dict[str, Any],
+        producer: Callable[[], Awaitable[str]],
+        fresh: bool = False
+    ) -> str:
+        """
+        Return a cached completion, calling the LLM only on a miss.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            prompt: Full prompt text
+            params: Sampling parameters that change the output
+            producer: Coroutine factory performing the real LLM call
+            fresh: Skip the lookup and sample a new completion (result is still stored)
+
+        Returns:
+            Completion text
+        """
+        key = make_cache_key(provider, model, prompt, params)
+
+        if not fresh:
+            try:
+                cached = await self.get(key)
+            except Exception as e:
+                logger.warning(f"LLM cache lookup failed: {e}")
+                cached = None
+
+            if cached is not None:
+                logger.info("LLM cache hit", extra={"provider": provider, "model": model})
+                return cached
+
+            pending = self._inflight.get(key)
+            if pending is not None:
+                try:
+                    return await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                    # The leading call was cancelled; make our own call below
+
+        future = asyncio.get_running_loop().create_future()
+        if not fresh:
+            self._inflight[key] = future
+
+        try:
+            response = await producer()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; avoid "exception never retrieved" warnings
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        future.set_result(response)
+
+        # Never cache empty completions (usually a provider-side failure)
+        if response:
+            try:
+                await self.set(key, provider, model, response)
+            except Exception as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+        return response
+
+    async def clear(self):
+        """Remove every cached response."""
+        await self.db.execute("DELETE FROM llm_cache")
+
+
+def build_response_cache(database: Database) -> Optional[LLMResponseCache]:
+    """
+    Create the response cache configured in settings.
+
+    Args:
+        database: Database holding the llm_cache table
+
+    Returns:
+        Response cache, or None when LLM caching is disabled
+    """
+    if not settings.llm_cache_enabled:
+        return None
+
+    return LLMResponseCache(
+        database,
+        ttl_seconds=settings.llm_cache_ttl_hours * 3600,
+        max_entries=settings.llm_cache_max_entries
+    )
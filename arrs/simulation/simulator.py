@@ -2,31 +2,50 @@
 import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+from arrs.crawlers.http_client import SharedHTTPClient, get_http_client
 from arrs.models.simulation_result import SimulationResult
 from arrs.simulation.prompt_templates import (
     get_recommendation_prompt,
     get_attribute_extraction_prompt
 )
 from arrs.simulation.citation_analyzer import CitationAnalyzer
+from arrs.simulation.response_cache import LLMResponseCache
 from arrs.utils.logger import setup_logger
 from config import settings
 
 logger = setup_logger(__name__)
 
+CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+CLAUDE_MAX_TOKENS = 2048
+
 
 class ClaudeSimulator:
     """Claude AI simulator for recommendation testing."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[SharedHTTPClient] = None,
+        response_cache: Optional[LLMResponseCache] = None
+    ):
         """
         Initialize Claude simulator.
 
         Args:
             api_key: Anthropic API key (uses settings if not provided)
+            http_client: Shared HTTP client (process-wide client if omitted)
+            response_cache: Completion cache (responses are not cached if omitted)
         """
         self.api_key = api_key or settings.anthropic_api_key
-        self.client = Anthropic(api_key=self.api_key)
+        self.http_client = http_client or get_http_client()
+        self.client = AsyncAnthropic(
+            api_key=self.api_key,
+            timeout=settings.llm_timeout,
+            max_retries=settings.llm_max_retries,
+            http_client=self.http_client.client
+        )
+        self.response_cache = response_cache
         self.citation_analyzer = CitationAnalyzer()
 
     async def simulate_recommendation(
@@ -34,7 +53,8 @@ class ClaudeSimulator:
         analysis_id: str,
         brand: str,
         product_category: str,
-        use_case: str
+        use_case: str,
+        fresh: bool = False
     ) -> SimulationResult:
         """
         Simulate AI recommendation and check for brand citation.
@@ -44,6 +64,7 @@ class ClaudeSimulator:
             brand: Brand name to check for
             product_category: Product category
             use_case: Use case scenario
+            fresh: Sample new completions instead of reusing cached ones
 
         Returns:
             Simulation result
@@ -58,13 +79,15 @@ class ClaudeSimulator:
         prompt = get_recommendation_prompt(product_category, use_case)
 
         # Query Claude
-        response = await self._query_claude(prompt)
+        response = await self._query_claude(prompt, fresh=fresh)
 
         # Analyze citation
         citation_analysis = self.citation_analyzer.analyze_citation(response, brand)
 
         # Identify missing signals
-        missing_signals = await self._identify_missing_signals(brand, product_category, response)
+        missing_signals = await self._identify_missing_signals(
+            brand, product_category, response, fresh=fresh
+        )
 
         result = SimulationResult(
             id=str(uuid.uuid4()),
@@ -91,20 +114,35 @@ class ClaudeSimulator:
 
         return result
 
-    async def _query_claude(self, prompt: str) -> str:
+    async def _query_claude(self, prompt: str, fresh: bool = False) -> str:
         """
-        Query Claude API.
+        Query Claude API, reusing a cached completion when available.
 
         Args:
             prompt: Prompt text
+            fresh: Bypass the response cache lookup
 
         Returns:
             Claude's response
         """
+        if self.response_cache is None:
+            return await self._create_message(prompt)
+
+        return await self.response_cache.get_or_create(
+            "claude",
+            CLAUDE_MODEL,
+            prompt,
+            {"max_tokens": CLAUDE_MAX_TOKENS},
+            lambda: self._create_message(prompt),
+            fresh=fresh
+        )
+
+    async def _create_message(self, prompt: str) -> str:
+        """Send a single prompt to the Claude API."""
         try:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=2048,
+            message = await self.client.messages.create(
+                model=CLAUDE_MODEL,
+                max_tokens=CLAUDE_MAX_TOKENS,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
@@ -121,7 +159,8 @@ class ClaudeSimulator:
         self,
         brand: str,
         product_category: str,
-        recommendation_response: str
+        recommendation_response: str,
+        fresh: bool = False
     ) -> list:
         """
         Identify what attributes Claude wanted but might be missing.
@@ -130,6 +169,7 @@ class ClaudeSimulator:
             brand: Brand name
             product_category: Product category
             recommendation_response: Claude's recommendation response
+            fresh: Bypass the response cache lookup
 
         Returns:
             List of missing signals/attributes
@@ -138,7 +178,7 @@ class ClaudeSimulator:
         prompt = get_attribute_extraction_prompt(brand, product_category)
 
         try:
-            response = await self._query_claude(prompt)
+            response = await self._query_claude(prompt, fresh=fresh)
 
             # Extract key attributes mentioned
             missing_signals = self.citation_analyzer.extract_important_attributes(response)
@@ -0,0 +1,152 @@
+"""Compressed, content-addressed blob storage for raw page content."""
+import asyncio
+import gzip
+import hashlib
+from pathlib import Path
+from typing import Optional, Union
+from arrs.core.exceptions import StorageException
+from arrs.utils.file_io import atomic_write_bytes
+from arrs.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+try:
+    import zstandard
+except ImportError:  # gzip fallback when the optional dependency is missing
+    zstandard = None
+
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_GZIP = "gzip"
+
+_EXTENSIONS = {COMPRESSION_ZSTD: ".zst", COMPRESSION_GZIP: ".gz"}
+
+
+def content_hash(data: Union[str, bytes]) -> str:
+    """
+    Hash content the way the blob store keys it.
+
+    Args:
+        data: Content (str is UTF-8 encoded)
+
+    Returns:
+        SHA-256 hex digest of the uncompressed bytes
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobStore:
+    """Stores each distinct blob once, compressed, under its SHA-256."""
+
+    def __init__(self, base_path: str, compression: str = COMPRESSION_ZSTD, level: int = 3):
+        """
+        Initialize blob store.
+
+        Args:
+            base_path: Root directory for blobs
+            compression: "zstd" (falls back to gzip if zstandard is missing) or "gzip"
+            level: Compression level
+        """
+        if compression not in _EXTENSIONS:
+            raise StorageException(f"Unsupported blob compression: {compression}")
+        if compression == COMPRESSION_ZSTD and zstandard is None:
+            logger.warning("zstandard not installed, compressing blobs with gzip")
+            compression = COMPRESSION_GZIP
+
+        self.base_path = Path(base_path)
+        self.compression = compression
+        self.level = level
+
+    def _path(self, digest: str, compression: str) -> Path:
+        """Sharded path: <base>/<ab>/<cd>/<digest><ext>."""
+        return self.base_path / digest[:2] / digest[2:4] / f"{digest}{_EXTENSIONS[compression]}"
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == COMPRESSION_ZSTD:
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return gzip.compress(data, compresslevel=self.level)
+
+    @staticmethod
+    def _decompress(data: bytes, compression: str) -> bytes:
+        if compression == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise StorageException("zstandard is required to read .zst blobs")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def _find(self, digest: str) -> Optional[Path]:
+        """Locate a stored blob under any supported compression."""
+        for compression in (self.compression, *[c for c in _EXTENSIONS if c != self.compression]):
+            path = self._path(digest, compression)
+            if path.exists():
+                return path
+        return None
+
+    def put_sync(self, data: Union[str, bytes]) -> str:
+        """
+        Store content unless an identical blob already exists.
+
+        Args:
+            data: Content (str is UTF-8 encoded)
+
+        Returns:
+            Content hash to reference the blob by
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        digest = content_hash(data)
+
+        if self._find(digest) is not None:
+            logger.info("Blob deduplicated", extra={"content_hash": digest})
+            return digest
+
+        compressed = self._compress(data)
+        atomic_write_bytes(self._path(digest, self.compression), compressed)
+
+        logger.info("Blob stored", extra={
+            "content_hash": digest,
+            "size": len(data),
+            "compressed_size": len(compressed)
+        })
+        return digest
+
+    def get_sync(self, digest: str) -> Optional[bytes]:
+        """
+        Load and decompress a blob.
+
+        Args:
+            digest: Content hash
+
+        Returns:
+            Uncompressed content, or None if the blob does not exist
+        """
+        path = self._find(digest)
+        if path is None:
+            return None
+
+        compression = COMPRESSION_ZSTD if path.suffix == _EXTENSIONS[COMPRESSION_ZSTD] else COMPRESSION_GZIP
+        return self._decompress(path.read_bytes(), compression)
+
+    async def put(self, data: Union[str, bytes]) -> str:
+        """Store content in a worker thread; returns its content hash."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.put_sync, data)
+
+    async def get(self, digest: str) -> Optional[bytes]:
+        """Load a blob in a worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_sync, digest)
+
+    async def get_text(self, digest: str) -> Optional[str]:
+        """
+        Load a blob as UTF-8 text.
+
+        Args:
+            digest: Content hash
+
+        Returns:
+            Decoded content, or None if the blob does not exist
+        """
+        data = await self.get(digest)
+        return data.decode("utf-8") if data is not None else None
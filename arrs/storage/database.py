@@ -1,12 +1,18 @@
 """SQLite database management for ARRS system."""
+import asyncio
 import aiosqlite
 import json
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+from arrs.core.exceptions import StorageException
 from arrs.utils.logger import setup_logger
+from config import settings
 
 logger = setup_logger(__name__)
 
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
 # Database schema
 SCHEMA = """
 -- analyses: Track each analysis session
@@ -25,7 +31,8 @@ CREATE TABLE IF NOT EXISTS crawled_pages (
     id TEXT PRIMARY KEY,
     analysis_id TEXT NOT NULL,
     url TEXT NOT NULL,
-    html_content TEXT,
+    html_content TEXT,  -- legacy rows only; new rows reference the blob store
+    content_hash TEXT,
     crawled_at TIMESTAMP NOT NULL,
     crawl_method TEXT NOT NULL,
     status_code INTEGER NOT NULL,
@@ -41,6 +48,8 @@ CREATE TABLE IF NOT EXISTS engine_scores (
     weight REAL NOT NULL,
     details TEXT,
     calculated_at TIMESTAMP NOT NULL,
+    scoring_version INTEGER,  -- BaseEngine.version of the engine that scored
+    reused_from TEXT,  -- analysis whose result was copied for unchanged content
     FOREIGN KEY (analysis_id) REFERENCES analyses(id) ON DELETE CASCADE
 );
 
@@ -67,9 +76,103 @@ CREATE TABLE IF NOT EXISTS gaps (
     description TEXT NOT NULL,
     recommendation TEXT NOT NULL,
     engine_source TEXT NOT NULL,
+    reused_from TEXT,
     FOREIGN KEY (analysis_id) REFERENCES analyses(id) ON DELETE CASCADE
 );
 
+-- llm_cache: Completions keyed by provider, model, prompt and sampling params
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed_at REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- crawl_cache: Recent crawls keyed by normalized URL and crawl method (HTML in the blob store)
+CREATE TABLE IF NOT EXISTS crawl_cache (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    crawl_method TEXT NOT NULL,
+    final_url TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    crawled_at TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed_at REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- page_validators: ETag / Last-Modified of the last full response per URL (body in the blob store)
+CREATE TABLE IF NOT EXISTS page_validators (
+    url TEXT PRIMARY KEY,
+    final_url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+-- domain_profiles: What earlier crawls learned per domain (e.g. how often pages need a JS render)
+CREATE TABLE IF NOT EXISTS domain_profiles (
+    domain TEXT PRIMARY KEY,
+    render_checks INTEGER NOT NULL DEFAULT 0,
+    render_needed INTEGER NOT NULL DEFAULT 0,
+    last_render_reason TEXT,
+    updated_at REAL NOT NULL,
+    preferred_method TEXT,  -- crawler of the last successful fetch
+    static_attempts INTEGER NOT NULL DEFAULT 0,
+    static_block_rate REAL NOT NULL DEFAULT 0,  -- moving average of failed static fetches
+    static_latency_ms REAL,  -- moving average of successful static fetches
+    browser_attempts INTEGER NOT NULL DEFAULT 0,
+    browser_block_rate REAL NOT NULL DEFAULT 0,
+    browser_latency_ms REAL,
+    last_probed_at REAL  -- last static fetch attempt
+);
+
+-- jobs: Durable analysis queue; a worker holds a job's lease while it runs
+CREATE TABLE IF NOT EXISTS jobs (
+    analysis_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    progress INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    error_message TEXT,
+    batch_id TEXT,
+    host TEXT,  -- per-host concurrency limit
+    finished_seq INTEGER,  -- commit order of finished jobs, for streaming results
+    FOREIGN KEY (analysis_id) REFERENCES analyses(id) ON DELETE CASCADE
+);
+
+-- batches: Bulk submissions fanned out as jobs sharing a batch_id
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    brand TEXT,
+    product_category TEXT,
+    use_case TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+-- job_checkpoints: Output of finished pipeline stages, for resuming a job
+CREATE TABLE IF NOT EXISTS job_checkpoints (
+    analysis_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (analysis_id, stage)
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_analyses_url ON analyses(url);
 CREATE INDEX IF NOT EXISTS idx_analyses_status ON analyses(status);
@@ -77,20 +180,83 @@ CREATE INDEX IF NOT EXISTS idx_crawled_pages_analysis_id ON crawled_pages(analys
 CREATE INDEX IF NOT EXISTS idx_engine_scores_analysis_id ON engine_scores(analysis_id);
 CREATE INDEX IF NOT EXISTS idx_simulation_results_analysis_id ON simulation_results(analysis_id);
 CREATE INDEX IF NOT EXISTS idx_gaps_analysis_id ON gaps(analysis_id);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed_at ON llm_cache(last_accessed_at);
+CREATE INDEX IF NOT EXISTS idx_crawl_cache_last_accessed_at ON crawl_cache(last_accessed_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at ON jobs(status, created_at);
+"""
+
+# Columns added after the first release: (table, column, definition).
+# Applied with ALTER TABLE to databases created before the column existed.
+COLUMN_MIGRATIONS = [
+    ("crawled_pages", "content_hash", "TEXT"),
+    ("jobs", "batch_id", "TEXT"),
+    ("jobs", "host", "TEXT"),
+    ("jobs", "finished_seq", "INTEGER"),
+    ("domain_profiles", "preferred_method", "TEXT"),
+    ("domain_profiles", "static_attempts", "INTEGER NOT NULL DEFAULT 0"),
+    ("domain_profiles", "static_block_rate", "REAL NOT NULL DEFAULT 0"),
+    ("domain_profiles", "static_latency_ms", "REAL"),
+    ("domain_profiles", "browser_attempts", "INTEGER NOT NULL DEFAULT 0"),
+    ("domain_profiles", "browser_block_rate", "REAL NOT NULL DEFAULT 0"),
+    ("domain_profiles", "browser_latency_ms", "REAL"),
+    ("domain_profiles", "last_probed_at", "REAL"),
+    ("engine_scores", "scoring_version", "INTEGER"),
+    ("engine_scores", "reused_from", "TEXT"),
+    ("gaps", "reused_from", "TEXT"),
+]
+
+# Indexes on migrated columns (created after the columns exist)
+POST_MIGRATION_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_crawled_pages_content_hash ON crawled_pages(content_hash);
+CREATE INDEX IF NOT EXISTS idx_jobs_batch_id_status ON jobs(batch_id, status);
+CREATE INDEX IF NOT EXISTS idx_jobs_batch_id_finished_seq ON jobs(batch_id, finished_seq);
+CREATE INDEX IF NOT EXISTS idx_jobs_finished_seq ON jobs(finished_seq);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_host ON jobs(status, host);
 """
 
 
 class Database:
-    """SQLite database manager."""
+    """SQLite database manager with a persistent writer and a reader pool."""
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        reader_pool_size: Optional[int] = None,
+        synchronous: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        mmap_size: Optional[int] = None,
+        busy_timeout_ms: Optional[int] = None
+    ):
         """
         Initialize database manager.
 
+        Connections are opened lazily on first use and kept until close().
+
         Args:
             db_path: Path to SQLite database file
+            reader_pool_size: Read-only connections kept open (settings if omitted)
+            synchronous: PRAGMA synchronous level (settings if omitted)
+            cache_size: PRAGMA cache_size; negative values are KiB (settings if omitted)
+            mmap_size: PRAGMA mmap_size in bytes (settings if omitted)
+            busy_timeout_ms: PRAGMA busy_timeout in milliseconds (settings if omitted)
         """
         self.db_path = db_path
+        self.reader_pool_size = max(1, reader_pool_size or settings.sqlite_reader_pool_size)
+        self.synchronous = (synchronous or settings.sqlite_synchronous).upper()
+        if self.synchronous not in SYNCHRONOUS_LEVELS:
+            raise StorageException(f"Invalid SQLite synchronous level: {self.synchronous}")
+        self.cache_size = settings.sqlite_cache_size if cache_size is None else cache_size
+        self.mmap_size = settings.sqlite_mmap_size if mmap_size is None else mmap_size
+        self.busy_timeout_ms = (
+            settings.sqlite_busy_timeout_ms if busy_timeout_ms is None else busy_timeout_ms
+        )
+
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        # Created on first use so they bind to the running event loop
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._open_lock: Optional[asyncio.Lock] = None
         self._ensure_data_dir()
 
     def _ensure_data_dir(self):
@@ -98,23 +264,99 @@ class Database:
         db_file = Path(self.db_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
 
+    async def _connect(self, read_only: bool = False) -> aiosqlite.Connection:
+        """Open a connection and apply the configured PRAGMAs."""
+        conn = aiosqlite.connect(self.db_path)
+        # Don't let a forgotten close() keep the interpreter alive at exit
+        conn.daemon = True
+        await conn
+
+        conn.row_factory = aiosqlite.Row
+        await conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        await conn.execute("PRAGMA journal_mode = WAL")
+        await conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        await conn.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        await conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        if read_only:
+            await conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    async def _ensure_open(self):
+        """Open the writer connection and the reader pool on first use."""
+        if self._writer is not None:
+            return
+
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+
+            # The writer goes first so WAL mode is set before readers attach
+            writer = await self._connect()
+            readers = [
+                await self._connect(read_only=True)
+                for _ in range(self.reader_pool_size)
+            ]
+
+            self._idle_readers = asyncio.Queue()
+            for reader in readers:
+                self._idle_readers.put_nowait(reader)
+            self._readers = readers
+            self._write_lock = asyncio.Lock()
+            self._writer = writer
+
+            logger.info("Database connections opened", extra={
+                "db_path": self.db_path,
+                "readers": self.reader_pool_size,
+                "synchronous": self.synchronous
+            })
+
+    @asynccontextmanager
+    async def _write_connection(self):
+        """Hold the writer connection exclusively for the duration of the block."""
+        await self._ensure_open()
+        async with self._write_lock:
+            yield self._writer
+
+    @asynccontextmanager
+    async def _read_connection(self):
+        """Borrow a reader connection from the pool."""
+        await self._ensure_open()
+        reader = await self._idle_readers.get()
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put_nowait(reader)
+
     async def initialize(self):
         """Initialize database schema."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._write_connection() as db:
             await db.executescript(SCHEMA)
+            await self._migrate(db)
+            await db.executescript(POST_MIGRATION_SCHEMA)
             await db.commit()
             logger.info("Database initialized successfully", extra={"db_path": self.db_path})
 
+    async def _migrate(self, db: aiosqlite.Connection):
+        """Add columns missing from databases created by older versions."""
+        for table, column, definition in COLUMN_MIGRATIONS:
+            async with db.execute(f"PRAGMA table_info({table})") as cursor:
+                existing = {row["name"] for row in await cursor.fetchall()}
+
+            if column not in existing:
+                await db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                logger.info("Migrated database", extra={"table": table, "column": column})
+
     async def get_connection(self) -> aiosqlite.Connection:
         """
-        Get database connection.
+        Get a dedicated database connection (caller must close it).
 
         Returns:
             Async database connection
         """
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        return conn
+        return await self._connect()
 
     async def execute(self, query: str, params: Optional[tuple] = None):
         """
@@ -123,13 +365,21 @@ class Database:
         Args:
             query: SQL query
             params: Query parameters
+
+        Returns:
+            Number of rows changed
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            if params:
-                await db.execute(query, params)
-            else:
-                await db.execute(query)
-            await db.commit()
+        async with self._write_connection() as db:
+            try:
+                if params:
+                    cursor = await db.execute(query, params)
+                else:
+                    cursor = await db.execute(query)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+            return cursor.rowcount
 
     async def executemany(self, query: str, params_list: list):
         """
@@ -139,9 +389,29 @@ class Database:
             query: SQL query
             params_list: List of parameter tuples
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executemany(query, params_list)
-            await db.commit()
+        async with self._write_connection() as db:
+            try:
+                await db.executemany(query, params_list)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def execute_batch(self, statements: List[Tuple[str, list]]):
+        """
+        Execute several statements in one transaction (a single commit).
+
+        Args:
+            statements: (query, list of parameter tuples) pairs, run in order
+        """
+        async with self._write_connection() as db:
+            try:
+                for query, params_list in statements:
+                    await db.executemany(query, params_list)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
 
     async def fetch_one(self, query: str, params: Optional[tuple] = None):
         """
@@ -154,13 +424,9 @@ class Database:
         Returns:
             Single row or None
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            if params:
-                cursor = await db.execute(query, params)
-            else:
-                cursor = await db.execute(query)
-            return await cursor.fetchone()
+        async with self._read_connection() as db:
+            async with db.execute(query, params or ()) as cursor:
+                return await cursor.fetchone()
 
     async def fetch_all(self, query: str, params: Optional[tuple] = None):
         """
@@ -173,13 +439,24 @@ class Database:
         Returns:
             List of rows
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            if params:
-                cursor = await db.execute(query, params)
-            else:
-                cursor = await db.execute(query)
-            return await cursor.fetchall()
+        async with self._read_connection() as db:
+            async with db.execute(query, params or ()) as cursor:
+                return await cursor.fetchall()
+
+    async def close(self):
+        """Close the writer and all reader connections."""
+        if self._writer is None:
+            return
+
+        async with self._write_lock:
+            for reader in self._readers:
+                await reader.close()
+            await self._writer.close()
+
+            self._readers = []
+            self._idle_readers = None
+            self._writer = None
+            logger.info("Database connections closed", extra={"db_path": self.db_path})
 
 
 # Utility functions for JSON serialization
@@ -1,44 +1,136 @@
 """JSON file storage for large content blobs."""
+import asyncio
+import hashlib
 import json
+import shutil
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+from arrs.storage.segment_store import SegmentStore
+from arrs.utils.file_io import atomic_write_bytes
 from arrs.utils.logger import setup_logger
+from config import settings
 
 logger = setup_logger(__name__)
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback when the optional dependency is missing
+    orjson = None
 
-class JSONStore:
-    """JSON file storage manager."""
 
-    def __init__(self, base_path: str):
+def dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Directory under base_path holding packed segment files
+SEGMENTS_DIR = "segments"
+
+
+def shard_prefix(analysis_id: str) -> str:
+    """Two-level shard ("ab/cd") derived from a hash of the analysis ID."""
+    digest = hashlib.sha1(analysis_id.encode("utf-8")).hexdigest()
+    return f"{digest[:2]}/{digest[2:4]}"
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    """Read a file, or None if it does not exist (no separate exists() check)."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+class JSONStore:
+    """
+    JSON file storage manager; file I/O runs in a worker thread.
+
+    Analyses live under hash-prefix shards (base/ab/cd/<analysis_id>/...) so
+    no directory grows to millions of entries. With segments enabled, small
+    JSON artifacts are appended to large segment files instead of getting a
+    file each. Data written by older versions (base/<analysis_id>/...) is
+    still readable; migrate_legacy() moves it into the current layout.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        use_segments: Optional[bool] = None,
+        segment_max_bytes: Optional[int] = None
+    ):
         """
         Initialize JSON store.
 
         Args:
             base_path: Base directory for JSON storage
+            use_segments: Pack JSON artifacts into segment files (settings if omitted)
+            segment_max_bytes: Segment size before rolling over (settings if omitted)
         """
         self.base_path = Path(base_path)
+        if use_segments is None:
+            use_segments = settings.json_store_segments
+        if segment_max_bytes is None:
+            segment_max_bytes = settings.json_store_segment_max_mb * 1024 * 1024
+        self.segments = SegmentStore(
+            self.base_path / SEGMENTS_DIR,
+            max_segment_bytes=segment_max_bytes
+        ) if use_segments else None
         self._ensure_base_dir()
 
     def _ensure_base_dir(self):
         """Ensure base directory exists."""
         self.base_path.mkdir(parents=True, exist_ok=True)
 
+    async def _run(self, func: Callable, *args) -> Any:
+        """Run blocking file I/O off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
     def get_analysis_dir(self, analysis_id: str) -> Path:
         """
-        Get directory for a specific analysis.
+        Get directory for a specific analysis (not created; writes create it).
 
         Args:
             analysis_id: Analysis ID
 
         Returns:
-            Path to analysis directory
+            Path to the sharded analysis directory
         """
-        analysis_dir = self.base_path / analysis_id
-        analysis_dir.mkdir(parents=True, exist_ok=True)
-        return analysis_dir
-
-    def save_raw_content(self, analysis_id: str, filename: str, content: str):
+        return self.base_path / shard_prefix(analysis_id) / analysis_id
+
+    def _legacy_analysis_dir(self, analysis_id: str) -> Path:
+        """Unsharded directory used by older versions."""
+        return self.base_path / analysis_id
+
+    def _read_artifact(self, analysis_id: str, relative_path: str) -> Optional[bytes]:
+        """Read an artifact: segments, then sharded file, then legacy file."""
+        if self.segments is not None:
+            data = self.segments.get(f"{analysis_id}/{relative_path}")
+            if data is not None:
+                return data
+
+        data = _read_bytes(self.get_analysis_dir(analysis_id) / relative_path)
+        if data is None:
+            data = _read_bytes(self._legacy_analysis_dir(analysis_id) / relative_path)
+        return data
+
+    def _write_artifact(self, analysis_id: str, relative_path: str, data: bytes, packable: bool):
+        """Write an artifact; small JSON documents go to segments when enabled."""
+        if packable and self.segments is not None:
+            self.segments.put(f"{analysis_id}/{relative_path}", data)
+        else:
+            atomic_write_bytes(self.get_analysis_dir(analysis_id) / relative_path, data)
+
+    async def save_raw_content(self, analysis_id: str, filename: str, content: str):
         """
         Save raw HTML content.
 
@@ -47,19 +139,17 @@ class JSONStore:
             filename: File name (e.g., 'homepage.html')
             content: HTML content
         """
-        analysis_dir = self.get_analysis_dir(analysis_id)
-        raw_dir = analysis_dir / "raw_content"
-        raw_dir.mkdir(exist_ok=True)
+        await self._run(
+            self._write_artifact, analysis_id, f"raw_content/{filename}", content.encode("utf-8"), False
+        )
 
-        file_path = raw_dir / filename
-        file_path.write_text(content, encoding="utf-8")
         logger.info(f"Saved raw content", extra={
             "analysis_id": analysis_id,
             "file_name": filename,
             "size": len(content)
         })
 
-    def load_raw_content(self, analysis_id: str, filename: str) -> Optional[str]:
+    async def load_raw_content(self, analysis_id: str, filename: str) -> Optional[str]:
         """
         Load raw HTML content.
 
@@ -70,15 +160,21 @@ class JSONStore:
         Returns:
             HTML content or None if not found
         """
-        analysis_dir = self.get_analysis_dir(analysis_id)
-        file_path = analysis_dir / "raw_content" / filename
+        data = await self._run(self._read_artifact, analysis_id, f"raw_content/{filename}")
+        return data.decode("utf-8") if data is not None else None
 
-        if not file_path.exists():
-            return None
+    async def _save_json(self, analysis_id: str, relative_path: str, data: Any):
+        """Serialize and write a JSON document in a worker thread."""
+        await self._run(lambda: self._write_artifact(analysis_id, relative_path, dumps(data), True))
 
-        return file_path.read_text(encoding="utf-8")
+    async def _load_json(self, analysis_id: str, relative_path: str) -> Optional[Any]:
+        """Read and deserialize a JSON document in a worker thread."""
+        def read():
+            data = self._read_artifact(analysis_id, relative_path)
+            return loads(data) if data is not None else None
+        return await self._run(read)
 
-    def save_parsed_data(self, analysis_id: str, data_type: str, data: Dict[str, Any]):
+    async def save_parsed_data(self, analysis_id: str, data_type: str, data: Dict[str, Any]):
         """
         Save parsed data as JSON.
 
@@ -87,20 +183,14 @@ class JSONStore:
             data_type: Type of data (e.g., 'schema_data', 'content_metrics')
             data: Data to save
         """
-        analysis_dir = self.get_analysis_dir(analysis_id)
-        parsed_dir = analysis_dir / "parsed_content"
-        parsed_dir.mkdir(exist_ok=True)
-
-        file_path = parsed_dir / f"{data_type}.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        await self._save_json(analysis_id, f"parsed_content/{data_type}.json", data)
 
         logger.info(f"Saved parsed data", extra={
             "analysis_id": analysis_id,
             "data_type": data_type
         })
 
-    def load_parsed_data(self, analysis_id: str, data_type: str) -> Optional[Dict[str, Any]]:
+    async def load_parsed_data(self, analysis_id: str, data_type: str) -> Optional[Dict[str, Any]]:
         """
         Load parsed data from JSON.
 
@@ -111,16 +201,9 @@ class JSONStore:
         Returns:
             Parsed data or None if not found
         """
-        analysis_dir = self.get_analysis_dir(analysis_id)
-        file_path = analysis_dir / "parsed_content" / f"{data_type}.json"
-
-        if not file_path.exists():
-            return None
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return await self._load_json(analysis_id, f"parsed_content/{data_type}.json")
 
-    def save_simulation_data(self, analysis_id: str, simulation_data: Dict[str, Any]):
+    async def save_simulation_data(self, analysis_id: str, simulation_data: Dict[str, Any]):
         """
         Save simulation prompts and responses.
 
@@ -128,17 +211,11 @@ class JSONStore:
             analysis_id: Analysis ID
             simulation_data: Simulation data
         """
-        analysis_dir = self.get_analysis_dir(analysis_id)
-        sim_dir = analysis_dir / "simulation"
-        sim_dir.mkdir(exist_ok=True)
-
-        file_path = sim_dir / "simulation_results.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(simulation_data, f, indent=2, ensure_ascii=False)
+        await self._save_json(analysis_id, "simulation/simulation_results.json", simulation_data)
 
         logger.info(f"Saved simulation data", extra={"analysis_id": analysis_id})
 
-    def save_final_report(self, analysis_id: str, report: Dict[str, Any]):
+    async def save_final_report(self, analysis_id: str, report: Dict[str, Any]):
         """
         Save final analysis report.
 
@@ -146,15 +223,11 @@ class JSONStore:
             analysis_id: Analysis ID
             report: Final report data
         """
-        analysis_dir = self.get_analysis_dir(analysis_id)
-        file_path = analysis_dir / "final_report.json"
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        await self._save_json(analysis_id, "final_report.json", report)
 
         logger.info(f"Saved final report", extra={"analysis_id": analysis_id})
 
-    def load_final_report(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+    async def load_final_report(self, analysis_id: str) -> Optional[Dict[str, Any]]:
         """
         Load final analysis report.
 
@@ -164,25 +237,87 @@ class JSONStore:
         Returns:
             Report data or None if not found
         """
-        analysis_dir = self.get_analysis_dir(analysis_id)
-        file_path = analysis_dir / "final_report.json"
-
-        if not file_path.exists():
-            return None
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return await self._load_json(analysis_id, "final_report.json")
 
-    def delete_analysis(self, analysis_id: str):
+    async def delete_analysis(self, analysis_id: str):
         """
         Delete all files for an analysis.
 
         Args:
             analysis_id: Analysis ID
         """
-        import shutil
-        analysis_dir = self.base_path / analysis_id
+        def delete():
+            if self.segments is not None:
+                self.segments.delete_prefix(f"{analysis_id}/")
+            shutil.rmtree(self.get_analysis_dir(analysis_id), ignore_errors=True)
+            shutil.rmtree(self._legacy_analysis_dir(analysis_id), ignore_errors=True)
+
+        await self._run(delete)
+        logger.info(f"Deleted analysis data", extra={"analysis_id": analysis_id})
+
+    def migrate_legacy(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Move analyses from the old flat layout into the current layout.
+
+        Directories are renamed into their shard; with segments enabled,
+        JSON artifacts are packed into segment files and raw content is
+        moved into the shard. Safe to re-run after an interruption.
+
+        Args:
+            dry_run: Only count what would be migrated
+
+        Returns:
+            Counts of migrated analyses and packed files
+        """
+        stats = {"analyses": 0, "packed_files": 0}
+
+        for entry in sorted(self.base_path.iterdir()):
+            # Shard directories are two hex characters; skip them and segments
+            if not entry.is_dir() or len(entry.name) == 2 or entry.name == SEGMENTS_DIR:
+                continue
+
+            analysis_id = entry.name
+            stats["analyses"] += 1
+            if dry_run:
+                continue
+
+            if self.segments is not None:
+                for path in sorted(entry.rglob("*.json")):
+                    relative_path = path.relative_to(entry).as_posix()
+                    self.segments.put(f"{analysis_id}/{relative_path}", path.read_bytes())
+                    path.unlink()
+                    stats["packed_files"] += 1
+
+            target = self.get_analysis_dir(analysis_id)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.exists():
+                # Merge into a directory created after the upgrade
+                for path in sorted(p for p in entry.rglob("*") if p.is_file()):
+                    destination = target / path.relative_to(entry)
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    path.replace(destination)
+                shutil.rmtree(entry)
+            else:
+                entry.replace(target)
+
+            # Drop directories left empty by packing
+            for directory in sorted((p for p in target.rglob("*") if p.is_dir()), reverse=True):
+                if not any(directory.iterdir()):
+                    directory.rmdir()
+            if target.exists() and not any(target.iterdir()):
+                target.rmdir()
+
+            logger.info("Migrated analysis storage", extra={"analysis_id": analysis_id})
+
+        return stats
+
+    def compact_segments(self) -> Optional[Dict[str, int]]:
+        """
+        Reclaim space held by overwritten and deleted artifacts in segments.
 
-        if analysis_dir.exists():
-            shutil.rmtree(analysis_dir)
-            logger.info(f"Deleted analysis data", extra={"analysis_id": analysis_id})
+        Returns:
+            Compaction stats, or None when segments are disabled
+        """
+        if self.segments is None:
+            return None
+        return self.segments.compact()
@@ -1,14 +1,24 @@
 """Repository layer for data access."""
+import json
+import time
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from arrs.models.analysis import Analysis, AnalysisStatus
 from arrs.models.crawled_content import CrawledContent
 from arrs.models.score_result import EngineScore, Gap
 from arrs.models.simulation_result import SimulationResult
 from arrs.storage.database import Database, serialize_json_field, deserialize_json_field
 from arrs.storage.json_store import JSONStore
+from arrs.storage.blob_store import BlobStore
+from arrs.storage.unit_of_work import (
+    AnalysisUnitOfWork,
+    GroupCommitter,
+    INSERT_SIMULATION_SQL,
+    simulation_row
+)
 from arrs.utils.logger import setup_logger
+from config import settings
 
 logger = setup_logger(__name__)
 
@@ -16,16 +26,66 @@ logger = setup_logger(__name__)
 class Repository:
     """Data access repository combining database and JSON storage."""
 
-    def __init__(self, database: Database, json_store: JSONStore):
+    def __init__(
+        self,
+        database: Database,
+        json_store: JSONStore,
+        group_commit: Optional[bool] = None,
+        blob_store: Optional[BlobStore] = None
+    ):
         """
         Initialize repository.
 
         Args:
             database: Database instance
             json_store: JSON store instance
+            group_commit: Share transactions across concurrent analyses (settings if omitted)
+            blob_store: Raw HTML blob store (configured from settings if omitted)
         """
         self.db = database
         self.json_store = json_store
+        self.blob_store = blob_store or BlobStore(
+            settings.blob_storage_path,
+            compression=settings.blob_compression
+        )
+
+        if group_commit is None:
+            group_commit = settings.db_group_commit
+        self.group_committer = GroupCommitter(
+            database,
+            max_batch=settings.db_group_commit_max_batch,
+            max_delay=settings.db_group_commit_max_delay_ms / 1000
+        ) if group_commit else None
+
+    # Unit of work
+    def begin_analysis(self, url: str, analysis_id: Optional[str] = None) -> AnalysisUnitOfWork:
+        """
+        Start a new analysis whose writes are buffered until commit.
+
+        Nothing is written until the unit of work commits, so readers never
+        see a half-written analysis. Passing the ID of a pending analysis
+        completes that row instead of creating a new one.
+
+        Args:
+            url: URL to analyze
+            analysis_id: Existing analysis ID (new ID if omitted)
+
+        Returns:
+            Unit of work holding the analysis
+        """
+        analysis = Analysis(
+            id=analysis_id or str(uuid.uuid4()),
+            url=url,
+            created_at=datetime.now(),
+            status=AnalysisStatus.PROCESSING
+        )
+        return AnalysisUnitOfWork(
+            self.db,
+            self.json_store,
+            self.blob_store,
+            analysis,
+            self.group_committer
+        )
 
     # Analysis operations
     async def create_analysis(self, url: str) -> Analysis:
@@ -98,38 +158,76 @@ class Repository:
         )
         logger.info("Updated analysis status", extra={"analysis_id": analysis_id, "status": status.value})
 
-    async def update_composite_score(self, analysis_id: str, score: float):
-        """Update composite score."""
-        await self.db.execute(
-            "UPDATE analyses SET composite_score = ? WHERE id = ?",
-            (score, analysis_id)
-        )
-        logger.info("Updated composite score", extra={"analysis_id": analysis_id, "score": score})
+    async def fail_unfinished_analyses(self, error_message: str):
+        """
+        Mark every pending or processing analysis as failed.
 
-    # Crawled content operations
-    async def save_crawled_content(self, content: CrawledContent):
-        """Save crawled content."""
+        Used at startup: jobs queued in memory do not survive a restart.
+
+        Args:
+            error_message: Error recorded on the affected analyses
+        """
         await self.db.execute(
-            """INSERT INTO crawled_pages (id, analysis_id, url, html_content, crawled_at, crawl_method, status_code)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            "UPDATE analyses SET status = ?, error_message = ? WHERE status IN (?, ?)",
             (
-                content.id,
-                content.analysis_id,
-                content.url,
-                content.html_content[:50000],  # Store first 50KB in DB
-                content.crawled_at.isoformat(),
-                content.crawl_method,
-                content.status_code
+                AnalysisStatus.FAILED.value,
+                error_message,
+                AnalysisStatus.PENDING.value,
+                AnalysisStatus.PROCESSING.value
             )
         )
+        logger.info("Failed unfinished analyses", extra={"reason": error_message})
+
+    # Checkpoint operations
+    async def save_checkpoint(self, analysis_id: str, stage: str, data: Any):
+        """
+        Record the output of a finished pipeline stage.
+
+        Args:
+            analysis_id: Analysis ID
+            stage: Pipeline stage name
+            data: JSON-serializable stage output
+        """
+        await self.db.execute(
+            """INSERT OR REPLACE INTO job_checkpoints (analysis_id, stage, data, created_at)
+               VALUES (?, ?, ?, ?)""",
+            (analysis_id, stage, json.dumps(data, default=str), time.time())
+        )
+        logger.info("Saved checkpoint", extra={"analysis_id": analysis_id, "stage": stage})
+
+    async def load_checkpoints(self, analysis_id: str) -> Dict[str, Any]:
+        """
+        Load the checkpoints of an unfinished analysis.
 
-        # Save full HTML to JSON
-        self.json_store.save_raw_content(content.analysis_id, f"{content.id}.html", content.html_content)
+        Args:
+            analysis_id: Analysis ID
 
-        logger.info("Saved crawled content", extra={"analysis_id": content.analysis_id, "url": content.url})
+        Returns:
+            Stage outputs keyed by stage name
+        """
+        rows = await self.db.fetch_all(
+            "SELECT stage, data FROM job_checkpoints WHERE analysis_id = ?",
+            (analysis_id,)
+        )
+        return {row["stage"]: json.loads(row["data"]) for row in rows}
+
+    # Crawled content operations
+    async def get_crawled_content(
+        self,
+        analysis_id: str,
+        include_html: bool = True
+    ) -> Optional[CrawledContent]:
+        """
+        Get crawled content for analysis.
 
-    async def get_crawled_content(self, analysis_id: str) -> Optional[CrawledContent]:
-        """Get crawled content for analysis."""
+        Args:
+            analysis_id: Analysis ID
+            include_html: Decompress the raw HTML now; otherwise html_content is
+                empty until load_crawled_html() is called
+
+        Returns:
+            Crawled content or None
+        """
         row = await self.db.fetch_one(
             "SELECT * FROM crawled_pages WHERE analysis_id = ? LIMIT 1",
             (analysis_id,)
@@ -138,42 +236,79 @@ class Repository:
         if not row:
             return None
 
-        # Load full HTML from JSON
-        full_html = self.json_store.load_raw_content(analysis_id, f"{row['id']}.html")
-
-        return CrawledContent(
+        content = CrawledContent(
             id=row["id"],
             analysis_id=row["analysis_id"],
             url=row["url"],
-            html_content=full_html or row["html_content"],
+            html_content="",
             crawled_at=datetime.fromisoformat(row["crawled_at"]),
             crawl_method=row["crawl_method"],
-            status_code=row["status_code"]
+            status_code=row["status_code"],
+            content_hash=row["content_hash"]
         )
 
-    # Engine score operations
-    async def save_engine_score(self, score: EngineScore):
-        """Save engine score."""
-        await self.db.execute(
-            """INSERT INTO engine_scores (id, analysis_id, engine_name, score, weight, details, calculated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                score.id,
-                score.analysis_id,
-                score.engine_name,
-                score.score,
-                score.weight,
-                serialize_json_field(score.details),
-                score.calculated_at.isoformat()
-            )
-        )
+        if include_html:
+            content.html_content = await self._load_html(content, row["html_content"])
+        return content
 
-        logger.info("Saved engine score", extra={
-            "analysis_id": score.analysis_id,
-            "engine": score.engine_name,
-            "score": score.score
-        })
+    async def load_crawled_html(self, content: CrawledContent) -> str:
+        """
+        Load the raw HTML of content fetched with include_html=False.
+
+        Args:
+            content: Crawled content
+
+        Returns:
+            Raw HTML (also stored on the content object)
+        """
+        if not content.html_content:
+            legacy_prefix = None
+            if not content.content_hash:
+                row = await self.db.fetch_one(
+                    "SELECT html_content FROM crawled_pages WHERE id = ?",
+                    (content.id,)
+                )
+                legacy_prefix = row["html_content"] if row else None
+            content.html_content = await self._load_html(content, legacy_prefix)
+        return content.html_content
+
+    async def _load_html(self, content: CrawledContent, legacy_prefix: Optional[str]) -> str:
+        """Read HTML from the blob store, falling back to the pre-blob layout."""
+        if content.content_hash:
+            html = await self.blob_store.get_text(content.content_hash)
+            if html is not None:
+                return html
+            logger.warning("Missing HTML blob", extra={
+                "analysis_id": content.analysis_id,
+                "content_hash": content.content_hash
+            })
+
+        # Legacy rows: full HTML in the JSON store, first 50KB in the DB
+        full_html = await self.json_store.load_raw_content(content.analysis_id, f"{content.id}.html")
+        return full_html or legacy_prefix or ""
+
+    async def find_analysis_by_content(self, url: str, content_hash: str) -> Optional[str]:
+        """
+        Find the latest completed analysis of identical page content.
+
+        Args:
+            url: Final URL of the crawled page
+            content_hash: Blob store key of the page HTML
 
+        Returns:
+            Analysis ID, or None if this content was never analyzed
+        """
+        row = await self.db.fetch_one(
+            """SELECT a.id FROM crawled_pages c
+               JOIN analyses a ON a.id = c.analysis_id
+               WHERE c.content_hash = ? AND c.url = ? AND a.status = ?
+               ORDER BY a.created_at DESC
+               LIMIT 1""",
+            (content_hash, url, AnalysisStatus.COMPLETED.value)
+        )
+        return row["id"] if row else None
+
+    # Engine score operations
     async def get_engine_scores(self, analysis_id: str) -> List[EngineScore]:
         """Get all engine scores for analysis."""
         rows = await self.db.fetch_all(
@@ -189,7 +324,9 @@ class Repository:
                 score=row["score"],
                 weight=row["weight"],
                 details=deserialize_json_field(row["details"]),
-                calculated_at=datetime.fromisoformat(row["calculated_at"])
+                calculated_at=datetime.fromisoformat(row["calculated_at"]),
+                scoring_version=row["scoring_version"],
+                reused_from=row["reused_from"]
             )
             for row in rows
         ]
@@ -197,25 +334,10 @@ class Repository:
     # Simulation operations
     async def save_simulation_result(self, result: SimulationResult):
         """Save simulation result."""
-        await self.db.execute(
-            """INSERT INTO simulation_results
-               (id, analysis_id, prompt, response, brand_cited, citation_count, missing_signals, simulated_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                result.id,
-                result.analysis_id,
-                result.prompt,
-                result.response,
-                1 if result.brand_cited else 0,
-                result.citation_count,
-                serialize_json_field(result.missing_signals),
-                result.simulated_at.isoformat(),
-                serialize_json_field(result.metadata)
-            )
-        )
+        await self.db.execute(INSERT_SIMULATION_SQL, simulation_row(result))
 
         # Also save to JSON
-        self.json_store.save_simulation_data(result.analysis_id, result.to_dict())
+        await self.json_store.save_simulation_data(result.analysis_id, result.to_dict())
 
         logger.info("Saved simulation result", extra={
             "analysis_id": result.analysis_id,
@@ -245,38 +367,6 @@ class Repository:
         )
 
     # Gap operations
-    async def save_gap(self, gap: Gap):
-        """Save identified gap."""
-        await self.db.execute(
-            """INSERT INTO gaps (id, analysis_id, gap_type, severity, description, recommendation, engine_source)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                gap.id,
-                gap.analysis_id,
-                gap.gap_type,
-                gap.severity,
-                gap.description,
-                gap.recommendation,
-                gap.engine_source
-            )
-        )
-
-    async def save_gaps(self, gaps: List[Gap]):
-        """Save multiple gaps."""
-        if not gaps:
-            return
-
-        await self.db.executemany(
-            """INSERT INTO gaps (id, analysis_id, gap_type, severity, description, recommendation, engine_source)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            [
-                (g.id, g.analysis_id, g.gap_type, g.severity, g.description, g.recommendation, g.engine_source)
-                for g in gaps
-            ]
-        )
-
-        logger.info("Saved gaps", extra={"count": len(gaps)})
-
     async def get_gaps(self, analysis_id: str) -> List[Gap]:
         """Get all gaps for analysis."""
         rows = await self.db.fetch_all(
@@ -292,7 +382,8 @@ class Repository:
                 severity=row["severity"],
                 description=row["description"],
                 recommendation=row["recommendation"],
-                engine_source=row["engine_source"]
+                engine_source=row["engine_source"],
+                reused_from=row["reused_from"]
             )
             for row in rows
         ]
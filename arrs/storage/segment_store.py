@@ -0,0 +1,291 @@
+"""Append-only segment files that pack many small artifacts into few large files."""
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from arrs.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # no flock on Windows: one writing process only
+    fcntl = None
+
+INDEX_FILE = "index.jsonl"
+LOCK_FILE = "segments.lock"
+SEGMENT_PATTERN = "segment-{:06d}.seg"
+
+# Index value: (segment number, byte offset, length)
+_Location = Tuple[int, int, int]
+
+
+class SegmentStore:
+    """
+    Key/value store over append-only segment files with an offset index.
+
+    Values are appended to the current segment; the index file records
+    where each key's latest value lives. Overwritten and deleted values stay
+    in their segment until compact() rewrites the store.
+
+    Several processes (API and workers) may share a store: writes hold an
+    exclusive flock on the lock file, and every call first reads index
+    entries other processes appended since the last call.
+
+    Every process keeps the location of every live key in memory (roughly
+    150 bytes per key), so memory grows with the number of stored artifacts.
+    """
+
+    def __init__(self, root: Path, max_segment_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize segment store.
+
+        Args:
+            root: Directory holding segment and index files
+            max_segment_bytes: Size after which a new segment is started
+        """
+        self.root = Path(root)
+        self.max_segment_bytes = max_segment_bytes
+        self._index: Dict[str, _Location] = {}
+        self._index_offset = 0  # bytes of the index file already applied
+        self._index_inode: Optional[int] = None  # changes when compact() replaces the index
+        self._segment = 1
+        # Calls arrive from executor threads
+        self._lock = threading.Lock()
+
+    def _segment_path(self, number: int) -> Path:
+        return self.root / SEGMENT_PATTERN.format(number)
+
+    def _segment_size(self, number: int) -> int:
+        try:
+            return self._segment_path(number).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @contextmanager
+    def _process_lock(self):
+        """Hold the cross-process write lock (caller holds the thread lock)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / LOCK_FILE, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _latest_segment(self) -> int:
+        """Highest segment number on disk (numbers are never reused)."""
+        numbers = [int(path.stem.split("-")[1]) for path in self.root.glob("segment-*.seg")]
+        return max(numbers, default=1)
+
+    def _reload_index(self):
+        """Forget the in-memory index so the next refresh reads the whole file."""
+        self._index = {}
+        self._index_offset = 0
+        self._index_inode = None
+        self._segment = self._latest_segment()
+
+    def _refresh_index(self) -> Dict[str, _Location]:
+        """Apply index entries appended since the last read (caller holds the thread lock)."""
+        try:
+            status = os.stat(self.root / INDEX_FILE)
+        except FileNotFoundError:
+            return self._index
+
+        # A compacted index is a new file; start over from its beginning
+        if status.st_ino != self._index_inode or status.st_size < self._index_offset:
+            self._reload_index()
+            self._index_inode = status.st_ino
+        if status.st_size == self._index_offset:
+            return self._index
+
+        try:
+            with open(self.root / INDEX_FILE, "rb") as f:
+                f.seek(self._index_offset)
+                tail = f.read()
+        except FileNotFoundError:
+            return self._index
+
+        # A line without its newline is still being written (or was torn by a crash)
+        complete = tail.rfind(b"\n") + 1
+        if not complete:
+            return self._index
+
+        sizes: Dict[int, int] = {}
+        for line in tail[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # torn line after a crash
+
+            if entry["n"] < 0:
+                self._index.pop(entry["k"], None)
+                continue
+
+            segment = entry["s"]
+            if segment not in sizes:
+                sizes[segment] = self._segment_size(segment)
+            # Skip entries whose data never fully reached the segment
+            if entry["o"] + entry["n"] <= sizes[segment]:
+                self._index[entry["k"]] = (segment, entry["o"], entry["n"])
+            self._segment = max(self._segment, segment)
+
+        self._index_offset += complete
+        return self._index
+
+    def _append_index(self, entries: List[dict]):
+        """Append index entries (caller holds both locks)."""
+        with open(self.root / INDEX_FILE, "ab") as f:
+            f.write("".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries).encode("utf-8"))
+
+    def put(self, key: str, data: bytes):
+        """
+        Append a value and point the key at it.
+
+        Args:
+            key: Artifact key
+            data: Value bytes
+        """
+        with self._lock, self._process_lock():
+            # Other processes may have rolled over to a newer segment
+            self._refresh_index()
+            segment_size = self._segment_size(self._segment)
+            if segment_size and segment_size + len(data) > self.max_segment_bytes:
+                self._segment += 1
+
+            with open(self._segment_path(self._segment), "ab") as f:
+                offset = f.tell()
+                f.write(data)
+
+            # Data first, then the index entry that makes it visible
+            self._append_index([{"k": key, "s": self._segment, "o": offset, "n": len(data)}])
+            self._refresh_index()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read the latest value of a key.
+
+        Args:
+            key: Artifact key
+
+        Returns:
+            Value bytes, or None if the key is unknown
+        """
+        with self._lock:
+            location = self._refresh_index().get(key)
+        if location is None:
+            return None
+
+        try:
+            return self._read(location)
+        except FileNotFoundError:
+            # Another process compacted the store since the index was read
+            with self._lock:
+                self._reload_index()
+                location = self._refresh_index().get(key)
+            return self._read(location) if location is not None else None
+
+    def _read(self, location: _Location) -> bytes:
+        segment, offset, length = location
+        with open(self._segment_path(segment), "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Drop every key starting with prefix (compact() reclaims the space).
+
+        Args:
+            prefix: Key prefix
+
+        Returns:
+            Number of keys removed
+        """
+        with self._lock, self._process_lock():
+            keys = [key for key in self._refresh_index() if key.startswith(prefix)]
+            if keys:
+                self._append_index([{"k": key, "n": -1} for key in keys])
+                self._refresh_index()
+        return len(keys)
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Rewrite live values into fresh segments and drop the old ones.
+
+        Reclaims the space held by overwritten and deleted values. Writers
+        wait on the process lock meanwhile; readers in other processes
+        reload the index when they notice it was replaced.
+
+        Returns:
+            Live keys, removed segments, and segment bytes before and after
+        """
+        with self._lock, self._process_lock():
+            index = self._refresh_index()
+            old_segments = sorted(self.root.glob("segment-*.seg"))
+            bytes_before = sum(path.stat().st_size for path in old_segments)
+
+            # New segment numbers continue after the old ones, so a location
+            # cached by another process never points into a rewritten file
+            first = self._latest_segment() + 1
+            segment, written = first, 0
+            sources: Dict[int, BinaryIO] = {}
+            fd, tmp_index = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as index_file:
+                    output = open(self._segment_path(segment), "ab")
+                    try:
+                        for key, (source, offset, length) in sorted(index.items(), key=lambda item: item[1]):
+                            if written and written + length > self.max_segment_bytes:
+                                output.close()
+                                segment, written = segment + 1, 0
+                                output = open(self._segment_path(segment), "ab")
+
+                            if source not in sources:
+                                sources[source] = open(self._segment_path(source), "rb")
+                            sources[source].seek(offset)
+                            output.write(sources[source].read(length))
+
+                            entry = {"k": key, "s": segment, "o": written, "n": length}
+                            index_file.write((json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8"))
+                            written += length
+                        output.flush()
+                        os.fsync(output.fileno())
+                    finally:
+                        output.close()
+                    index_file.flush()
+                    os.fsync(index_file.fileno())
+                # Data first, then the index that makes it visible
+                os.replace(tmp_index, self.root / INDEX_FILE)
+            except BaseException:
+                if os.path.exists(tmp_index):
+                    os.unlink(tmp_index)
+                raise
+            finally:
+                for source_file in sources.values():
+                    source_file.close()
+
+            for path in old_segments:
+                path.unlink()
+
+            self._reload_index()
+            self._refresh_index()
+            stats = {
+                "keys": len(self._index),
+                "segments_removed": len(old_segments),
+                "bytes_before": bytes_before,
+                "bytes_after": sum(path.stat().st_size for path in self.root.glob("segment-*.seg")),
+            }
+
+        logger.info("Compacted segment store", extra=stats)
+        return stats
+
+    def stats(self) -> Dict[str, int]:
+        """Key and segment counts."""
+        with self._lock:
+            index = self._refresh_index()
+            return {"keys": len(index), "segments": len({location[0] for location in index.values()})}
@@ -0,0 +1,312 @@
+"""Unit of work: buffer an analysis' writes and commit them in one transaction."""
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+from arrs.core.exceptions import StorageException
+from arrs.models.analysis import Analysis, AnalysisStatus
+from arrs.models.crawled_content import CrawledContent
+from arrs.models.score_result import EngineScore, Gap
+from arrs.models.simulation_result import SimulationResult
+from arrs.storage.blob_store import BlobStore
+from arrs.storage.database import Database, serialize_json_field
+from arrs.storage.json_store import JSONStore
+from arrs.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+UPSERT_ANALYSIS_SQL = """INSERT INTO analyses (id, url, created_at, status, composite_score, metadata, error_message)
+   VALUES (?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(id) DO UPDATE SET
+       status = excluded.status,
+       composite_score = excluded.composite_score,
+       metadata = excluded.metadata,
+       error_message = excluded.error_message"""
+
+INSERT_CRAWLED_PAGE_SQL = """INSERT INTO crawled_pages (id, analysis_id, url, content_hash, crawled_at, crawl_method, status_code)
+   VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+INSERT_ENGINE_SCORE_SQL = """INSERT INTO engine_scores
+   (id, analysis_id, engine_name, score, weight, details, calculated_at, scoring_version, reused_from)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+INSERT_SIMULATION_SQL = """INSERT INTO simulation_results
+   (id, analysis_id, prompt, response, brand_cited, citation_count, missing_signals, simulated_at, metadata)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+INSERT_GAP_SQL = """INSERT INTO gaps
+   (id, analysis_id, gap_type, severity, description, recommendation, engine_source, reused_from)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Checkpoints only exist to resume an unfinished analysis
+DELETE_CHECKPOINTS_SQL = "DELETE FROM job_checkpoints WHERE analysis_id = ?"
+
+Statement = Tuple[str, list]
+
+
+def analysis_row(analysis: Analysis) -> tuple:
+    """Parameters for UPSERT_ANALYSIS_SQL."""
+    return (
+        analysis.id,
+        analysis.url,
+        analysis.created_at.isoformat(),
+        analysis.status.value,
+        analysis.composite_score,
+        serialize_json_field(analysis.metadata),
+        analysis.error_message
+    )
+
+
+def crawled_page_row(content: CrawledContent) -> tuple:
+    """Parameters for INSERT_CRAWLED_PAGE_SQL."""
+    return (
+        content.id,
+        content.analysis_id,
+        content.url,
+        content.content_hash,
+        content.crawled_at.isoformat(),
+        content.crawl_method,
+        content.status_code
+    )
+
+
+def engine_score_row(score: EngineScore) -> tuple:
+    """Parameters for INSERT_ENGINE_SCORE_SQL."""
+    return (
+        score.id,
+        score.analysis_id,
+        score.engine_name,
+        score.score,
+        score.weight,
+        serialize_json_field(score.details),
+        score.calculated_at.isoformat(),
+        score.scoring_version,
+        score.reused_from
+    )
+
+
+def simulation_row(result: SimulationResult) -> tuple:
+    """Parameters for INSERT_SIMULATION_SQL."""
+    return (
+        result.id,
+        result.analysis_id,
+        result.prompt,
+        result.response,
+        1 if result.brand_cited else 0,
+        result.citation_count,
+        serialize_json_field(result.missing_signals),
+        result.simulated_at.isoformat(),
+        serialize_json_field(result.metadata)
+    )
+
+
+def gap_row(gap: Gap) -> tuple:
+    """Parameters for INSERT_GAP_SQL."""
+    return (
+        gap.id,
+        gap.analysis_id,
+        gap.gap_type,
+        gap.severity,
+        gap.description,
+        gap.recommendation,
+        gap.engine_source,
+        gap.reused_from
+    )
+
+
+def _resolve(future: asyncio.Future, error: Optional[BaseException] = None):
+    """Settle a submitter's future unless it is already done (or its waiter was cancelled)."""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+class GroupCommitter:
+    """Coalesces commits from many concurrent analyses into shared transactions."""
+
+    def __init__(self, database: Database, max_batch: int = 64, max_delay: float = 0.02):
+        """
+        Initialize group committer.
+
+        Args:
+            database: Database to commit to
+            max_batch: Units of work per transaction before flushing immediately
+            max_delay: Seconds to wait for more units of work before flushing
+        """
+        self.db = database
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay
+        self._pending: List[Tuple[List[Statement], asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        # Flushes run in their own tasks so a cancelled submitter can't strand the batch
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, statements: List[Statement]):
+        """
+        Queue statements and wait until the transaction holding them commits.
+
+        Cancelling the caller stops the wait, not the commit: the statements
+        are committed with the rest of their batch.
+
+        Args:
+            statements: Statements of one unit of work
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((statements, future))
+
+        if len(self._pending) >= self.max_batch:
+            flush = asyncio.create_task(self.flush())
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+        await future
+
+    async def _flush_later(self):
+        """Flush after max_delay unless a full batch flushed first."""
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self):
+        """Commit every queued unit of work in one transaction."""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            try:
+                await self.db.execute_batch(
+                    [statement for statements, _ in batch for statement in statements]
+                )
+            except Exception as e:
+                # Isolate the failing unit of work: retry each one on its own
+                logger.warning(f"Group commit failed, committing individually: {e}")
+                for statements, future in batch:
+                    try:
+                        await self.db.execute_batch(statements)
+                        _resolve(future)
+                    except Exception as unit_error:
+                        _resolve(future, unit_error)
+                return
+
+            for _, future in batch:
+                _resolve(future)
+            logger.info("Group commit", extra={"units": len(batch)})
+        finally:
+            # Never leave a submitter waiting, even if this flush was cancelled
+            for _, future in batch:
+                _resolve(future, StorageException("Group commit was interrupted"))
+
+
+class AnalysisUnitOfWork:
+    """Buffers every write for one analysis until commit()."""
+
+    def __init__(
+        self,
+        database: Database,
+        json_store: JSONStore,
+        blob_store: BlobStore,
+        analysis: Analysis,
+        group_committer: Optional[GroupCommitter] = None
+    ):
+        """
+        Initialize unit of work.
+
+        Args:
+            database: Database to commit to
+            json_store: JSON store for simulation files
+            blob_store: Blob store for raw HTML
+            analysis: Analysis the buffered rows belong to
+            group_committer: Shares transactions with other analyses if given
+        """
+        self.db = database
+        self.json_store = json_store
+        self.blob_store = blob_store
+        self.analysis = analysis
+        self.group_committer = group_committer
+
+        self.crawled_pages: List[CrawledContent] = []
+        self.engine_scores: List[EngineScore] = []
+        self.simulation_results: List[SimulationResult] = []
+        self.gaps: List[Gap] = []
+
+    def set_status(self, status: AnalysisStatus, error_message: Optional[str] = None):
+        """Set analysis status."""
+        self.analysis.status = status
+        self.analysis.error_message = error_message
+
+    def set_composite_score(self, score: float):
+        """Set composite score."""
+        self.analysis.composite_score = score
+
+    def merge_metadata(self, metadata: Dict[str, Any]):
+        """Merge keys into analysis metadata."""
+        self.analysis.metadata = {**self.analysis.metadata, **metadata}
+
+    def add_crawled_content(self, content: CrawledContent):
+        """Buffer crawled content."""
+        self.crawled_pages.append(content)
+
+    def add_engine_scores(self, scores: List[EngineScore]):
+        """Buffer engine scores."""
+        self.engine_scores.extend(scores)
+
+    def add_simulation_result(self, result: SimulationResult):
+        """Buffer a simulation result."""
+        self.simulation_results.append(result)
+
+    def add_gaps(self, gaps: List[Gap]):
+        """Buffer identified gaps."""
+        self.gaps.extend(gaps)
+
+    def fail(self, error_message: str):
+        """Drop buffered results and record the analysis as failed."""
+        self.crawled_pages = []
+        self.engine_scores = []
+        self.simulation_results = []
+        self.gaps = []
+        self.set_status(AnalysisStatus.FAILED, error_message=error_message)
+
+    def statements(self) -> List[Statement]:
+        """SQL statements for everything buffered, analysis row first."""
+        statements = [(UPSERT_ANALYSIS_SQL, [analysis_row(self.analysis)])]
+
+        if self.crawled_pages:
+            statements.append((INSERT_CRAWLED_PAGE_SQL, [crawled_page_row(c) for c in self.crawled_pages]))
+        if self.engine_scores:
+            statements.append((INSERT_ENGINE_SCORE_SQL, [engine_score_row(s) for s in self.engine_scores]))
+        if self.simulation_results:
+            statements.append((INSERT_SIMULATION_SQL, [simulation_row(r) for r in self.simulation_results]))
+        if self.gaps:
+            statements.append((INSERT_GAP_SQL, [gap_row(g) for g in self.gaps]))
+
+        statements.append((DELETE_CHECKPOINTS_SQL, [(self.analysis.id,)]))
+        return statements
+
+    async def commit(self):
+        """Write side files, then commit all rows atomically."""
+        # Files first: rows never point at content that was not written
+        for content in self.crawled_pages:
+            content.content_hash = await self.blob_store.put(content.html_content)
+        for result in self.simulation_results:
+            await self.json_store.save_simulation_data(result.analysis_id, result.to_dict())
+
+        statements = self.statements()
+        if self.group_committer is not None:
+            await self.group_committer.submit(statements)
+        else:
+            await self.db.execute_batch(statements)
+
+        logger.info("Committed analysis", extra={
+            "analysis_id": self.analysis.id,
+            "status": self.analysis.status.value,
+            "engine_scores": len(self.engine_scores),
+            "gaps": len(self.gaps)
+        })
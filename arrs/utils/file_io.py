@@ -0,0 +1,27 @@
+"""File I/O helpers shared by the storage layer."""
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """
+    Write a file atomically (temp file in the same directory + rename).
+
+    Readers see either the old file or the complete new one, never a partial
+    write. Parent directories are created as needed.
+
+    Args:
+        path: Destination file
+        data: File content
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,92 @@
+"""In-process counters and latency percentiles (served by /api/metrics)."""
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional
+
+# Percentiles reported for every latency series
+REPORTED_PERCENTILES = (50, 90, 99)
+
+
+class Metrics:
+    """
+    Counters and rolling latency windows of the current process.
+
+    Worker processes keep their own; the API reports what ran in its process.
+    """
+
+    def __init__(self, window: int = 500):
+        """
+        Initialize metrics.
+
+        Args:
+            window: Most recent observations kept per latency series
+        """
+        self.window = window
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def increment(self, name: str, value: int = 1):
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        self._counters[name] += value
+
+    def observe(self, name: str, seconds: float):
+        """
+        Record a latency observation.
+
+        Args:
+            name: Latency series name
+            seconds: Observed duration
+        """
+        series = self._latencies.get(name)
+        if series is None:
+            series = self._latencies[name] = deque(maxlen=self.window)
+        series.append(seconds)
+
+    def percentile(self, name: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Nearest-rank percentile of a latency series.
+
+        Args:
+            name: Latency series name
+            percentile: Percentile (0-100)
+            min_samples: Observations required for a meaningful answer
+
+        Returns:
+            Latency in seconds, or None with fewer than min_samples observations
+        """
+        series = self._latencies.get(name)
+        if not series or len(series) < min_samples:
+            return None
+        ordered = sorted(series)
+        rank = max(1, -(-len(ordered) * percentile // 100))  # ceil
+        return ordered[min(int(rank), len(ordered)) - 1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All counters, plus count and percentiles of every latency series."""
+        return {
+            "counters": dict(self._counters),
+            "latencies": {
+                name: {
+                    "count": len(series),
+                    **{f"p{p}": self.percentile(name, p) for p in REPORTED_PERCENTILES}
+                }
+                for name, series in self._latencies.items()
+            }
+        }
+
+
+# Process-wide metrics, created on first use
+_metrics: Optional[Metrics] = None
+
+
+def get_metrics() -> Metrics:
+    """Get the process-wide metrics."""
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
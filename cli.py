@@ -1,5 +1,6 @@
 """CLI interface for ARRS system."""
 import asyncio
+import os
 import typer
 import json
 from rich.console import Console
@@ -13,6 +14,11 @@ from arrs.storage.json_store import JSONStore
 from arrs.storage.repository import Repository
 from arrs.core.orchestrator import AnalysisOrchestrator
 from arrs.reporting.report_generator import ReportGenerator
+from arrs.crawlers.http_client import close_http_client
+from arrs.crawlers.browser_pool import close_browser_pool
+from arrs.core.executor import shutdown_cpu_executor
+from arrs.core.exceptions import JobException
+from arrs.core.worker import run_workers
 from config import settings
 
 app = typer.Typer()
@@ -33,7 +39,9 @@ def analyze(
     brand: str = typer.Option(None, "--brand", "-b", help="Brand name"),
     category: str = typer.Option(None, "--category", "-c", help="Product category"),
     use_case: str = typer.Option(None, "--use-case", "-u", help="Use case for simulation"),
-    output: str = typer.Option(None, "--output", "-o", help="Output JSON file path")
+    output: str = typer.Option(None, "--output", "-o", help="Output JSON file path"),
+    force_refresh: bool = typer.Option(False, "--force-refresh", help="Re-fetch the page even if a cached crawl is fresh"),
+    fresh_simulation: bool = typer.Option(False, "--fresh-simulation", help="Sample new AI simulation responses instead of reusing cached ones")
 ):
     """Analyze a URL and generate ARRS score."""
     console.print(Panel.fit(
@@ -59,7 +67,9 @@ def analyze(
                     url,
                     brand=brand,
                     product_category=category,
-                    use_case=use_case
+                    use_case=use_case,
+                    force_refresh=force_refresh,
+                    fresh_simulation=fresh_simulation
                 )
 
                 progress.update(task, completed=True)
@@ -82,6 +92,12 @@ def analyze(
                 console.print(f"\n[red]✗ Analysis failed:[/red] {e}")
                 raise typer.Exit(code=1)
 
+            finally:
+                await close_http_client()
+                await close_browser_pool()
+                shutdown_cpu_executor()
+                await repo.db.close()
+
     # Run async analysis
     analysis_id = asyncio.run(run_analysis())
     console.print(f"\n[bold]Analysis ID:[/bold] {analysis_id}")
@@ -113,6 +129,9 @@ def report(
             console.print(f"[red]✗ Error:[/red] {e}")
             raise typer.Exit(code=1)
 
+        finally:
+            await repo.db.close()
+
     asyncio.run(get_report())
 
 
@@ -125,11 +144,68 @@ def init():
         db_path = settings.database_url.replace("sqlite:///", "")
         db = Database(db_path)
         await db.initialize()
+        await db.close()
 
     asyncio.run(initialize())
     console.print("[green]✓ Database initialized successfully![/green]")
 
 
+@app.command()
+def worker(
+    processes: int = typer.Option(None, "--processes", "-p", help="Worker processes (default: WORKER_PROCESSES, 0 = one per CPU core)"),
+    concurrency: int = typer.Option(None, "--concurrency", "-c", help="Analyses run at once per process (default: JOB_WORKERS)"),
+    drain_timeout: float = typer.Option(None, "--drain-timeout", help="Seconds running analyses get to finish on SIGTERM")
+):
+    """Run analysis worker processes that pull jobs from the shared queue."""
+    processes = settings.worker_processes if processes is None else processes
+    processes = processes or os.cpu_count() or 1
+    concurrency = concurrency or settings.job_workers
+    drain_timeout = settings.worker_drain_timeout if drain_timeout is None else drain_timeout
+
+    console.print(
+        f"[cyan]Starting {processes} worker process(es), "
+        f"{concurrency} concurrent analyses each (Ctrl+C or SIGTERM to drain and stop)[/cyan]"
+    )
+    try:
+        run_workers(processes, concurrency, drain_timeout)
+    except JobException as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    console.print("[green]✓ Workers stopped[/green]")
+
+
+@app.command("migrate-store")
+def migrate_store(
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only report what would be migrated"),
+    compact: bool = typer.Option(False, "--compact", help="Rewrite segments to drop overwritten and deleted artifacts")
+):
+    """Move JSON storage from the flat layout into shards (and segments, if enabled)."""
+    json_store = JSONStore(settings.json_storage_path)
+    mode = "segments" if json_store.segments is not None else "sharded directories"
+    console.print(f"[cyan]Migrating {settings.json_storage_path} to {mode}...[/cyan]")
+
+    stats = json_store.migrate_legacy(dry_run=dry_run)
+
+    if dry_run:
+        console.print(f"[yellow]{stats['analyses']} analyses would be migrated[/yellow]")
+    else:
+        console.print(
+            f"[green]✓ Migrated {stats['analyses']} analyses "
+            f"({stats['packed_files']} files packed into segments)[/green]"
+        )
+
+    if compact and not dry_run:
+        compacted = json_store.compact_segments()
+        if compacted is None:
+            console.print("[yellow]Segments are disabled; nothing to compact[/yellow]")
+        else:
+            saved_mb = (compacted["bytes_before"] - compacted["bytes_after"]) / (1024 * 1024)
+            console.print(
+                f"[green]✓ Compacted {compacted['keys']} artifacts, "
+                f"removed {compacted['segments_removed']} segments ({saved_mb:.1f} MB freed)[/green]"
+            )
+
+
 def display_results(summary: dict):
     """Display analysis results in a formatted table."""
     console.print("\n")
@@ -13,11 +13,53 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///data/database.db"
     json_storage_path: str = "./data/analyses"
+    json_store_segments: bool = False  # Pack small JSON artifacts into segment files (index of every key held in memory)
+    json_store_segment_max_mb: int = 64
+    blob_storage_path: str = "./data/blobs"  # Content-addressed raw HTML
+    blob_compression: str = "zstd"  # "zstd" or "gzip"
+    sqlite_reader_pool_size: int = 4  # Read-only connections (one writer is always kept)
+    sqlite_synchronous: str = "NORMAL"  # NORMAL is durable enough under WAL
+    sqlite_cache_size: int = -20000  # Negative = KiB of page cache per connection
+    sqlite_mmap_size: int = 268435456  # 256 MiB memory-mapped I/O
+    sqlite_busy_timeout_ms: int = 5000
+    db_group_commit: bool = False  # Batch mode: share commits across concurrent analyses
+    db_group_commit_max_batch: int = 64
+    db_group_commit_max_delay_ms: float = 20.0
 
     # Crawler Settings
     crawler_timeout: int = 30
     crawler_user_agent: str = "ARRS-Bot/1.0"
     playwright_headless: bool = True
+    playwright_pool_size: int = 1  # Warm browser processes
+    playwright_max_contexts: int = 4  # Concurrent crawl contexts across the pool
+    playwright_pages_per_browser: int = 50  # Recycle a browser after this many pages
+
+    # HTTP Client Settings (shared, pooled client)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_max_connections_per_host: int = 6
+    http_enable_http2: bool = True
+
+    # CPU Worker Settings (parsing and scoring run in a process pool)
+    enable_process_pool: bool = True  # False runs parsing/scoring inline on the event loop
+    cpu_workers: int = 0  # 0 = one worker per CPU core
+    engine_timeout: float = 30.0  # Seconds per scoring engine before it is skipped
+
+    # Job Queue (POST /api/analyze enqueues; workers run analyses in the background)
+    job_backend: str = "sqlite"  # "sqlite" (durable, resumable) or "memory"
+    job_workers: int = 4  # Analyses running concurrently
+    job_queue_max_size: int = 1000  # Queued jobs before new requests are rejected
+    job_lease_seconds: float = 60.0  # A crashed worker's job is resumed after this
+    job_heartbeat_seconds: float = 15.0
+    job_poll_interval: float = 1.0
+    job_max_attempts: int = 3  # Interrupted runs before a job is failed
+    job_max_per_host: int = 2  # Analyses running at once against one host (0 = unlimited)
+    batch_max_urls: int = 50000
+    api_run_workers: bool = True  # False: the API only enqueues; run `cli.py worker` separately
+    worker_processes: int = 0  # `cli.py worker` processes; 0 = one per CPU core
+    worker_drain_timeout: float = 300.0  # Seconds running jobs get to finish on SIGTERM
+    events_poll_interval: float = 5.0  # SSE status check/keepalive when no events arrive (jobs in other processes)
 
     # Rate Limiting
     claude_rpm_limit: int = 50
@@ -30,7 +72,7 @@ class Settings(BaseSettings):
 
     # Feature Flags
     enable_playwright: bool = True
-    enable_caching: bool = True
+    enable_caching: bool = True  # Crawl cache: recently fetched pages are reused
     debug_mode: bool = False
 
     # LLM Provider Settings
@@ -38,6 +80,26 @@ class Settings(BaseSettings):
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama2"  # or "mistral", "phi", etc.
     openai_model: str = "gpt-4"  # or "gpt-3.5-turbo", "gpt-4-turbo", etc.
+    llm_timeout: float = 120.0  # Seconds per LLM request (all providers)
+    llm_max_retries: int = 2  # Retries on connection errors, 429 and 5xx
+
+    # LLM Response Cache (identical prompts reuse stored completions)
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_hours: float = 168.0
+    llm_cache_max_entries: int = 10000
+
+    # Crawl Cache (used when enable_caching is on; --force-refresh bypasses it)
+    crawl_cache_ttl_minutes: float = 60.0
+    crawl_cache_memory_entries: int = 128  # Pages (with HTML) kept in memory per process
+    crawl_cache_max_entries: int = 10000
+    crawl_revalidate: bool = True  # Conditional re-crawls; unchanged content reuses earlier results
+    crawl_reuse_max_age_hours: int = 168  # Results computed longer ago are recomputed
+    crawl_render_detection: bool = True  # Render JS app shells fetched as static HTML with Playwright
+    crawl_strategy_memory: bool = True  # Go straight to Playwright on domains that block static crawls
+    crawl_reprobe_hours: float = 24.0  # Retry the static crawler on such domains this often
+    crawl_hedging: bool = False  # Start Playwright alongside slow static crawls of unknown/flaky domains
+    crawl_hedge_percentile: float = 90.0  # Hedge once a static crawl outlasts this latency percentile
+    crawl_hedge_delay: float = 5.0  # Seconds, until enough static crawls were timed
 
     model_config = SettingsConfigDict(
         env_file=".env",
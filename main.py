@@ -1,15 +1,42 @@
 """FastAPI application for ARRS web interface."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pathlib import Path
 
-from arrs.api.routes import router as api_router
+from arrs.api.routes import router as api_router, db, job_queue, repository
+from arrs.crawlers.http_client import close_http_client
+from arrs.crawlers.browser_pool import close_browser_pool
+from arrs.core.executor import shutdown_cpu_executor
+from arrs.core.exceptions import JobException
+from config import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Apply migrations and start job workers on startup; release resources on shutdown."""
+    await db.initialize()
+    if settings.job_backend == "memory":
+        # Queued jobs lived in memory, so analyses left unfinished by a restart are lost
+        await repository.fail_unfinished_analyses("Interrupted by server restart")
+    if settings.api_run_workers:
+        await job_queue.start()
+    elif settings.job_backend != "sqlite":
+        raise JobException("API_RUN_WORKERS=false requires JOB_BACKEND=sqlite")
+    yield
+    await job_queue.stop()
+    await close_http_client()
+    await close_browser_pool()
+    shutdown_cpu_executor()
+    await db.close()
+
 
 app = FastAPI(
     title="ARRS - AI Readability & Recommendation Score",
     description="Optimize for AI citations, not search rankings",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Mount API routes
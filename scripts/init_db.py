@@ -19,6 +19,7 @@ async def main():
 
     db = Database(db_path)
     await db.initialize()
+    await db.close()
 
     print("✓ Database initialized successfully!")
     print(f"✓ Schema created")
@@ -77,6 +77,7 @@ async def test_database():
         # Test connection
         conn = await db.get_connection()
         await conn.close()
+        await db.close()
         print("✓ Database connection successful")
 
         return True
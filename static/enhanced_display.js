@@ -271,6 +271,74 @@ function createTooltip(metricKey, metricLabel) {
     `;
 }
 
+const POLL_INTERVAL_MS = 2000;
+
+function describeStage(stage) {
+    return stage.charAt(0).toUpperCase() + stage.slice(1).replace(/_/g, ' ');
+}
+
+function waitForAnalysis(analysisId) {
+    if (!window.EventSource) {
+        return pollAnalysis(analysisId);
+    }
+
+    const stageText = document.getElementById('loadingStage');
+    const engineScores = [];
+
+    return new Promise((resolve, reject) => {
+        const source = new EventSource(`/api/analysis/${analysisId}/events`);
+        const on = (type, handler) => source.addEventListener(type, (event) => handler(JSON.parse(event.data)));
+
+        on('stage', (data) => {
+            stageText.textContent = `${describeStage(data.stage)}... (${data.percent}%)`;
+        });
+        on('engine_score', (data) => {
+            engineScores.push(`${data.engine} ${data.score.toFixed(1)}`);
+            stageText.textContent = `Scoring... ${engineScores.join(', ')}`;
+        });
+        on('completed', () => {
+            source.close();
+            resolve();
+        });
+        on('failed', (data) => {
+            source.close();
+            reject(new Error(data.error || 'Analysis failed'));
+        });
+
+        source.onerror = () => {
+            // The browser reconnects by itself unless the stream was refused
+            if (source.readyState === EventSource.CLOSED) {
+                pollAnalysis(analysisId).then(resolve, reject);
+            }
+        };
+    });
+}
+
+async function pollAnalysis(analysisId) {
+    const stageText = document.getElementById('loadingStage');
+
+    while (true) {
+        const response = await fetch(`/api/analysis/${analysisId}`);
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.detail || 'Analysis failed');
+        }
+
+        const status = await response.json();
+        if (status.status === 'completed') {
+            return;
+        }
+        if (status.status === 'failed') {
+            throw new Error(status.error_message || 'Analysis failed');
+        }
+
+        if (status.progress) {
+            stageText.textContent = `${describeStage(status.progress.stage)}... (${status.progress.percent}%)`;
+        }
+        await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS));
+    }
+}
+
 form.addEventListener('submit', async (e) => {
     e.preventDefault();
 
@@ -304,6 +372,8 @@ form.addEventListener('submit', async (e) => {
         const data = await response.json();
         currentAnalysisId = data.analysis_id;
 
+        await waitForAnalysis(currentAnalysisId);
+
         const reportResponse = await fetch(`/api/report/${currentAnalysisId}`);
         const report = await reportResponse.json();
 
@@ -315,6 +385,7 @@ form.addEventListener('submit', async (e) => {
         form.style.display = 'block';
     } finally {
         loading.style.display = 'none';
+        document.getElementById('loadingStage').textContent = 'Analyzing website...';
     }
 });
 
@@ -0,0 +1,26 @@
+"""Shared fixtures for the ARRS test suite."""
+import pytest_asyncio
+from arrs.storage.blob_store import BlobStore
+from arrs.storage.database import Database
+from arrs.storage.json_store import JSONStore
+from arrs.storage.repository import Repository
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path):
+    """Initialized database in a temporary directory."""
+    db = Database(str(tmp_path / "arrs.db"))
+    await db.initialize()
+    yield db
+    await db.close()
+
+
+@pytest_asyncio.fixture
+async def repository(database, tmp_path):
+    """Repository over the temporary database, JSON store and blob store."""
+    return Repository(
+        database,
+        JSONStore(str(tmp_path / "json")),
+        group_commit=False,
+        blob_store=BlobStore(str(tmp_path / "blobs"))
+    )
@@ -0,0 +1,139 @@
+"""Tests for batch creation, status transitions and result streaming."""
+import pytest
+from arrs.core import batches
+from arrs.core.batches import BatchManager
+from arrs.core.exceptions import JobException
+from arrs.core.jobs import JOB_COMPLETED, JOB_FAILED, SQLiteJobQueue
+from arrs.models.analysis import AnalysisStatus
+
+pytestmark = pytest.mark.asyncio
+
+URLS = [f"https://example.com/page-{number}" for number in range(5)]
+
+
+async def noop_runner(job, report):
+    """Runner for queues whose workers are never started."""
+
+
+@pytest.fixture
+def queue(database):
+    return SQLiteJobQueue(noop_runner, database)
+
+
+@pytest.fixture
+def manager(database, queue):
+    return BatchManager(database, queue)
+
+
+async def finish_next(queue: SQLiteJobQueue, status: str = JOB_COMPLETED) -> str:
+    """Claim the next job and record its outcome; returns its analysis ID."""
+    job, _ = await queue._claim()
+    await queue._finish(job, status)
+    return job.analysis_id
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+async def test_create_dedupes_and_validates(manager):
+    batch = await manager.create(URLS + [URLS[0], "  "], brand="Example")
+
+    assert batch["status"] == "running"
+    assert batch["total"] == 5
+    assert batch["jobs"]["queued"] == 5
+    assert batch["brand"] == "Example"
+
+    with pytest.raises(JobException):
+        await manager.create(["ftp://example.com/file"])
+    with pytest.raises(JobException):
+        await manager.create([])
+
+
+async def test_pause_and_resume(manager, queue):
+    batch_id = (await manager.create(URLS))["batch_id"]
+
+    paused = await manager.pause(batch_id)
+    assert paused["status"] == "paused"
+    assert paused["jobs"]["paused"] == 5
+    assert await queue._claim() is None
+
+    with pytest.raises(JobException):
+        await manager.pause(batch_id)
+
+    resumed = await manager.resume(batch_id)
+    assert resumed["status"] == "running"
+    assert resumed["jobs"]["queued"] == 5
+    assert await queue._claim() is not None
+
+
+async def test_cancel_keeps_finished_and_running_jobs(manager, queue, repository):
+    batch_id = (await manager.create(URLS))["batch_id"]
+    finished_id = await finish_next(queue)
+    running_job, _ = await queue._claim()
+
+    cancelled = await manager.cancel(batch_id)
+
+    assert cancelled["status"] == "cancelled"
+    assert cancelled["jobs"]["completed"] == 1
+    assert cancelled["jobs"]["running"] == 1
+    assert cancelled["jobs"]["cancelled"] == 3
+    assert await queue._claim() is None
+
+    analyses = await repository.db.fetch_all("SELECT id, status FROM analyses")
+    statuses = {row["id"]: row["status"] for row in analyses}
+    assert statuses[finished_id] == AnalysisStatus.PENDING.value
+    assert statuses[running_job.analysis_id] == AnalysisStatus.PENDING.value
+    assert list(statuses.values()).count(AnalysisStatus.FAILED.value) == 3
+
+    with pytest.raises(JobException):
+        await manager.resume(batch_id)
+
+
+async def test_completed_batch_cannot_be_paused(manager, queue):
+    batch_id = (await manager.create(URLS[:2]))["batch_id"]
+    await finish_next(queue)
+    await finish_next(queue, JOB_FAILED)
+
+    assert (await manager.get(batch_id))["status"] == "completed"
+    with pytest.raises(JobException):
+        await manager.pause(batch_id)
+
+
+async def test_iter_finished_pages_by_cursor(manager, queue, monkeypatch):
+    monkeypatch.setattr(batches, "RESULTS_PAGE_SIZE", 2)
+    batch_id = (await manager.create(URLS))["batch_id"]
+    finished = [await finish_next(queue) for _ in range(5)]
+
+    results = await collect(manager.iter_finished(batch_id))
+    assert [result["analysis_id"] for result in results] == finished
+
+    # Resuming from a cursor continues after it
+    cursor = results[1]["cursor"]
+    rest = await collect(manager.iter_finished(batch_id, after=cursor))
+    assert [result["analysis_id"] for result in rest] == finished[2:]
+
+    limited = await collect(manager.iter_finished(batch_id, limit=3))
+    assert len(limited) == 3
+
+
+async def test_iter_finished_without_follow_returns_finished_so_far(manager, queue):
+    batch_id = (await manager.create(URLS))["batch_id"]
+    first = await finish_next(queue)
+
+    results = await collect(manager.iter_finished(batch_id, follow=False))
+
+    assert [result["analysis_id"] for result in results] == [first]
+
+
+async def test_iter_finished_follows_until_batch_done(manager, queue):
+    batch_id = (await manager.create(URLS[:3]))["batch_id"]
+    await finish_next(queue)
+    seen = []
+
+    async for result in manager.iter_finished(batch_id, poll_interval=0.01):
+        seen.append(result["analysis_id"])
+        if len(seen) < 3:
+            await finish_next(queue)
+
+    assert len(seen) == 3
@@ -0,0 +1,133 @@
+"""Tests for the two-tier crawl cache."""
+import types
+from datetime import datetime
+import pytest
+import pytest_asyncio
+from arrs.crawlers import crawl_cache
+from arrs.crawlers.crawl_cache import CrawlCache, make_crawl_key, normalize_url
+from arrs.models.crawled_content import CrawledContent
+
+
+class Clock:
+    """Stand-in for the time module with a settable time()."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = Clock()
+    monkeypatch.setattr(crawl_cache, "time", types.SimpleNamespace(time=fake.time))
+    return fake
+
+
+@pytest_asyncio.fixture
+async def cache(repository, clock):
+    cache = CrawlCache(repository.db, repository.blob_store, ttl_seconds=60, memory_entries=2, max_entries=3)
+    await cache.clear()  # the memory tier is shared by all instances
+    yield cache
+    await cache.clear()
+
+
+def page(url: str, method: str = "beautifulsoup") -> CrawledContent:
+    return CrawledContent(
+        id="crawl-1",
+        analysis_id="analysis-1",
+        url=url,
+        html_content=f"<html><body>{url}</body></html>",
+        crawled_at=datetime(2024, 1, 1),
+        crawl_method=method,
+        status_code=200
+    )
+
+
+async def disk_keys(cache: CrawlCache) -> set:
+    rows = await cache.db.fetch_all("SELECT key FROM crawl_cache")
+    return {row["key"] for row in rows}
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://Example.COM:443/a?b=2&a=1#frag") == "https://example.com/a?a=1&b=2"
+    assert normalize_url("http://example.com:8080") == "http://example.com:8080/"
+    assert make_crawl_key("https://example.com", "playwright") != make_crawl_key("https://example.com", "beautifulsoup")
+
+
+@pytest.mark.asyncio
+async def test_hit_returns_copy_for_new_analysis(cache):
+    await cache.set("https://example.com/a", page("https://example.com/a"))
+
+    hit = await cache.get("https://EXAMPLE.com/a#top", "analysis-2")
+
+    assert hit.analysis_id == "analysis-2"
+    assert hit.id not in ("", "crawl-1")
+    assert hit.html_content == "<html><body>https://example.com/a</body></html>"
+    hit.links.append("mutated")
+    assert (await cache.get("https://example.com/a", "analysis-3")).links == []
+
+
+@pytest.mark.asyncio
+async def test_method_preference(cache):
+    await cache.set("https://example.com/a", page("https://example.com/a", "playwright"))
+
+    assert await cache.get("https://example.com/a", "analysis-2", methods=("beautifulsoup",)) is None
+    hit = await cache.get("https://example.com/a", "analysis-2")
+    assert hit.crawl_method == "playwright"
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(cache, clock):
+    await cache.set("https://example.com/a", page("https://example.com/a"))
+
+    clock.now += 59
+    assert await cache.get("https://example.com/a", "analysis-2") is not None
+
+    clock.now += 2
+    assert await cache.get("https://example.com/a", "analysis-2") is None
+    # Expired rows are dropped on the next write
+    await cache.set("https://example.com/b", page("https://example.com/b"))
+    assert await disk_keys(cache) == {make_crawl_key("https://example.com/b", "beautifulsoup")}
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_serves_pages_evicted_from_memory(cache):
+    for name in "abc":
+        await cache.set(f"https://example.com/{name}", page(f"https://example.com/{name}"))
+
+    assert len(CrawlCache._memory) == 2
+    assert make_crawl_key("https://example.com/a", "beautifulsoup") not in CrawlCache._memory
+    assert (await cache.get("https://example.com/a", "analysis-2")).url == "https://example.com/a"
+    # The disk hit was promoted back into memory
+    assert make_crawl_key("https://example.com/a", "beautifulsoup") in CrawlCache._memory
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_evicts_least_recently_used(cache, clock):
+    for name in "abc":
+        await cache.set(f"https://example.com/{name}", page(f"https://example.com/{name}"))
+        clock.now += 1
+
+    # Reading "a" from disk makes "b" the least recently used entry
+    CrawlCache._memory.clear()
+    await cache.get("https://example.com/a", "analysis-2")
+    clock.now += 1
+    await cache.set("https://example.com/d", page("https://example.com/d"))
+
+    assert await disk_keys(cache) == {
+        make_crawl_key(f"https://example.com/{name}", "beautifulsoup") for name in "acd"
+    }
+
+
+@pytest.mark.asyncio
+async def test_missing_blob_is_a_miss(cache):
+    await cache.set("https://example.com/a", page("https://example.com/a"))
+    CrawlCache._memory.clear()
+    for path in cache.blob_store.base_path.rglob("*"):
+        if path.is_file():
+            path.unlink()
+
+    assert await cache.get("https://example.com/a", "analysis-2") is None
+    assert await disk_keys(cache) == set()
@@ -0,0 +1,101 @@
+"""Tests for per-domain crawl profiles."""
+import time
+import pytest
+import pytest_asyncio
+from arrs.crawlers.domain_profiles import DomainProfile, DomainProfileStore, domain_of
+from arrs.crawlers.render_detector import RenderDecision
+
+URL = "https://Shop.Example.com:8443/products/1"
+DAY = 24 * 3600
+
+
+@pytest_asyncio.fixture
+async def store(database):
+    return DomainProfileStore(database)
+
+
+async def block_static(store: DomainProfileStore, times: int):
+    """Static fetches fail, then Playwright succeeds, as in the orchestrator fallback."""
+    for _ in range(times):
+        await store.record_crawl(URL, "beautifulsoup", succeeded=False)
+    await store.record_crawl(URL, "playwright", succeeded=True, latency_ms=900)
+
+
+def test_domain_of():
+    assert domain_of(URL) == "shop.example.com"
+
+
+@pytest.mark.asyncio
+async def test_unseen_domain_has_empty_profile(store):
+    profile = await store.get(URL)
+
+    assert profile == DomainProfile(domain="shop.example.com")
+    assert profile.static_uncertain
+    assert not profile.skips_static(DAY)
+
+
+@pytest.mark.asyncio
+async def test_one_blocked_fetch_does_not_skip_static(store):
+    await block_static(store, 1)
+    profile = await store.get(URL)
+
+    assert profile.static_attempts == 1
+    assert profile.preferred_method == "playwright"
+    assert not profile.skips_static(DAY)
+
+
+@pytest.mark.asyncio
+async def test_repeatedly_blocked_domain_skips_static(store):
+    await block_static(store, 2)
+    profile = await store.get(URL)
+
+    assert profile.static_attempts == 2
+    assert profile.static_block_rate == 1.0
+    assert profile.browser_latency_ms == 900
+    assert profile.skips_static(DAY)
+
+
+@pytest.mark.asyncio
+async def test_reprobe_after_interval(store):
+    await block_static(store, 2)
+    profile = await store.get(URL)
+
+    profile.last_probed_at = time.time() - DAY - 1
+    assert not profile.skips_static(DAY)
+    assert profile.skips_static(2 * DAY)
+
+
+@pytest.mark.asyncio
+async def test_successful_reprobe_restores_static(store):
+    await block_static(store, 2)
+    await store.record_crawl(URL, "beautifulsoup", succeeded=True, latency_ms=120)
+    profile = await store.get(URL)
+
+    assert profile.preferred_method == "beautifulsoup"
+    assert profile.static_latency_ms == 120
+    assert not profile.skips_static(DAY)
+
+
+@pytest.mark.asyncio
+async def test_static_uncertain_tracks_recent_failures(store):
+    for _ in range(3):
+        await store.record_crawl(URL, "beautifulsoup", succeeded=True, latency_ms=100)
+    assert not (await store.get(URL)).static_uncertain
+
+    await store.record_crawl(URL, "beautifulsoup", succeeded=False)
+    assert (await store.get(URL)).static_uncertain
+
+
+@pytest.mark.asyncio
+async def test_render_decisions_set_render_prior(store):
+    needs_render = RenderDecision(True, "app_shell", 10, 0.01)
+    for _ in range(3):
+        await store.record_render_decision(URL, needs_render)
+    profile = await store.get(URL)
+
+    assert profile.render_checks == 3
+    assert profile.last_render_reason == "app_shell"
+    assert profile.usually_needs_render
+
+    await store.record_render_decision(URL, RenderDecision(False, "static_content", 900, 0.2))
+    assert not (await store.get(URL)).usually_needs_render
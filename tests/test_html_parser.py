@@ -0,0 +1,133 @@
+"""Tests that the single-pass HTMLParser matches the BeautifulSoup extraction it replaced."""
+from urllib.parse import urljoin
+import pytest
+from bs4 import BeautifulSoup
+from arrs.parsers.html_parser import SEMANTIC_TAGS, HTMLParser
+
+BASE_URL = "https://shop.example.com/products/"
+
+PRODUCT_PAGE = """<!DOCTYPE html>
+<html><head>
+  <title>  Trail Runner <b>X</b> | Shop </title>
+  <meta name="description" content="Lightweight trail shoe">
+  <meta name="description" content="second description is ignored">
+  <meta property="og:title" content="Trail Runner X">
+  <meta property="og:image" content="/img/og.png">
+  <meta name="twitter:card" content="summary">
+  <link rel="stylesheet canonical" href="https://shop.example.com/trail-runner-x">
+  <script type="application/ld+json">{"@type": "Product"}</script>
+  <style>h1 { color: red }</style>
+</head><body>
+  <header><nav><a href="/">Home</a> <a href="../sale">Sale</a> <a>No href</a></nav></header>
+  <main>
+    <article itemscope itemtype="https://schema.org/Product">
+      <h1>Trail <em>Runner</em> X</h1>
+      <p>Grippy   outsole,<br>breathable upper. <!-- hidden comment -->Ships free.</p>
+      <h3>Specs<script>var hidden = 1;</script></h3>
+      <figure><img src="shoe.jpg" alt="Side view" width="600" height="400"><figcaption>Side</figcaption></figure>
+      <img src="//cdn.example.com/top.jpg">
+      <h2>Reviews</h2>
+      <section><p>Great <mark>grip</mark> on <time>2024</time> trails.</p></section>
+      <noscript>Enable JavaScript for reviews</noscript>
+      <template><p>Template text</p></template>
+    </article>
+  </main>
+  <aside><h2>Related</h2><a href="https://other.example.org/x?y=1#z">Elsewhere</a></aside>
+  <footer>&copy; 2024 Shop &amp; Co</footer>
+</body></html>"""
+
+MALFORMED_PAGE = """<html><body><h1>Unclosed <span>heading
+<p>Paragraph <b>bold <i>nested</b> text</i>
+<ul><li>One<li>Two</ul>
+<h2></h2><h4>  </h4><img alt="no src"><a href="">Empty</a>
+<script>document.write('<h2>not a heading</h2>')</script>tail text
+</body></html>"""
+
+PLAIN_PAGE = "Just some text without any markup at all."
+
+
+def baseline_parse(html: str, base_url: str) -> dict:
+    """The BeautifulSoup extraction HTMLParser used before the single-pass rewrite."""
+    soup = BeautifulSoup(html, "lxml")
+    title_tag = soup.find("title")
+    meta = soup.find("meta", attrs={"name": "description"})
+    headings = [
+        {"level": f"h{level}", "text": heading.get_text(strip=True)}
+        for level in range(1, 7)
+        for heading in soup.find_all(f"h{level}")
+    ]
+    images = [
+        {
+            "src": urljoin(base_url, img.get("src", "")),
+            "alt": img.get("alt", ""),
+            "title": img.get("title", ""),
+            "width": img.get("width", ""),
+            "height": img.get("height", "")
+        }
+        for img in soup.find_all("img")
+    ]
+    links = [urljoin(base_url, link["href"]) for link in soup.find_all("a", href=True)]
+    has_structured_data = bool(
+        soup.find("script", type="application/ld+json")
+        or soup.find(attrs={"itemscope": True})
+        or soup.find("meta", property=lambda x: x and x.startswith("og:"))
+    )
+    semantic_elements = {tag: len(soup.find_all(tag)) for tag in SEMANTIC_TAGS}
+
+    metadata = {}
+    for og_tag in soup.find_all("meta", property=lambda x: x and x.startswith("og:")):
+        metadata[f"og_{og_tag.get('property', '').replace('og:', '')}"] = og_tag.get("content", "")
+    for twitter_tag in soup.find_all("meta", attrs={"name": lambda x: x and x.startswith("twitter:")}):
+        metadata[f"twitter_{twitter_tag.get('name', '').replace('twitter:', '')}"] = twitter_tag.get("content", "")
+    canonical = soup.find("link", rel="canonical")
+    if canonical:
+        metadata["canonical_url"] = canonical.get("href", "")
+
+    for element in soup(["script", "style", "noscript"]):
+        element.decompose()
+    text = " ".join(soup.get_text(separator=" ", strip=True).split())
+
+    return {
+        "title": title_tag.get_text(strip=True) if title_tag else "",
+        "meta_description": meta.get("content", "") if meta else "",
+        "headings": headings,
+        "images": images,
+        "links": links,
+        "text_content": text,
+        "word_count": len(text.split()),
+        "has_structured_data": has_structured_data,
+        "semantic_elements": semantic_elements,
+        "metadata": metadata
+    }
+
+
+@pytest.mark.parametrize("html", [PRODUCT_PAGE, MALFORMED_PAGE, PLAIN_PAGE], ids=["product", "malformed", "plain"])
+def test_parse_matches_beautifulsoup(html):
+    assert HTMLParser(html, BASE_URL).parse() == baseline_parse(html, BASE_URL)
+
+
+def test_product_page_fields():
+    parsed = HTMLParser(PRODUCT_PAGE, BASE_URL).parse()
+
+    assert parsed["title"] == "Trail RunnerX| Shop"
+    assert parsed["meta_description"] == "Lightweight trail shoe"
+    assert [heading["text"] for heading in parsed["headings"]] == ["TrailRunnerX", "Reviews", "Related", "Specs"]
+    assert parsed["links"] == [
+        "https://shop.example.com/",
+        "https://shop.example.com/sale",
+        "https://other.example.org/x?y=1#z"
+    ]
+    assert parsed["images"][1]["src"] == "https://cdn.example.com/top.jpg"
+    assert "Enable JavaScript" not in parsed["text_content"]
+    assert "var hidden" not in parsed["text_content"]
+    assert parsed["metadata"]["canonical_url"] == "https://shop.example.com/trail-runner-x"
+    assert parsed["semantic_elements"]["section"] == 1
+
+
+def test_heading_hierarchy():
+    assert HTMLParser(PRODUCT_PAGE, BASE_URL).validate_heading_hierarchy()["valid_hierarchy"]
+
+    validation = HTMLParser("<h1>A</h1><h1>B</h1><h4>C</h4>", BASE_URL).validate_heading_hierarchy()
+    assert validation["multiple_h1"]
+    assert validation["skipped_levels"] == [(1, 4)]
+    assert not validation["valid_hierarchy"]
@@ -0,0 +1,57 @@
+"""Tests for the shared HTTP client's per-host slots."""
+import asyncio
+import pytest
+from arrs.crawlers.http_client import SharedHTTPClient
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_host_slots_are_dropped_when_idle():
+    client = SharedHTTPClient()
+    for number in range(50):
+        async with client.host_slot(f"https://site-{number}.example.com/page"):
+            pass
+
+    assert client._host_slots == {}
+    assert client._host_users == {}
+
+
+async def test_host_slot_limits_concurrency_and_is_shared_while_busy():
+    client = SharedHTTPClient(max_connections_per_host=2)
+    active = 0
+    peak = 0
+
+    async def fetch():
+        nonlocal active, peak
+        async with client.host_slot("https://example.com/page"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(fetch() for _ in range(6)))
+
+    assert peak == 2
+    assert client._host_slots == {}
+
+
+async def test_cancelled_waiter_releases_its_claim():
+    client = SharedHTTPClient(max_connections_per_host=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with client.host_slot("https://example.com"):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    assert client._host_users == {"example.com": 2}
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    release.set()
+    await holder
+
+    assert client._host_slots == {}
@@ -0,0 +1,232 @@
+"""Tests for the durable SQLite job queue."""
+import asyncio
+import time
+import pytest
+from arrs.core.exceptions import JobException
+from arrs.core.jobs import (
+    JOB_COMPLETED, JOB_FAILED, JOB_QUEUED, JOB_RUNNING, AnalysisJob, SQLiteJobQueue
+)
+from arrs.core.orchestrator import AnalysisOrchestrator
+from arrs.models.analysis import AnalysisStatus
+
+pytestmark = pytest.mark.asyncio
+
+
+async def noop_runner(job, report):
+    """Runner for queues whose workers are never started."""
+
+
+def make_job(number: int, host: str = "example.com") -> AnalysisJob:
+    """Job for a distinct analysis."""
+    return AnalysisJob(analysis_id=f"analysis-{number}", url=f"https://{host}/page-{number}")
+
+
+async def test_submit_rejects_when_full(database):
+    queue = SQLiteJobQueue(noop_runner, database, max_size=2)
+    await queue.submit(make_job(1))
+    await queue.submit(make_job(2))
+
+    with pytest.raises(JobException):
+        await queue.submit(make_job(3))
+
+
+async def test_batch_jobs_do_not_fill_queue(database):
+    queue = SQLiteJobQueue(noop_runner, database, max_size=2)
+    await queue.submit_many([make_job(number) for number in range(5)], batch_id="batch-1")
+
+    await queue.submit(make_job(100))
+
+    stats = await queue.stats()
+    assert stats["queued"] == 6
+
+
+async def job_row(database, analysis_id: str):
+    """Current jobs row of an analysis."""
+    return await database.fetch_one("SELECT * FROM jobs WHERE analysis_id = ?", (analysis_id,))
+
+
+async def wait_for_status(database, analysis_id: str, status: str, timeout: float = 5.0):
+    """Poll until a job reaches a status."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        row = await job_row(database, analysis_id)
+        if row["status"] == status:
+            return row
+        assert asyncio.get_running_loop().time() < deadline, f"job stayed {row['status']}"
+        await asyncio.sleep(0.02)
+
+
+async def test_claim_takes_lease(database):
+    queue = SQLiteJobQueue(noop_runner, database, lease_seconds=30)
+    await queue.submit(make_job(1))
+
+    job, attempt = await queue._claim()
+
+    assert job == make_job(1)
+    assert attempt == 1
+    row = await job_row(database, "analysis-1")
+    assert row["status"] == JOB_RUNNING
+    assert row["lease_owner"] == queue.owner
+    assert row["lease_expires_at"] > time.time() + 25
+    # Leased jobs are not claimable by anyone else
+    assert await SQLiteJobQueue(noop_runner, database)._claim() is None
+
+
+async def test_heartbeat_renews_lease_until_done(database):
+    release = asyncio.Event()
+    stages = []
+
+    async def runner(job, report):
+        await report("crawling", 25)
+        stages.append((await job_row(database, job.analysis_id))["stage"])
+        await release.wait()
+
+    queue = SQLiteJobQueue(runner, database, lease_seconds=0.3, heartbeat_seconds=0.05, poll_interval=0.02)
+    await queue.submit(make_job(1))
+    await queue.start()
+    try:
+        first = await wait_for_status(database, "analysis-1", JOB_RUNNING)
+        await asyncio.sleep(0.5)  # longer than the lease: only heartbeats keep it
+        renewed = await job_row(database, "analysis-1")
+        assert renewed["lease_expires_at"] > first["lease_expires_at"]
+        assert renewed["lease_expires_at"] > time.time()
+
+        release.set()
+        done = await wait_for_status(database, "analysis-1", JOB_COMPLETED)
+    finally:
+        await queue.stop()
+
+    assert stages == ["crawling"]
+    assert done["lease_owner"] is None
+    assert done["finished_seq"] == 1
+
+
+async def test_expired_lease_is_reclaimed(database):
+    crashed = SQLiteJobQueue(noop_runner, database, lease_seconds=0.05)
+    survivor = SQLiteJobQueue(noop_runner, database, lease_seconds=30)
+    await crashed.submit(make_job(1))
+    await crashed._claim()
+
+    assert await survivor._claim() is None
+    await asyncio.sleep(0.1)
+
+    job, attempt = await survivor._claim()
+    assert job.analysis_id == "analysis-1"
+    assert attempt == 2
+    assert (await job_row(database, "analysis-1"))["lease_owner"] == survivor.owner
+    # The crashed worker, if it comes back, finds its lease gone
+    assert not await crashed._renew_lease(job)
+
+
+async def test_failed_runner_marks_job_failed(database):
+    async def runner(job, report):
+        raise RuntimeError("engine exploded")
+
+    queue = SQLiteJobQueue(runner, database, poll_interval=0.02)
+    await queue.submit(make_job(1))
+    await queue.start()
+    try:
+        row = await wait_for_status(database, "analysis-1", JOB_FAILED)
+    finally:
+        await queue.stop()
+
+    assert row["error_message"] == "engine exploded"
+
+
+async def test_gives_up_after_max_attempts(database, repository):
+    analysis = await repository.create_analysis("https://example.com/")
+    job = AnalysisJob(analysis_id=analysis.id, url=analysis.url)
+    calls = []
+
+    async def runner(job, report):
+        calls.append(job.analysis_id)
+
+    # Both claims below expire without the job finishing
+    crashed = SQLiteJobQueue(noop_runner, database, lease_seconds=0.01, max_attempts=2)
+    await crashed.submit(job)
+    for _ in range(2):
+        await crashed._claim()
+        await asyncio.sleep(0.03)
+
+    queue = SQLiteJobQueue(runner, database, poll_interval=0.02, max_attempts=2)
+    await queue.start()
+    try:
+        row = await wait_for_status(database, analysis.id, JOB_FAILED)
+    finally:
+        await queue.stop()
+
+    assert calls == []
+    assert row["attempts"] == 3
+    assert "abandoned after 2 interrupted attempts" in row["error_message"]
+    failed = await repository.get_analysis(analysis.id)
+    assert failed.status == AnalysisStatus.FAILED
+
+
+async def test_stop_releases_running_job(database):
+    started = asyncio.Event()
+
+    async def runner(job, report):
+        started.set()
+        await asyncio.sleep(60)
+
+    queue = SQLiteJobQueue(runner, database, poll_interval=0.02)
+    await queue.submit(make_job(1))
+    await queue.start()
+    await asyncio.wait_for(started.wait(), timeout=5)
+    await queue.stop()
+
+    row = await job_row(database, "analysis-1")
+    assert row["status"] == JOB_QUEUED
+    assert row["attempts"] == 0
+    assert row["lease_owner"] is None
+
+
+async def test_run_stage_resumes_from_checkpoint(repository):
+    orchestrator = AnalysisOrchestrator(repository)
+    calls = []
+
+    async def produce():
+        calls.append("run")
+        return {"score": 42}
+
+    first = await orchestrator._run_stage("analysis-1", "score", {}, produce)
+    checkpoints = await repository.load_checkpoints("analysis-1")
+    resumed = await orchestrator._run_stage("analysis-1", "score", checkpoints, produce)
+
+    assert first == resumed == {"score": 42}
+    assert calls == ["run"]
+    # Without checkpointing the stage always runs and nothing is stored
+    await orchestrator._run_stage("analysis-2", "score", None, produce)
+    assert calls == ["run", "run"]
+    assert await repository.load_checkpoints("analysis-2") == {}
+
+
+async def test_worker_survives_bookkeeping_errors(database, monkeypatch):
+    ran = []
+
+    async def runner(job, report):
+        ran.append(job.analysis_id)
+
+    queue = SQLiteJobQueue(runner, database, workers=1, poll_interval=0.02)
+    finish = queue._finish
+    failures = []
+
+    async def flaky_finish(job, status, error_message=None):
+        if not failures:
+            failures.append(job.analysis_id)
+            raise RuntimeError("database is locked")
+        await finish(job, status, error_message)
+
+    monkeypatch.setattr(queue, "_finish", flaky_finish)
+    await queue.submit(make_job(1))
+    await queue.submit(make_job(2))
+    await queue.start()
+    try:
+        await wait_for_status(database, "analysis-2", JOB_COMPLETED)
+    finally:
+        await queue.stop()
+
+    assert ran == ["analysis-1", "analysis-2"]
+    assert failures == ["analysis-1"]
+    # Left running under its lease, to be reclaimed once it expires
+    assert (await job_row(database, "analysis-1"))["status"] == JOB_RUNNING
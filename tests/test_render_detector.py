@@ -0,0 +1,74 @@
+"""Tests for the post-fetch render detector."""
+from arrs.crawlers.render_detector import detect_render_need, looks_like_app_url
+
+ARTICLE = "<p>" + "Plain server-rendered product copy with real sentences. " * 20 + "</p>"
+
+
+def page(body: str, head: str = "") -> str:
+    """Minimal HTML document."""
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+def test_static_page_is_not_rendered():
+    decision = detect_render_need(page(ARTICLE))
+
+    assert not decision.needs_render
+    assert decision.reason == "static_content"
+
+
+def test_empty_body_needs_render():
+    decision = detect_render_need(page("<script>var x = 1;</script>"))
+
+    assert decision.needs_render
+    assert decision.reason == "no_body_text"
+
+
+def test_app_shell_needs_render():
+    shell = page(
+        '<div id="root"></div><p>Loading your dashboard, please wait a moment while we get things ready.</p>',
+        head='<script src="/static/js/main.3f9a2c1b.js"></script>'
+    )
+    decision = detect_render_need(shell)
+
+    assert decision.needs_render
+    assert decision.reason == "app_shell"
+    assert {"empty_mount_point", "hashed_bundle"} <= set(decision.signals)
+
+
+def test_server_rendered_app_with_content_is_kept():
+    html = page('<div id="__next">' + ARTICLE + "</div>", head='<script id="__NEXT_DATA__"></script>')
+    decision = detect_render_need(html)
+
+    assert "react" in decision.signals
+    assert not decision.needs_render
+
+
+def test_render_prior_renders_sparse_pages():
+    sparse = page("<p>" + "Short teaser text. " * 5 + "</p>")
+
+    assert not detect_render_need(sparse).needs_render
+    decision = detect_render_need(sparse, render_prior=True)
+    assert decision.needs_render
+    assert decision.reason == "sparse_text_on_rendered_domain"
+
+
+def test_invisible_markup_is_not_counted_as_text():
+    hidden = page("<style>" + "body { color: red; } " * 50 + "</style><!-- " + "comment " * 50 + "-->")
+
+    assert detect_render_need(hidden).text_length == 0
+
+
+def test_looks_like_app_url():
+    assert looks_like_app_url("https://app.example.com/login")
+    assert looks_like_app_url("https://Account.Example.com")
+    assert not looks_like_app_url("https://www.example.com/products")
+    assert looks_like_app_url("https://www.my.example.com")
+    assert looks_like_app_url("app.example.com/dashboard")
+
+
+def test_looks_like_app_url_ignores_lookalikes():
+    assert not looks_like_app_url("https://www.academy.com")
+    assert not looks_like_app_url("https://www.whatsapp.com/download")
+    assert not looks_like_app_url("https://revue.co")
+    assert not looks_like_app_url("https://example.com/reactor-pump")
+    assert not looks_like_app_url("https://app.io")
@@ -0,0 +1,104 @@
+"""Tests for reusing engine results of unchanged page content."""
+from datetime import datetime, timedelta
+import pytest
+from arrs.core.orchestrator import AnalysisOrchestrator
+from arrs.models.analysis import AnalysisStatus
+from arrs.models.crawled_content import CrawledContent
+from arrs.models.score_result import EngineScore, Gap
+
+pytestmark = pytest.mark.asyncio
+
+URL = "https://example.com/product"
+HTML = "<html><body><h1>Product</h1></body></html>"
+
+
+def crawled(analysis_id: str) -> CrawledContent:
+    return CrawledContent(
+        id=f"crawl-{analysis_id}",
+        analysis_id=analysis_id,
+        url=URL,
+        html_content=HTML,
+        crawled_at=datetime.now(),
+        crawl_method="beautifulsoup",
+        status_code=200
+    )
+
+
+async def store_analysis(repository, orchestrator, calculated_at=None, versions=None, reused_from=None) -> str:
+    """Commit a completed analysis of HTML with a score from every engine."""
+    unit_of_work = repository.begin_analysis(URL)
+    analysis_id = unit_of_work.analysis.id
+    unit_of_work.add_crawled_content(crawled(analysis_id))
+    unit_of_work.add_engine_scores([
+        EngineScore(
+            id=f"{analysis_id}-{name}",
+            analysis_id=analysis_id,
+            engine_name=name,
+            score=50.0,
+            weight=engine.weight,
+            calculated_at=calculated_at or datetime.now(),
+            scoring_version=(versions or {}).get(name, engine.version),
+            reused_from=reused_from
+        )
+        for name, engine in orchestrator.engines.items()
+    ])
+    unit_of_work.add_gaps([Gap(
+        id=f"{analysis_id}-gap",
+        analysis_id=analysis_id,
+        gap_type="missing_price",
+        severity="high",
+        description="No price",
+        recommendation="Add a price",
+        engine_source="TRE",
+        reused_from=reused_from
+    )])
+    unit_of_work.set_status(AnalysisStatus.COMPLETED)
+    await unit_of_work.commit()
+    return analysis_id
+
+
+@pytest.fixture
+def orchestrator(repository):
+    return AnalysisOrchestrator(repository)
+
+
+async def test_reuses_current_results_and_marks_copies(repository, orchestrator):
+    source_id = await store_analysis(repository, orchestrator)
+
+    source, scores, gaps = await orchestrator._find_reusable_results(crawled("new-analysis"))
+
+    assert source == source_id
+    assert {score.engine_name for score in scores} == set(orchestrator.engines)
+    assert all(score.analysis_id == "new-analysis" and score.reused_from == source_id for score in scores)
+    assert [gap.reused_from for gap in gaps] == [source_id]
+
+
+async def test_copies_point_at_the_computing_analysis(repository, orchestrator):
+    await store_analysis(repository, orchestrator, reused_from="original-analysis")
+
+    _, scores, gaps = await orchestrator._find_reusable_results(crawled("new-analysis"))
+
+    assert {score.reused_from for score in scores} == {"original-analysis"}
+    assert gaps[0].reused_from == "original-analysis"
+
+
+async def test_other_engine_version_is_recomputed(repository, orchestrator):
+    await store_analysis(repository, orchestrator, versions={"ADE": orchestrator.engines["ADE"].version + 1})
+
+    assert await orchestrator._find_reusable_results(crawled("new-analysis")) is None
+
+
+async def test_old_results_are_recomputed(repository, orchestrator, monkeypatch):
+    monkeypatch.setattr("config.settings.crawl_reuse_max_age_hours", 24)
+    await store_analysis(repository, orchestrator, calculated_at=datetime.now() - timedelta(hours=25))
+
+    assert await orchestrator._find_reusable_results(crawled("new-analysis")) is None
+
+
+async def test_reused_rows_round_trip(repository, orchestrator):
+    source_id = await store_analysis(repository, orchestrator, reused_from="original-analysis")
+
+    scores = await repository.get_engine_scores(source_id)
+
+    assert {score.reused_from for score in scores} == {"original-analysis"}
+    assert {score.scoring_version for score in scores} == {engine.version for engine in orchestrator.engines.values()}
@@ -0,0 +1,113 @@
+"""Tests for the append-only segment store."""
+import multiprocessing
+from arrs.storage.segment_store import INDEX_FILE, SegmentStore
+
+
+def write_values(root: str, writer: int, count: int):
+    """Append count values from a separate process."""
+    store = SegmentStore(root, max_segment_bytes=4096)
+    for number in range(count):
+        store.put(f"{writer}/{number}", f"writer {writer} value {number} ".encode() * 10)
+
+
+def test_put_get_and_overwrite(tmp_path):
+    store = SegmentStore(tmp_path)
+    store.put("a/report.json", b"first")
+    store.put("a/report.json", b"second")
+
+    assert store.get("a/report.json") == b"second"
+    assert store.get("missing") is None
+
+
+def test_rolls_over_to_new_segment(tmp_path):
+    store = SegmentStore(tmp_path, max_segment_bytes=10)
+    for number in range(3):
+        store.put(f"key-{number}", b"x" * 8)
+
+    assert store.stats() == {"keys": 3, "segments": 3}
+    assert all(store.get(f"key-{number}") == b"x" * 8 for number in range(3))
+
+
+def test_delete_prefix(tmp_path):
+    store = SegmentStore(tmp_path)
+    store.put("a/one", b"1")
+    store.put("a/two", b"2")
+    store.put("b/one", b"3")
+
+    assert store.delete_prefix("a/") == 2
+    assert store.get("a/one") is None
+    assert SegmentStore(tmp_path).get("b/one") == b"3"
+
+
+def test_sees_writes_of_other_instances(tmp_path):
+    reader = SegmentStore(tmp_path)
+    writer = SegmentStore(tmp_path)
+    writer.put("early", b"1")
+    assert reader.get("early") == b"1"
+
+    # Appended after the reader loaded the index
+    writer.put("late", b"2")
+    writer.delete_prefix("early")
+
+    assert reader.get("late") == b"2"
+    assert reader.get("early") is None
+
+
+def test_ignores_torn_index_line(tmp_path):
+    store = SegmentStore(tmp_path)
+    store.put("complete", b"data")
+    with open(tmp_path / INDEX_FILE, "ab") as f:
+        f.write(b'{"k":"torn","s":1,')
+
+    reopened = SegmentStore(tmp_path)
+    assert reopened.get("complete") == b"data"
+    assert reopened.get("torn") is None
+
+
+def test_concurrent_writer_processes(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    writers = [context.Process(target=write_values, args=(str(tmp_path), writer, 300)) for writer in range(3)]
+    for process in writers:
+        process.start()
+    for process in writers:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    store = SegmentStore(tmp_path)
+    for writer in range(3):
+        for number in range(300):
+            assert store.get(f"{writer}/{number}") == f"writer {writer} value {number} ".encode() * 10
+
+
+def test_compact_drops_overwritten_and_deleted_values(tmp_path):
+    store = SegmentStore(tmp_path, max_segment_bytes=64)
+    for number in range(10):
+        store.put(f"a/{number}", b"old" * 10)
+        store.put(f"a/{number}", f"new {number}".encode())
+    store.put("b/gone", b"x" * 30)
+    store.delete_prefix("b/")
+
+    stats = store.compact()
+
+    assert stats["keys"] == 10
+    assert stats["bytes_after"] == sum(len(f"new {number}") for number in range(10))
+    assert stats["bytes_after"] < stats["bytes_before"]
+    assert all(store.get(f"a/{number}") == f"new {number}".encode() for number in range(10))
+    assert store.get("b/gone") is None
+    assert len((tmp_path / INDEX_FILE).read_text().splitlines()) == 10
+
+
+def test_other_instances_follow_compaction(tmp_path):
+    reader = SegmentStore(tmp_path)
+    writer = SegmentStore(tmp_path)
+    writer.put("kept", b"1")
+    writer.put("kept", b"2")
+    assert reader.get("kept") == b"2"
+
+    SegmentStore(tmp_path).compact()
+
+    # Cached locations point into deleted segments
+    assert reader.get("kept") == b"2"
+    writer.put("after", b"3")
+    assert reader.get("after") == b"3"
+    assert SegmentStore(tmp_path).stats() == {"keys": 2, "segments": 1}
@@ -0,0 +1,90 @@
+"""Tests for group commits of units of work."""
+import asyncio
+import pytest
+from arrs.core.exceptions import StorageException
+from arrs.storage.unit_of_work import GroupCommitter
+
+pytestmark = pytest.mark.asyncio
+
+INSERT_SQL = "INSERT INTO batches (id, status, total, created_at, updated_at) VALUES (?, 'running', 1, 0, 0)"
+
+
+def unit(batch_id: str) -> list:
+    """Statements of a one-row unit of work."""
+    return [(INSERT_SQL, [(batch_id,)])]
+
+
+async def stored_ids(database) -> set:
+    return {row["id"] for row in await database.fetch_all("SELECT id FROM batches")}
+
+
+def slow_commits(database, monkeypatch, started: asyncio.Event, release: asyncio.Event):
+    """Make execute_batch wait for release after signalling started."""
+    execute_batch = database.execute_batch
+
+    async def slow_execute_batch(statements):
+        started.set()
+        await release.wait()
+        await execute_batch(statements)
+
+    monkeypatch.setattr(database, "execute_batch", slow_execute_batch)
+
+
+async def test_full_batch_commits_in_one_transaction(database):
+    committer = GroupCommitter(database, max_batch=2, max_delay=10)
+
+    await asyncio.wait_for(asyncio.gather(committer.submit(unit("a")), committer.submit(unit("b"))), timeout=5)
+
+    assert await stored_ids(database) == {"a", "b"}
+
+
+async def test_delay_flushes_partial_batch(database):
+    committer = GroupCommitter(database, max_batch=10, max_delay=0.01)
+
+    await asyncio.wait_for(committer.submit(unit("a")), timeout=5)
+
+    assert await stored_ids(database) == {"a"}
+
+
+async def test_failing_unit_is_isolated(database):
+    committer = GroupCommitter(database, max_batch=2, max_delay=10)
+    broken = [("INSERT INTO no_such_table VALUES (?)", [(1,)])]
+
+    results = await asyncio.gather(committer.submit(unit("a")), committer.submit(broken), return_exceptions=True)
+
+    assert results[0] is None
+    assert isinstance(results[1], Exception)
+    assert await stored_ids(database) == {"a"}
+
+
+async def test_cancelled_submitter_does_not_strand_batch(database, monkeypatch):
+    started, release = asyncio.Event(), asyncio.Event()
+    slow_commits(database, monkeypatch, started, release)
+    committer = GroupCommitter(database, max_batch=2, max_delay=10)
+
+    first = asyncio.create_task(committer.submit(unit("a")))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(committer.submit(unit("b")))
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    # The submitter that filled the batch is cancelled mid-commit
+    second.cancel()
+    release.set()
+
+    await asyncio.wait_for(first, timeout=5)
+    assert second.cancelled()
+    assert await stored_ids(database) == {"a", "b"}
+
+
+async def test_cancelled_flush_fails_waiters(database, monkeypatch):
+    started, release = asyncio.Event(), asyncio.Event()
+    slow_commits(database, monkeypatch, started, release)
+    committer = GroupCommitter(database, max_batch=2, max_delay=10)
+
+    submitters = [asyncio.create_task(committer.submit(unit(name))) for name in "ab"]
+    await asyncio.wait_for(started.wait(), timeout=5)
+    for flush in list(committer._flushes):
+        flush.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*submitters, return_exceptions=True), timeout=5)
+    assert all(isinstance(result, StorageException) for result in results)